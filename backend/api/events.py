@@ -0,0 +1,62 @@
+import asyncio
+import json
+from collections import deque
+from typing import List, Optional, Tuple
+
+# Events kept per game for clients that reconnect with Last-Event-ID
+EVENT_HISTORY = 512
+# Seconds between keep-alive comments on an idle stream
+KEEPALIVE_INTERVAL = 15
+
+
+class EventChannel:
+    """
+    A game's table events, numbered from 1 in the order they happened.
+    The last EVENT_HISTORY are kept so a client can resume after the last
+    sequence number it saw; subscribers wait on wait() for new ones.
+    """
+
+    def __init__(self, history: int = EVENT_HISTORY):
+        self.events = deque(maxlen=history)  # (seq, kind, data)
+        self.last_seq = 0
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def publish(self, kind: str, data: dict):
+        self.last_seq += 1
+        self.events.append((self.last_seq, kind, data))
+        self._wake()
+
+    def close(self):
+        """Ends every subscriber's stream once it has sent what is buffered"""
+        self.closed = True
+        self._wake()
+
+    def _wake(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def since(self, seq: int) -> Tuple[List[tuple], bool]:
+        """
+        Events after `seq`, and whether some of them have already been
+        dropped from the history (the client then needs the full state).
+        """
+        if seq >= self.last_seq:
+            return [], False
+        missed = bool(self.events) and self.events[0][0] > seq + 1
+        return [event for event in self.events if event[0] > seq], missed
+
+    async def wait(self, seq: int, timeout: Optional[float] = None) -> bool:
+        """Waits until there are events after `seq` or the channel closes; False on timeout"""
+        if self.last_seq > seq or self.closed:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+def format_event(seq: int, kind: str, data: dict, default=None) -> str:
+    """One Server-Sent Events message; the id is what the browser sends back as Last-Event-ID"""
+    return f"id: {seq}\nevent: {kind}\ndata: {json.dumps(data, default=default)}\n\n"
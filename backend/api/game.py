@@ -1,10 +1,18 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from uuid import uuid4
+import asyncio
+import json
 import logging
-from game import TexasHoldem, Action, GameStage, HandEvaluator
+from game import TexasHoldem, Action, GameStage, Status
+from game.range_equity import RangeEquityCalculator
+from game.ranges import EMPTY_RANGE, FULL_RANGE
 from bots import OptimizedPokerBot, AIPokerCoach
+from bots.optimized_bot import BOT_PERSONALITIES
+from api.events import EventChannel, KEEPALIVE_INTERVAL, format_event
 from enum import Enum
 import time
 
@@ -13,25 +21,171 @@ router = APIRouter()
 
 # dictionary of gameIDs to game objects
 active_games = {}
+# game_id to the channel its table events are published on
+event_channels: Dict[str, EventChannel] = {}
+# Held while a command changes a game, so a bot waiting on the model can't be overtaken
+game_locks: Dict[str, asyncio.Lock] = {}
+
+# Upper bound on bot turns played by one auto-advance request
+MAX_AUTO_ACTIONS = 100
+
+# Shared by coach requests; a 1% error bound keeps each estimate well under 100ms
+range_equity = RangeEquityCalculator(max_error=0.01, max_samples=50000)
 
 # example base model
 class CreateGameRequest(BaseModel):
     player_names: List[str]
     bot_ids: List[Optional[str]] = [None, "Bot1", "Bot2", "Bot3", "Bot4", "Bot5"]
+    seed: Optional[int] = None  # fixes every deal at the table, e.g. for A/B runs
+    decision_deadline: Optional[float] = None  # seconds a bot waits for the model; BOT_DECISION_DEADLINE by default
 
 
 class PlayerActionRequest(BaseModel):
     game_id: str
     action: str
     amount: Optional[int] = None
+    known_version: Optional[int] = None  # state_version the client holds; the reply is then a patch from it
 
 class StartHandRequest(BaseModel):
     game_id: str
+    known_version: Optional[int] = None
 
 class CoachQuestionRequest(BaseModel):
     game_id: str
     question: str
 
+def opponent_range(game: TexasHoldem, player_idx: int):
+    """Bots play their chart's raise and call ranges; anyone else could hold any two cards"""
+    controller = game.player_controllers[player_idx] if game.player_controllers else None
+    ranges = getattr(controller, "preflop_ranges", None) or {}
+    playing = EMPTY_RANGE
+    for action, hand_range in ranges.items():
+        if action != "fold" and hand_range is not None:
+            playing = playing.union(hand_range)
+    return playing if len(playing) else FULL_RANGE
+
+
+def human_seat(game: TexasHoldem) -> Optional[int]:
+    """The seat no controller plays (the app's user), or None once they have left the table"""
+    controllers = game.player_controllers or [None] * len(game.players)
+    return next((i for i, controller in enumerate(controllers) if controller is None), None)
+
+
+def hero_equity(hands: list, board: list) -> Optional[float]:
+    """The first hand's equity against the ranges after it"""
+    try:
+        result = range_equity.calculate(hands, board=board)
+    except ValueError:
+        # The board and hero's cards can block a narrow range out entirely
+        return None
+    return result["players"][0]["equity"]
+
+
+async def estimate_hero_equity(game: TexasHoldem) -> Optional[float]:
+    """
+    The human player's equity against the ranges of everyone still in the
+    hand, whoever is to act (a bot's own cards must never reach the coach).
+    The estimate runs on a worker thread so it doesn't hold up the event loop.
+    """
+    hero_idx = human_seat(game)
+    if hero_idx is None:
+        return None
+    hero = game.players[hero_idx]
+    if not hero.pocket or hero.is_active == Status.FOLDED:
+        return None
+
+    opponents = [opponent_range(game, i) for i, player in enumerate(game.players)
+                 if i != hero_idx and player.is_active != Status.FOLDED]
+    if not opponents:
+        return None
+
+    # Copies, as the table can move on while the estimate runs
+    return await run_in_threadpool(hero_equity, [list(hero.pocket)] + opponents, list(game.community_cards))
+
+
+def player_json(player) -> dict:
+    """A Player's fields as plain JSON (cards are slotted and can't be encoded directly)"""
+    return {
+        "name": player.name,
+        "chips": player.chips,
+        "pocket": [{"value": card.value, "suit": card.suit.value, "code": card.code} for card in player.pocket or []],
+        "hand": [{"value": card.value, "suit": card.suit.value, "code": card.code} for card in player.hand],
+        "is_active": player.is_active.value,
+        "preflop": player.preflop,
+        "is_bot": player.is_bot
+    }
+
+
+def _json_default(value):
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def state_response(payload: dict) -> Response:
+    """
+    Sends a payload carrying game state with json.dumps directly. The state
+    views are already JSON-ready (read-only dicts and tuples), so FastAPI's
+    field-by-field encoder would only copy them again.
+    """
+    return Response(json.dumps(payload, default=_json_default), media_type="application/json")
+
+
+def complete_hand(game: TexasHoldem, all_in_equity: Optional[dict] = None,
+                  known_version: Optional[int] = None) -> dict:
+    """Pays out every pot and builds the hand_complete response"""
+    result = game.resolve_showdown()
+    return {
+        "status": "hand_complete",
+        **game.get_state_patch(known_version),
+        "winner": player_json(game.players[result["biggest_winner"]]),
+        "all_in_equity": all_in_equity,
+        "player_diff": game.players[0].chips - game.players[0].preflop
+    }
+
+async def advance_hand(game: TexasHoldem, betting_complete: bool, known_version: Optional[int] = None) -> Optional[dict]:
+    """
+    Moves the hand along after an action: ends it if one player is left,
+    deals the next street when betting is complete, or runs out the board
+    when everyone is all-in. Returns the hand_complete response if the
+    hand ended, otherwise None.
+    """
+    non_folded_players = game.get_non_folded_players()
+    if len(non_folded_players) == 1:
+        # Single player remaining - award pots
+        return complete_hand(game, known_version=known_version)
+
+    # Check if all remaining players are all-in
+    all_players_all_in = not game.table.live_mask & ~game.table.all_in_mask
+
+    if all_players_all_in:
+        # Each player's equity before the board is run out (exact on the flop and turn). Preflop
+        # it is sampled for up to a quarter second, so it runs on a worker thread; the game's
+        # lock keeps the table still meanwhile
+        all_in_equity = await run_in_threadpool(game.get_all_in_equity)
+        if game.current_stage != GameStage.RIVER:
+            game.reset_street_bets()
+        while game.current_stage != GameStage.RIVER:
+            deal_next_street(game)
+        return complete_hand(game, all_in_equity, known_version)
+
+    if betting_complete:
+        if game.current_stage == GameStage.RIVER:
+            # Showdown required - evaluate hands and distribute pots
+            return complete_hand(game, known_version=known_version)
+        deal_next_street(game)
+        game.reset_street_bets()
+
+    return None
+
+def deal_next_street(game: TexasHoldem):
+    if game.current_stage == GameStage.PREFLOP:
+        game.deal_flop()
+    elif game.current_stage == GameStage.FLOP:
+        game.deal_turn()
+    elif game.current_stage == GameStage.TURN:
+        game.deal_river()
+
 @router.post("/games/start-hand")
 async def start_hand(request: StartHandRequest):
     """
@@ -44,17 +198,18 @@ async def start_hand(request: StartHandRequest):
         
     game = active_games[game_id]
     
-    try:
-        game.start_new_hand()
+    async with game_locks[game_id]:
+        try:
+            game.start_new_hand()
         
-        return {
-            "status": "success",
-            "game_state": game.get_game_state_json()
-        }
+            return state_response({
+                "status": "success",
+                **game.get_state_patch(request.known_version)
+            })
         
-    except Exception as e:
-        logger.error(f"Error starting hand: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to start hand")
+        except Exception as e:
+            logger.error(f"Error starting hand: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to start hand")
 
 @router.post("/games/player-action")
 async def process_player_action(request: PlayerActionRequest):
@@ -65,173 +220,61 @@ async def process_player_action(request: PlayerActionRequest):
         
     game = active_games[game_id]
     
-    try:
-        # Validate action
-        action = Action(request.action)
-        if action not in game.get_available_actions():
-            raise HTTPException(status_code=400, detail="Invalid action")
-            
-        # Process the action
-        betting_complete = game.process_action(action, request.amount)
-        
-        # Check if hand is over
-        non_folded_players = game.get_non_folded_players()
-        if len(non_folded_players) == 1:
-            # Single player remaining - award pots
-            winner = non_folded_players[0]
-            for pot in game.pots:
-                winner.chips += pot.amount
-                pot.amount = 0
-            return {
-                "status": "hand_complete",
-                "game_state": game.get_game_state_json(),
-                "winner": winner,
-                "player_diff": game.players[0].chips - game.players[0].preflop
-            }
-            
-        # Check if all remaining players are all-in
-        active_players = game.get_non_folded_players()
-        non_allin_players = [p for p in active_players if game.players.index(p) not in game.all_in_players]
-        all_players_all_in = len(non_allin_players) == 0
+    async with game_locks[game_id]:
+        try:
+            # Validate action
+            action = Action(request.action)
+            if action not in game.get_available_actions():
+                raise HTTPException(status_code=400, detail="Invalid action")
             
-        # If betting round is complete or all players are all-in, advance game stage
-        if betting_complete or all_players_all_in:
-            # Determine how far to advance based on current stage
-            if game.current_stage == GameStage.PREFLOP:
-                game.deal_flop()
-                game.reset_street_bets()
-                
-                # If all players are all-in, run out the rest of the board
-                if all_players_all_in:
-                    game.deal_turn()
-                    game.deal_river()
-                    game.current_stage = GameStage.SHOWDOWN
-                    
-                    # Calculate winners and distribute pots
-                    big_winner = None
-                    max_win = 0
-                    
-                    for pot in game.pots:
-                        eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                         for p in game.players]
-                        winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                        for player_idx, share in winner_shares.items():
-                            winner = game.players[player_idx]
-                            amount = int(pot.amount * share)
-                            if amount > max_win:
-                                big_winner = winner
-                                max_win = amount
-                            winner.chips += amount
-                        pot.amount = 0
-                        
-                    return {
-                        "status": "hand_complete",
-                        "game_state": game.get_game_state_json(),
-                        "winner": big_winner,
-                        "player_diff": game.players[0].chips - game.players[0].preflop
-                    }
-                    
-            elif game.current_stage == GameStage.FLOP:
-                game.deal_turn() 
-                game.reset_street_bets()
-                
-                # If all players are all-in, run out the river
-                if all_players_all_in:
-                    game.deal_river()
-                    game.current_stage = GameStage.SHOWDOWN
-                    
-                    # Calculate winners and distribute pots
-                    big_winner = None
-                    max_win = 0
-                    
-                    for pot in game.pots:
-                        eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                         for p in game.players]
-                        winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                        for player_idx, share in winner_shares.items():
-                            winner = game.players[player_idx]
-                            amount = int(pot.amount * share)
-                            if amount > max_win:
-                                big_winner = winner
-                                max_win = amount
-                            winner.chips += amount
-                        pot.amount = 0
-                        
-                    return {
-                        "status": "hand_complete",
-                        "game_state": game.get_game_state_json(),
-                        "winner": big_winner,
-                        "player_diff": game.players[0].chips - game.players[0].preflop
-                    }
-                    
-            elif game.current_stage == GameStage.TURN:
-                game.deal_river()
-                game.reset_street_bets()
-                
-                # If all players are all-in, go to showdown
-                if all_players_all_in:
-                    game.current_stage = GameStage.SHOWDOWN
-                    
-                    # Calculate winners and distribute pots
-                    big_winner = None
-                    max_win = 0
-                    
-                    for pot in game.pots:
-                        eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                         for p in game.players]
-                        winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                        for player_idx, share in winner_shares.items():
-                            winner = game.players[player_idx]
-                            amount = int(pot.amount * share)
-                            if amount > max_win:
-                                big_winner = winner
-                                max_win = amount
-                            winner.chips += amount
-                        pot.amount = 0
-                        
-                    return {
-                        "status": "hand_complete",
-                        "game_state": game.get_game_state_json(),
-                        "winner": big_winner,
-                        "player_diff": game.players[0].chips - game.players[0].preflop
-                    }
-                    
-            elif game.current_stage == GameStage.RIVER:
-                # Showdown required - evaluate hands and distribute pots
-                game.current_stage = GameStage.SHOWDOWN
-                big_winner = None
-                max_win = 0
-                
-                for pot in game.pots:
-                    eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                     for p in game.players]
-                    winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                    for player_idx, share in winner_shares.items():
-                        winner = game.players[player_idx]
-                        amount = int(pot.amount * share)
-                        if amount > max_win:
-                            big_winner = winner
-                            max_win = amount
-                        winner.chips += amount
-                    pot.amount = 0
-                    
-                return {
-                    "status": "hand_complete",
-                    "game_state": game.get_game_state_json(),
-                    "winner": big_winner,
-                    "player_diff": game.players[0].chips - game.players[0].preflop
-                }
+            # Process the action
+            betting_complete = game.process_action(action, request.amount)
+
+            hand_result = await advance_hand(game, betting_complete, request.known_version)
+            if hand_result is not None:
+                return state_response(hand_result)
                 
-        return {
-            "status": "success",
-            "game_state": game.get_game_state_json()
-        }
+            return state_response({
+                "status": "success",
+                **game.get_state_patch(request.known_version)
+            })
         
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error processing player action: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to process player action")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error processing player action: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to process player action")
+
+async def request_decision(controller, game_state: dict, game_min_raise: int) -> dict:
+    """Bots that wait on a model decide asynchronously (get_decision_async); local ones answer directly"""
+    decide = getattr(controller, "get_decision_async", None)
+    if decide is not None:
+        return await decide(game_state, game_min_raise)
+    return controller.get_decision(game_state, game_min_raise)
+
+async def play_bot_turn(game: TexasHoldem, known_version: Optional[int] = None) -> Tuple[dict, Optional[dict]]:
+    """
+    Asks the bot to act for its decision and applies it (invalid actions
+    fold). Returns the action as a stream entry and, if the hand ended,
+    the hand_complete response.
+    """
+    current_player_idx = game.current_player_idx
+    bot_controller = game.player_controllers[current_player_idx]
+    if bot_controller is None:
+        raise HTTPException(status_code=400, detail="Current player is not a bot")
+
+    decision = await request_decision(bot_controller, game.get_bot_state_json(), game.get_min_raise())
+    action, amount, betting_complete = game.apply_decision(decision)
+    entry = {
+        "player_idx": current_player_idx,
+        "action": action,
+        "amount": amount,
+        "table_comment": decision.get("table_comment", "")
+    }
+    return entry, await advance_hand(game, betting_complete, known_version)
+
+def hand_in_progress(game: TexasHoldem) -> bool:
+    return game.current_stage != GameStage.SHOWDOWN and len(game.get_non_folded_players()) > 1
 
 @router.post("/games/bot-action")
 async def process_bot_action(request: StartHandRequest):
@@ -242,203 +285,67 @@ async def process_bot_action(request: StartHandRequest):
         
     game = active_games[game_id]
     
-    try:
-        # Verify current player is a bot
-        current_player_idx = game.current_player_idx
-        bot_controller = game.player_controllers[current_player_idx]
-        
-        if bot_controller is None:
-            raise HTTPException(
-                status_code=400, 
-                detail="Current player is not a bot"
-            )
-        
-        # Get bot's decision
-        game_state = game.get_bot_state_json()
-        decision = bot_controller.get_decision(game_state, game.get_min_raise())
-    
-        # Parse and validate bot action
-        action_str = decision.get("action", "fold")
-        amount = decision.get("amount", 0)
-        table_comment = decision.get("table_comment", "")
-        
+    async with game_locks[game_id]:
         try:
-            action = Action(action_str)
-        except ValueError:
-            action = Action.FOLD
-            amount = 0
-            
-        if action not in game.get_available_actions():
-            action = Action.FOLD
-            amount = 0
-                  
-        # Process the action
-        betting_complete = game.process_action(action, amount)
-        
-        # Check if hand is over
-        non_folded_players = game.get_non_folded_players()
-        if len(non_folded_players) == 1:
-            # Single player remaining - award pots
-            winner = non_folded_players[0]
-            for pot in game.pots:
-                winner.chips += pot.amount
-                pot.amount = 0
-            return {
-                "status": "hand_complete",
-                "game_state": game.get_game_state_json(),
-                "winner": winner,
-                "player_diff": game.players[0].chips - game.players[0].preflop,
-                "action": action
-            }
-
-        # Check if all remaining players are all-in
-        active_players = game.get_non_folded_players()
-        non_allin_players = [p for p in active_players if game.players.index(p) not in game.all_in_players]
-        all_players_all_in = len(non_allin_players) == 0
-            
-        # If betting round is complete or all players are all-in, advance game stage
-        if betting_complete or all_players_all_in:
-            # Determine how far to advance based on current stage
-            if game.current_stage == GameStage.PREFLOP:
-                game.deal_flop()
-                game.reset_street_bets()
-                
-                # If all players are all-in, run out the rest of the board
-                if all_players_all_in:
-                    game.deal_turn()
-                    game.deal_river()
-                    game.current_stage = GameStage.SHOWDOWN
-                    
-                    # Calculate winners and distribute pots
-                    big_winner = None
-                    max_win = 0
-                    
-                    for pot in game.pots:
-                        eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                         for p in game.players]
-                        winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                        for player_idx, share in winner_shares.items():
-                            winner = game.players[player_idx]
-                            amount = int(pot.amount * share)
-                            if amount > max_win:
-                                big_winner = winner
-                                max_win = amount
-                            winner.chips += amount
-                        pot.amount = 0
-                        
-                    return {
-                        "status": "hand_complete",
-                        "game_state": game.get_game_state_json(),
-                        "winner": big_winner,
-                        "player_diff": game.players[0].chips - game.players[0].preflop,
-                        "action": action
-                    }
-                    
-            elif game.current_stage == GameStage.FLOP:
-                game.deal_turn()
-                game.reset_street_bets()
+            entry, hand_result = await play_bot_turn(game, request.known_version)
+            if hand_result is not None:
+                hand_result["action"] = entry["action"]
+                return state_response(hand_result)
                 
-                # If all players are all-in, run out the river
-                if all_players_all_in:
-                    game.deal_river()
-                    game.current_stage = GameStage.SHOWDOWN
-                    
-                    # Calculate winners and distribute pots
-                    big_winner = None
-                    max_win = 0
-                    
-                    for pot in game.pots:
-                        eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                         for p in game.players]
-                        winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                        for player_idx, share in winner_shares.items():
-                            winner = game.players[player_idx]
-                            amount = int(pot.amount * share)
-                            if amount > max_win:
-                                big_winner = winner
-                                max_win = amount
-                            winner.chips += amount
-                        pot.amount = 0
-                        
-                    return {
-                        "status": "hand_complete",
-                        "game_state": game.get_game_state_json(),
-                        "winner": big_winner,
-                        "player_diff": game.players[0].chips - game.players[0].preflop,
-                        "action": action
-                    }
-                    
-            elif game.current_stage == GameStage.TURN:
-                game.deal_river()
-                game.reset_street_bets()
-                
-                # If all players are all-in, go to showdown
-                if all_players_all_in:
-                    game.current_stage = GameStage.SHOWDOWN
-                    
-                    # Calculate winners and distribute pots
-                    big_winner = None
-                    max_win = 0
-                    
-                    for pot in game.pots:
-                        eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                         for p in game.players]
-                        winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                        for player_idx, share in winner_shares.items():
-                            winner = game.players[player_idx]
-                            amount = int(pot.amount * share)
-                            if amount > max_win:
-                                big_winner = winner
-                                max_win = amount
-                            winner.chips += amount
-                        pot.amount = 0
-                        
-                    return {
-                        "status": "hand_complete",
-                        "game_state": game.get_game_state_json(),
-                        "winner": big_winner,
-                        "player_diff": game.players[0].chips - game.players[0].preflop,
-                        "action": action
-                    }
-                    
-            elif game.current_stage == GameStage.RIVER:
-                # Showdown required - evaluate hands and distribute pots
-                game.current_stage = GameStage.SHOWDOWN
-                big_winner = None
-                max_win = 0
-                
-                for pot in game.pots:
-                    eligible_players = [p if game.players.index(p) in pot.eligible_players else None 
-                                     for p in game.players]
-                    winner_shares, _ = HandEvaluator.determine_winners(eligible_players, game.community_cards)
-                    for player_idx, share in winner_shares.items():
-                        winner = game.players[player_idx]
-                        amount = int(pot.amount * share)
-                        if amount > max_win:
-                            big_winner = winner
-                            max_win = amount
-                        winner.chips += amount
-                    pot.amount = 0
-                    
-                return {
-                    "status": "hand_complete",
-                    "game_state": game.get_game_state_json(),
-                    "winner": big_winner,
-                    "player_diff": game.players[0].chips - game.players[0].preflop,
-                    "action": action
-                }
-                
-        return {
-            "status": "success",
-            "game_state": game.get_game_state_json(),
-            "table_comment": table_comment,
-            "comment_index": current_player_idx,
-            "action": action
-        }
+            return state_response({
+                "status": "success",
+                **game.get_state_patch(request.known_version),
+                "table_comment": entry["table_comment"],
+                "comment_index": entry["player_idx"],
+                "action": entry["action"]
+            })
         
-    except Exception as e:
-        logger.error(f"Error processing bot action: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to process bot action")
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error processing bot action: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to process bot action")
+
+@router.post("/games/auto-advance")
+async def auto_advance(request: StartHandRequest):
+    """
+    Plays every consecutive bot turn in one request, stopping when a human
+    is to act or the hand ends. Returns the bots' actions in order
+    (player_idx, action, amount, table_comment) with the resulting state.
+    """
+    game_id = request.game_id
+
+    if game_id not in active_games:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    game = active_games[game_id]
+
+    async with game_locks[game_id]:
+        try:
+            actions = []
+            hand_result = None
+            while (hand_result is None and len(actions) < MAX_AUTO_ACTIONS and hand_in_progress(game)
+                   and game.player_controllers[game.current_player_idx] is not None):
+                entry, hand_result = await play_bot_turn(game, request.known_version)
+                actions.append(entry)
+                # Lets event streams send this turn before the next bot decides
+                await asyncio.sleep(0)
+
+            if hand_result is not None:
+                hand_result["actions"] = actions
+                return state_response(hand_result)
+
+            return state_response({
+                "status": "success",
+                **game.get_state_patch(request.known_version),
+                "actions": actions
+            })
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error auto-advancing bots: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to advance bot turns")
 
 # ========== NEW COACH RECOMMENDATION ENDPOINT ==========
 @router.post("/games/coach-recommendation")
@@ -458,7 +365,7 @@ async def get_coach_recommendation(request: StartHandRequest):
         game_state = game.get_game_state_json()
 
         coach = AIPokerCoach()
-        advice_text = coach.get_advice(game_state)
+        advice_text = await coach.get_advice(game_state, equity=await estimate_hero_equity(game))
 
         return {"advice": advice_text}
 
@@ -485,7 +392,7 @@ async def coach_answer_question(request: CoachQuestionRequest):
         game_state = game.get_game_state_json()
 
         coach = AIPokerCoach()
-        advice_text = coach.ask_coach(request.question, game_state)
+        advice_text = await coach.ask_coach(request.question, game_state)
 
         return {"advice": advice_text}
 
@@ -502,35 +409,28 @@ async def create_game(request: CreateGameRequest):
     # Configure player names
     player_names = request.player_names
 
-    bot_factory = {
-        "looselauren": lambda: OptimizedPokerBot(personality="loose"),
-        "tighttimmy": lambda: OptimizedPokerBot(personality="tight"),
-        "balancedbenny": lambda: OptimizedPokerBot(personality="balanced"),
-        "hyperhenry": lambda: OptimizedPokerBot(personality="hyper_aggressive"),
-        "passivepete": lambda: OptimizedPokerBot(personality="passive"),
-        "trickytravis": lambda: OptimizedPokerBot(personality="trap_player"),
-        "mathmindy": lambda: OptimizedPokerBot(personality="math_based"),
-        "exploitingeve": lambda: OptimizedPokerBot(personality="exploitative"),
-        "wildcardwally": lambda: OptimizedPokerBot(personality="wildcard"),
-        "maniacmitch": lambda: OptimizedPokerBot(personality="maniac"), 
-    }
-    
     # Create bot controllers
     controllers = []
     for bot_id in request.bot_ids:
         if bot_id is None:
             controllers.append(None)
         else:
-            controllers.append(bot_factory[bot_id]())
+            controllers.append(OptimizedPokerBot(personality=BOT_PERSONALITIES[bot_id],
+                                                 decision_deadline=request.decision_deadline))
     
     try:
         # Create new game instance
         game = TexasHoldem(
             player_names=player_names,
-            player_controllers=controllers
+            player_controllers=controllers,
+            seed=request.seed
         )
         
         active_games[game_id] = game
+        channel = EventChannel()
+        game.listeners.append(channel.publish)
+        event_channels[game_id] = channel
+        game_locks[game_id] = asyncio.Lock()
 
         # Initialize the game hand to set attributes like min_raise
         # game.start_new_hand()
@@ -550,5 +450,59 @@ async def end_game(game_id: str):
 
     if game_id in active_games:
         del active_games[game_id]
+    game_locks.pop(game_id, None)
+    channel = event_channels.pop(game_id, None)
+    if channel is not None:
+        channel.close()
+
+    return {"status": "success"}
+
+
+async def event_stream(game: TexasHoldem, channel: EventChannel, request: Request, after: Optional[int]):
+    # A client without a usable position (new, or too far behind) first gets the full state.
+    # Anyone with the game_id can subscribe, so it is the spectator's view: no hole cards before showdown
+    seq = after if after is not None and after <= channel.last_seq else None
+    while True:
+        if seq is None:
+            seq = channel.last_seq
+            yield format_event(seq, "state", game.get_state_patch(viewer="spectator"), _json_default)
+        events, missed = channel.since(seq)
+        if missed:
+            seq = None
+            continue
+        for event in events:
+            yield format_event(*event, _json_default)
+            seq = event[0]
+        if channel.closed:
+            break
+        if not await channel.wait(seq, KEEPALIVE_INTERVAL):
+            if await request.is_disconnected():
+                break
+            yield ": keep-alive\n\n"
+
+
+@router.get("/games/events/{game_id}")
+async def stream_events(game_id: str, request: Request, after: Optional[int] = None):
+    """
+    Server-Sent Events stream of a game's table events (hand_started,
+    action, table_comment, deal, showdown, undo) as they happen. Each event
+    has a sequence number as its id; reconnecting with Last-Event-ID (or
+    ?after=) resumes after it. A "state" event with the spectator's view of
+    the game comes first on a new stream, and whenever the missed events are
+    no longer buffered. Actions are still sent with the POST endpoints.
+    """
+    if game_id not in active_games:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    last_event_id = request.headers.get("last-event-id")
+    if after is None and last_event_id:
+        try:
+            after = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
 
-    return {"status": "success"}
\ No newline at end of file
+    return StreamingResponse(
+        event_stream(active_games[game_id], event_channels[game_id], request, after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
\ No newline at end of file
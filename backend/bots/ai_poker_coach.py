@@ -1,14 +1,8 @@
-import os
 import json
-import random
-from dotenv import load_dotenv
-from openai import OpenAI
+from .llm_client import complete
 
 class AIPokerCoach:
     def __init__(self):
-        load_dotenv()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # A slightly wider preflop range
         self.basic_preflop_range = {
             "raise": "AA, KK, QQ, JJ, TT, 99, AKs, AKo, AQs, AJs",
@@ -101,11 +95,12 @@ class AIPokerCoach:
             print(f"Error formatting game state: {e}")
             return "None"
 
-    def get_advice(self, game_state) -> str:
+    async def get_advice(self, game_state, equity=None) -> str:
         """
         Calls OpenAI with the relevant information from the game state
         and the basic guidelines, then returns text-based coaching advice 
-        (not an automated action).
+        (not an automated action). equity is the player's estimated share
+        of the pot against the opponents' ranges, if known.
         """
         # Format the current game situation
         formatted_state = self._format_game_state(game_state)
@@ -124,6 +119,8 @@ class AIPokerCoach:
         situation_key = self._determine_stack_situation(stack_size, big_blind)
         situation_info = self.general_situations[situation_key]
 
+        equity_line = f"Estimated Equity vs Opponent Ranges: {equity:.1%}\n" if equity is not None else ""
+
         # Build the system message with the relevant details
         system_msg = (
             "You are an AI Poker Coach. You do NOT take actions yourself; you provide ONE short paragraph of advice.\n"
@@ -136,7 +133,8 @@ class AIPokerCoach:
             f"Play Style: {situation_info['Play Style']}\n"
             f"Position Importance: {situation_info['Position Importance']}\n"
             f"Key Hands: {', '.join(situation_info['Key Hands'])}\n\n"
-            f"Current Hole Cards: {hole_cards_str}\n\n"
+            f"Current Hole Cards: {hole_cards_str}\n"
+            f"{equity_line}\n"
             f"BB: $2, SB: $1\n\n"
             "Respond with exactly a single-line JSON object:\n"
             "{\n"
@@ -152,15 +150,13 @@ class AIPokerCoach:
         )
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
+            coaching_text = await complete(
+                [
                     {"role": "system", "content": system_msg},
                     {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=150
             )
-            coaching_text = response.choices[0].message.content.strip()
             parsed_results = json.loads(coaching_text)
 
             return parsed_results
@@ -168,7 +164,7 @@ class AIPokerCoach:
         except Exception as e:
             return f"Error occurred while fetching advice from AI: {str(e)}"
             
-    def ask_coach(self, question: str, game_state=None) -> str:
+    async def ask_coach(self, question: str, game_state=None) -> str:
         """
         Allows the player to ask open-ended questions to the AI Poker Coach.
         
@@ -247,15 +243,13 @@ class AIPokerCoach:
             )
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
+            coaching_response = await complete(
+                [
                     {"role": "system", "content": system_msg},
                     {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=150
             )
-            coaching_response = response.choices[0].message.content.strip()
             return coaching_response
         
         except Exception as e:
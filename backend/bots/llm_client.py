@@ -0,0 +1,84 @@
+import asyncio
+import os
+import threading
+from typing import Dict, List, Optional
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# One client is shared by every bot and coach request. Its connection pool is
+# bounded, so a burst of tables queues for a connection instead of opening one
+# each, and every call has a deadline after which it is cancelled.
+load_dotenv()
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "32"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "20"))  # seconds, including the wait for a pooled connection
+
+# A client's connections belong to the event loop that opened them, so there is
+# one client per loop: the server's, and the background loop run_blocking() uses
+_clients: Dict[asyncio.AbstractEventLoop, AsyncOpenAI] = {}
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_pid = None
+_background_lock = threading.Lock()
+
+
+def get_llm_client() -> AsyncOpenAI:
+    """
+    The running loop's shared AsyncOpenAI client, created on first use so a
+    missing API key only fails the calls. OPENAI_BASE_URL points it at
+    another server, e.g. bots.mock_llm.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        # Loops that have been closed can't use (or close) their clients any more
+        for closed in [other for other in list(_clients) if other.is_closed()]:
+            _clients.pop(closed, None)
+        client = _clients[loop] = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            timeout=LLM_TIMEOUT,
+            max_retries=0,  # a late answer is no use to a table; callers fall back instead
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS,
+                                    max_keepalive_connections=LLM_MAX_CONNECTIONS)
+            )
+        )
+    return client
+
+
+async def complete(messages: List[dict], max_tokens: int, timeout: Optional[float] = None) -> str:
+    """
+    Text of one chat completion. The request is cancelled (and its connection
+    released) after `timeout` seconds, LLM_TIMEOUT by default, raising
+    asyncio.TimeoutError; cancelling the awaiting task cancels it too.
+    """
+    response = await asyncio.wait_for(
+        get_llm_client().chat.completions.create(model=LLM_MODEL, messages=messages, max_tokens=max_tokens),
+        LLM_TIMEOUT if timeout is None else timeout
+    )
+    return response.choices[0].message.content.strip()
+
+
+def run_blocking(coroutine):
+    """
+    Runs a coroutine to completion from synchronous code, such as tables
+    played outside an event loop. Every call goes to one long-lived loop on a
+    background thread, so they all share that loop's client and pool.
+    """
+    global _background_loop, _background_pid
+    with _background_lock:
+        if _background_loop is None or _background_pid != os.getpid():
+            if _background_pid is not None:
+                # A forked worker inherits the parent's loops and clients but not their threads
+                _clients.clear()
+            _background_loop = asyncio.new_event_loop()
+            _background_pid = os.getpid()
+            threading.Thread(target=_background_loop.run_forever, name="llm-client", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coroutine, _background_loop).result()
+
+
+async def close_llm_client():
+    """Closes the running loop's client, e.g. on application shutdown"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
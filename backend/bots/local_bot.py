@@ -0,0 +1,86 @@
+import random
+from game.lookup_evaluator import LookupEvaluator, PAIR, TWO_PAIR
+from game.ranges import card_code, compile_chart
+from .optimized_bot import PERSONALITY_TRAITS, PREFLOP_CHARTS
+
+# Rough chance of betting a hand the bot would otherwise give up on
+BLUFF_RATES = {
+    "very low": 0.02,
+    "low": 0.05,
+    "situational": 0.10,
+    "medium": 0.10,
+    "adaptive": 0.12,
+    "high": 0.20,
+    "random": 0.25,
+    "very high": 0.30,
+    "extreme": 0.40
+}
+
+
+class RandomBot:
+    """Picks uniformly among the available actions, betting and raising the minimum"""
+    def __init__(self):
+        self.rng = random.Random()
+
+    def get_decision(self, game_state, game_min_raise) -> dict:
+        player = game_state["players"][game_state["current_player_idx"]]
+        action = self.rng.choice(player.get("available_actions") or ["fold"])
+        amount = game_min_raise if action == "raise" else game_state["big_blind"] if action == "bet" else 0
+        return {"action": action, "amount": amount, "table_comment": ""}
+
+
+class ChartBot:
+    """
+    Offline stand-in for OptimizedPokerBot: plays the personality's preflop
+    chart, then bets two pair or better, calls with a pair and otherwise
+    gives up, bluffing at the personality's bluff frequency. Decides in
+    microseconds, so it suits headless simulation.
+    """
+    def __init__(self, personality="balanced"):
+        if personality not in PREFLOP_CHARTS:
+            raise ValueError(f"Unknown personality: {personality}")
+        self.personality = personality
+        self.rng = random.Random()
+        self.preflop_ranges = compile_chart(PREFLOP_CHARTS[personality])
+        self.bluff_rate = BLUFF_RATES.get(PERSONALITY_TRAITS[personality]["bluff_frequency"], 0.10)
+
+    def _preflop_intent(self, pocket) -> str:
+        for action, hand_range in self.preflop_ranges.items():
+            if hand_range is not None and hand_range.contains(*pocket):
+                return action
+        # Charts written in prose ("Randomized") leave the choice to chance
+        return self.rng.choice(["raise", "call", "fold"])
+
+    def _postflop_intent(self, codes) -> str:
+        category = LookupEvaluator.category(LookupEvaluator.evaluate(codes))
+        if category >= TWO_PAIR:
+            return "raise"
+        if category == PAIR:
+            return "call"
+        return "fold"
+
+    def get_decision(self, game_state, game_min_raise) -> dict:
+        player = game_state["players"][game_state["current_player_idx"]]
+        available = player.get("available_actions") or ["fold"]
+        pocket = [card_code(card) for card in player.get("pocket_cards") or []]
+        board = [card_code(card) for card in game_state["community_cards"]]
+
+        if len(pocket) != 2:
+            intent = "fold"
+        elif board:
+            intent = self._postflop_intent(pocket + board)
+        else:
+            intent = self._preflop_intent(pocket)
+        if intent == "fold" and self.rng.random() < self.bluff_rate:
+            intent = "raise"
+
+        if intent == "raise" and "raise" in available:
+            return {"action": "raise", "amount": game_min_raise, "table_comment": ""}
+        if intent == "raise" and "bet" in available:
+            amount = max(game_state["big_blind"], game_state["total_pot"] // 2)
+            return {"action": "bet", "amount": amount, "table_comment": ""}
+        if intent != "fold" and "call" in available:
+            return {"action": "call", "amount": 0, "table_comment": ""}
+        if "check" in available:
+            return {"action": "check", "amount": 0, "table_comment": ""}
+        return {"action": "fold", "amount": 0, "table_comment": ""}
@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+# A stand-in for the OpenAI chat completions endpoint, for measuring bot and
+# coach throughput offline. Each request sleeps for the configured latency and
+# answers in the shape the bots and coach expect. Point the shared client at
+# it with OPENAI_BASE_URL=http://127.0.0.1:8001/v1. From backend/:
+#   python -m bots.mock_llm --port 8001 --latency 0.5
+#   python -m bots.mock_llm --bench --games 32 --decisions 5 --latency 0.2
+
+app = FastAPI()
+app.state.latency = 0.5
+app.state.jitter = 0.0
+app.state.requests = 0
+
+
+def mock_reply(messages: List[dict]) -> str:
+    system = messages[0]["content"] if messages else ""
+    prompt = messages[-1]["content"] if messages else ""
+    if "coach_tip" in system:
+        return json.dumps({"action": "call", "coach_tip": "Mock advice: the price is right to continue."})
+    if "poker bot" not in system:
+        return "Mock answer from the local test server."
+
+    # A bot: the cheapest action it was offered
+    available = ""
+    for line in prompt.splitlines():
+        if "Available Actions:" in line:
+            available = line.split("Available Actions:", 1)[1]
+    action = next((a for a in ("check", "call") if a in available), "fold")
+    return json.dumps({"action": action, "amount": 0, "table_comment": "Mock bot says hi."})
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    app.state.requests += 1
+    await asyncio.sleep(max(0.0, app.state.latency + random.uniform(-app.state.jitter, app.state.jitter)))
+    return {
+        "id": f"mock-{app.state.requests}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": mock_reply(body.get("messages", []))},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    }
+
+
+def start_server(port: int) -> uvicorn.Server:
+    """Runs the mock server on a background thread and returns once it accepts requests"""
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def bench(games: int, decisions: int) -> dict:
+    """
+    Plays `decisions` bot decisions at each of `games` tables at once, each
+    table waiting for its previous answer as the API does. Returns the wall
+    time, decisions per second and per-decision latency percentiles.
+    """
+    from game import TexasHoldem
+    from .optimized_bot import OptimizedPokerBot
+    from .llm_client import close_llm_client
+
+    latencies = []
+
+    async def play_table(seed: int):
+        table = TexasHoldem(["Hero", "B1", "B2", "B3", "B4", "B5"], [None] * 6, seed=seed, headless=True)
+        table.start_new_hand()
+        bot = OptimizedPokerBot(personality="balanced")
+        bot.rng.seed(seed)
+        state = table.get_bot_state_json()
+        for _ in range(decisions):
+            start = time.perf_counter()
+            await bot.get_decision_async(state, table.get_min_raise())
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play_table(seed) for seed in range(games)))
+    seconds = time.perf_counter() - start
+    await close_llm_client()
+
+    latencies.sort()
+    return {
+        "seconds": seconds,
+        "decisions_per_sec": len(latencies) / seconds,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock OpenAI chat completions server")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform +/- seconds added to each response")
+    parser.add_argument("--bench", action="store_true", help="time concurrent bot decisions against the mock")
+    parser.add_argument("--games", type=int, default=32)
+    parser.add_argument("--decisions", type=int, default=5, help="decisions per table in --bench")
+    args = parser.parse_args()
+
+    app.state.latency = args.latency
+    app.state.jitter = args.jitter
+    if not args.bench:
+        uvicorn.run(app, host="127.0.0.1", port=args.port)
+    else:
+        start_server(args.port)
+        os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.port}/v1"
+        os.environ.setdefault("OPENAI_API_KEY", "mock")
+        result = asyncio.run(bench(args.games, args.decisions))
+        total = args.games * args.decisions
+        print(f"{total} decisions at {args.games} tables in {result['seconds']:.2f}s "
+              f"({result['decisions_per_sec']:.1f}/sec, {app.state.requests} model calls, "
+              f"p50 {result['p50'] * 1000:.0f}ms, p99 {result['p99'] * 1000:.0f}ms, "
+              f"{args.latency * 1000:.0f}ms per call)")
@@ -1,142 +1,178 @@
-import os
+import asyncio
 import json
+import logging
+import os
 import random
-from dotenv import load_dotenv
-from openai import OpenAI
+from typing import Optional
+from game.ranges import compile_chart
+from .llm_client import complete, run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Seconds a bot waits for the model before its local policy answers instead
+DECISION_DEADLINE = float(os.getenv("BOT_DECISION_DEADLINE", "3"))
+
+# Personality traits, shared by every bot (and by the local stand-ins in local_bot.py)
+PERSONALITY_TRAITS = {
+    "loose": {
+        "style": "aggressive",
+        "range": "wide",
+        "bluff_frequency": "high",
+        "adaptability": "moderate",
+        "bot_comment": "cocky and overconfident"
+    },
+    "tight": {
+        "style": "conservative",
+        "range": "narrow",
+        "bluff_frequency": "low",
+        "adaptability": "high",
+        "bot_comment": "cautious and analytical"
+    },
+    "balanced": {
+        "style": "adaptive",
+        "range": "moderate",
+        "bluff_frequency": "medium",
+        "adaptability": "high",
+        "bot_comment": "balanced and thoughtful"
+    },
+    "hyper_aggressive": {
+        "style": "reckless",
+        "range": "very wide",
+        "bluff_frequency": "very high",
+        "adaptability": "low",
+        "bot_comment": "taunting and intimidating"
+    },
+    "passive": {
+        "style": "cautious",
+        "range": "moderate",
+        "bluff_frequency": "very low",
+        "adaptability": "medium",
+        "bot_comment": "apologetic and hesitant"
+    },
+    "trap_player": {
+        "style": "deceptive",
+        "range": "narrow",
+        "bluff_frequency": "low",
+        "adaptability": "moderate",
+        "bot_comment": "misleading and sly"
+    },
+    "math_based": {
+        "style": "calculative",
+        "range": "GTO optimal",
+        "bluff_frequency": "situational",
+        "adaptability": "high",
+        "bot_comment": "technical and statistical"
+    },
+    "exploitative": {
+        "style": "opportunistic",
+        "range": "dynamic",
+        "bluff_frequency": "adaptive",
+        "adaptability": "high",
+        "bot_comment": "observant and psychological"
+    },
+    "wildcard": {
+        "style": "unpredictable",
+        "range": "randomized",
+        "bluff_frequency": "random",
+        "adaptability": "low",
+        "bot_comment": "chaotic and nonsensical"
+    },
+    "maniac": {
+        "style": "fearless",
+        "range": "ultra-wide",
+        "bluff_frequency": "extreme",
+        "adaptability": "low",
+        "bot_comment": "wild and hyperactive"
+    }
+}
+
+# Preflop charts per personality
+PREFLOP_CHARTS = {
+    "loose": {
+        "raise": "AA-22,AKs-A2s,KQs-K2s,QJs-Q2s,JTs+,AKo-ATo,KQo",
+        "call": "A9o-A2o,KJo-K2o,QJo-Q2o,JTo-J2o",
+        "fold": "Remaining hands"
+    },
+    "tight": {
+        "raise": "AA-TT,AKs-ATs,KQs-KJs,QJs,AKo-AQo",
+        "call": "99-22,A9s-A2s,KTs-K2s,QTs-Q2s",
+        "fold": "Remaining hands"
+    },
+    "balanced": {
+        "raise": "AA-66,AKs-A9s,KQs-KTs,QJs-QTs,JTs+,AKo-ATo,KQo,KJo",
+        "call": "55-22,A8s-A2s,K9s-K2s,Q9s-Q2s,J9s-J2s,T9s-T2s",
+        "fold": "Remaining hands"
+    },
+    "hyper_aggressive": {
+        "raise": "AA-22,AKs-A2s,KQs-K2s,QJs-Q2s,JTs-J2s,T9s-T2s,98s-92s,87s-82s,76s-72s,65s-62s,54s-52s,43s-42s,32s,AKo-32o",
+        "call": "None",
+        "fold": "None"
+    },
+    "passive": {
+        "raise": "AA-JJ,AKs,AKo",
+        "call": "TT-22,AQs-A2s,KQs-KTs,QJs-QTs,JTs,J9s,T9s,98s,87s",
+        "fold": "Remaining hands"
+    },
+    "trap_player": {
+        "raise": "AA-KK,AKs,AKo",
+        "call": "QQ-99,AQs-AJs,KQs-KJs,QJs-QTs,JTs",
+        "fold": "Remaining hands"
+    },
+    "math_based": {
+        "raise": "AA-66,AKs-A9s,KQs-KTs,QJs-QTs,JTs+,AKo-ATo,KQo,KJo",
+        "call": "55-22,A8s-A2s,K9s-K2s,Q9s-Q2s,J9s-J2s,T9s-T2s",
+        "fold": "Remaining hands"
+    },
+    "exploitative": {
+        "raise": "AA-77,AKs-AJs,KQs-KJs,QJs,JTs,AKo-ATo,KQo",
+        "call": "66-22,A9s-A2s,KTs-K7s,QTs-Q8s,J9s-J8s,T9s-T8s",
+        "fold": "Depends on opponent tendencies"
+    },
+    "wildcard": {
+        "raise": "Randomized",
+        "call": "Randomized",
+        "fold": "Randomized"
+    },
+    "maniac": {
+        "raise": "AA-22,AKs-A2s,KQs-K2s,QJs-Q2s,JTs-J2s,T9s-T2s,98s-92s,87s-82s,76s-72s,65s-62s,54s-52s,43s-42s,32s,AKo-32o",
+        "call": "None",
+        "fold": "None"
+    }
+}
+
+
+# Bot ids offered by the API (and the tournament runner) and the personality each plays
+BOT_PERSONALITIES = {
+    "looselauren": "loose",
+    "tighttimmy": "tight",
+    "balancedbenny": "balanced",
+    "hyperhenry": "hyper_aggressive",
+    "passivepete": "passive",
+    "trickytravis": "trap_player",
+    "mathmindy": "math_based",
+    "exploitingeve": "exploitative",
+    "wildcardwally": "wildcard",
+    "maniacmitch": "maniac"
+}
+
 
 class OptimizedPokerBot:
-    def __init__(self, personality="loose"):
-        load_dotenv()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def __init__(self, personality="loose", decision_deadline: Optional[float] = None):
+        from .local_bot import ChartBot  # local_bot builds on this module's charts
+
         self.personality = personality
+        # Own stream so tables can reseed it per hand (see TexasHoldem.reset_hand)
+        self.rng = random.Random()
+        self.decision_deadline = DECISION_DEADLINE if decision_deadline is None else decision_deadline
+        # Answers from the personality's chart, traits and hand strength when the model is late or fails
+        self.fallback = ChartBot(personality)
+        self.fallback.rng = self.rng
         
-        # Personality traits (unchanged)
-        self.traits = {
-            "loose": {
-                "style": "aggressive",
-                "range": "wide",
-                "bluff_frequency": "high",
-                "adaptability": "moderate",
-                "bot_comment": "cocky and overconfident"
-            },
-            "tight": {
-                "style": "conservative",
-                "range": "narrow",
-                "bluff_frequency": "low",
-                "adaptability": "high",
-                "bot_comment": "cautious and analytical"
-            },
-            "balanced": {
-                "style": "adaptive",
-                "range": "moderate",
-                "bluff_frequency": "medium",
-                "adaptability": "high",
-                "bot_comment": "balanced and thoughtful"
-            },
-            "hyper_aggressive": {
-                "style": "reckless",
-                "range": "very wide",
-                "bluff_frequency": "very high",
-                "adaptability": "low",
-                "bot_comment": "taunting and intimidating"
-            },
-            "passive": {
-                "style": "cautious",
-                "range": "moderate",
-                "bluff_frequency": "very low",
-                "adaptability": "medium",
-                "bot_comment": "apologetic and hesitant"
-            },
-            "trap_player": {
-                "style": "deceptive",
-                "range": "narrow",
-                "bluff_frequency": "low",
-                "adaptability": "moderate",
-                "bot_comment": "misleading and sly"
-            },
-            "math_based": {
-                "style": "calculative",
-                "range": "GTO optimal",
-                "bluff_frequency": "situational",
-                "adaptability": "high",
-                "bot_comment": "technical and statistical"
-            },
-            "exploitative": {
-                "style": "opportunistic",
-                "range": "dynamic",
-                "bluff_frequency": "adaptive",
-                "adaptability": "high",
-                "bot_comment": "observant and psychological"
-            },
-            "wildcard": {
-                "style": "unpredictable",
-                "range": "randomized",
-                "bluff_frequency": "random",
-                "adaptability": "low",
-                "bot_comment": "chaotic and nonsensical"
-            },
-            "maniac": {
-                "style": "fearless",
-                "range": "ultra-wide",
-                "bluff_frequency": "extreme",
-                "adaptability": "low",
-                "bot_comment": "wild and hyperactive"
-            }
-        }
+        self.traits = PERSONALITY_TRAITS
+        self.preflop_charts = PREFLOP_CHARTS
 
-        # Preflop charts (unchanged)
-        self.preflop_charts = {
-            "loose": {
-                "raise": "AA-22,AKs-A2s,KQs-K2s,QJs-Q2s,JTs+,AKo-ATo,KQo",
-                "call": "A9o-A2o,KJo-K2o,QJo-Q2o,JTo-J2o",
-                "fold": "Remaining hands"
-            },
-            "tight": {
-                "raise": "AA-TT,AKs-ATs,KQs-KJs,QJs,AKo-AQo",
-                "call": "99-22,A9s-A2s,KTs-K2s,QTs-Q2s",
-                "fold": "Remaining hands"
-            },
-            "balanced": {
-                "raise": "AA-66,AKs-A9s,KQs-KTs,QJs-QTs,JTs+,AKo-ATo,KQo,KJo",
-                "call": "55-22,A8s-A2s,K9s-K2s,Q9s-Q2s,J9s-J2s,T9s-T2s",
-                "fold": "Remaining hands"
-            },
-            "hyper_aggressive": {
-                "raise": "AA-22,AKs-A2s,KQs-K2s,QJs-Q2s,JTs-J2s,T9s-T2s,98s-92s,87s-82s,76s-72s,65s-62s,54s-52s,43s-42s,32s,AKo-32o",
-                "call": "None",
-                "fold": "None"
-            },
-            "passive": {
-                "raise": "AA-JJ,AKs,AKo",
-                "call": "TT-22,AQs-A2s,KQs-KTs,QJs-QTs,JTs,J9s,T9s,98s,87s",
-                "fold": "Remaining hands"
-            },
-            "trap_player": {
-                "raise": "AA-KK,AKs,AKo",
-                "call": "QQ-99,AQs-AJs,KQs-KJs,QJs-QTs,JTs",
-                "fold": "Remaining hands"
-            },
-            "math_based": {
-                "raise": "AA-66,AKs-A9s,KQs-KTs,QJs-QTs,JTs+,AKo-ATo,KQo,KJo",
-                "call": "55-22,A8s-A2s,K9s-K2s,Q9s-Q2s,J9s-J2s,T9s-T2s",
-                "fold": "Remaining hands"
-            },
-            "exploitative": {
-                "raise": "AA-77,AKs-AJs,KQs-KJs,QJs,JTs,AKo-ATo,KQo",
-                "call": "66-22,A9s-A2s,KTs-K7s,QTs-Q8s,J9s-J8s,T9s-T8s",
-                "fold": "Depends on opponent tendencies"
-            },
-            "wildcard": {
-                "raise": "Randomized",
-                "call": "Randomized",
-                "fold": "Randomized"
-            },
-            "maniac": {
-                "raise": "AA-22,AKs-A2s,KQs-K2s,QJs-Q2s,JTs-J2s,T9s-T2s,98s-92s,87s-82s,76s-72s,65s-62s,54s-52s,43s-42s,32s,AKo-32o",
-                "call": "None",
-                "fold": "None"
-            }
-        }
+        # The same charts compiled to combo sets (None where the chart is not range notation)
+        self.preflop_ranges = compile_chart(self.preflop_charts.get(personality, {}))
 
         # Generic stack-based guidelines (applies to all personalities)
         self.general_situations = {
@@ -178,6 +214,19 @@ class OptimizedPokerBot:
             return "Micro Stack (10 BB)"
 
 
+    def preflop_chart_action(self, pocket_cards):
+        """
+        Which chart entry ("raise", "call" or "fold") holds the pocket cards
+        (Card objects, codes, or strings like "A♠"), or None if the chart can't say.
+        """
+        if len(pocket_cards) != 2:
+            return None
+        for action, hand_range in self.preflop_ranges.items():
+            if hand_range is not None and hand_range.contains(*pocket_cards):
+                return action
+        return None
+
+
     def _format_game_state(self, game_state) -> str:
         """Transforms raw game state into a structured, readable summary."""
         try:
@@ -227,11 +276,14 @@ class OptimizedPokerBot:
 
 
 
-    def _generate_decision(self, game_state, game_min_raise) -> dict:
+    async def _generate_decision(self, game_state, game_min_raise) -> dict:
         """
         Generates an action based on the current game state,
         factoring in personality, stack situation, and 
         slight adjustments to avoid over-revealing the hand.
+        If the model hasn't answered within decision_deadline seconds (the
+        call is then cancelled), fails, or answers badly, the local
+        fallback policy decides instead.
         """
         formatted_state = self._format_game_state(game_state)
 
@@ -245,6 +297,13 @@ class OptimizedPokerBot:
         situation_key = self._determine_stack_situation(current_stack, big_blind)
         situation_info = self.general_situations[situation_key]
 
+        # Preflop, the personality's chart already says what to do with these cards
+        chart_line = ""
+        if game_state["game_stage"] == "preflop":
+            chart_action = self.preflop_chart_action(current_player.get("pocket_cards") or [])
+            if chart_action is not None:
+                chart_line = f"Preflop Chart: your hand is in your {chart_action} range.\n"
+
         # Base bet size logic
         min_bet = big_blind
         max_bet = game_state["total_pot"] // 2
@@ -253,7 +312,7 @@ class OptimizedPokerBot:
         # Adjust bet/fold frequencies based on personality
         if self.personality in ["tight", "passive"]:
             base_bet_sizes = [min_bet, int(min_bet * 1.5)]
-            if random.random() < 0.20 and current_bet > 0:
+            if self.rng.random() < 0.20 and current_bet > 0:
                 return {
                     "action": "fold",
                     "amount": 0,
@@ -261,7 +320,7 @@ class OptimizedPokerBot:
                 }
         elif self.personality in ["loose", "exploitative"]:
             base_bet_sizes = [min_bet, min_bet * 2, min_bet * 3]
-            if random.random() < 0.10 and current_bet > 0:
+            if self.rng.random() < 0.10 and current_bet > 0:
                 return {
                     "action": "fold",
                     "amount": 0,
@@ -269,7 +328,7 @@ class OptimizedPokerBot:
                 }
         elif self.personality in ["hyper_aggressive", "maniac"]:
             base_bet_sizes = [min_bet * 2, min_bet * 3, max_bet]
-            if random.random() < 0.05 and current_bet > 0:
+            if self.rng.random() < 0.05 and current_bet > 0:
                 return {
                     "action": "fold",
                     "amount": 0,
@@ -277,7 +336,7 @@ class OptimizedPokerBot:
                 }
         else:
             # Default personalities (balanced, trap_player, math_based, wildcard)
-            if random.random() < 0.10 and current_bet > 0:
+            if self.rng.random() < 0.10 and current_bet > 0:
                 return {
                     "action": "fold",
                     "amount": 0,
@@ -285,7 +344,7 @@ class OptimizedPokerBot:
                 }
 
         # Randomly pick one of the suggested bet sizes (AI doesn't have to use it)
-        chosen_bet = random.choice(base_bet_sizes)
+        chosen_bet = self.rng.choice(base_bet_sizes)
 
         # Updated system message: incorporate chosen_bet and mention it's optional
         system_msg = (
@@ -293,7 +352,8 @@ class OptimizedPokerBot:
             f"Stack Situation: {situation_key}\n"
             f"Play Style: {situation_info['Play Style']}\n"
             f"Position Importance: {situation_info['Position Importance']}\n"
-            f"Key Hands: {', '.join(situation_info['Key Hands'])}\n\n"
+            f"Key Hands: {', '.join(situation_info['Key Hands'])}\n"
+            f"{chart_line}\n"
             f"Style: {self.traits[self.personality]['style']}.\n"
             f"Range: {self.traits[self.personality]['range']}.\n"
             f"Bluff Frequency: {self.traits[self.personality]['bluff_frequency']}.\n"
@@ -323,15 +383,14 @@ class OptimizedPokerBot:
         )
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
+            result = await complete(
+                [
                     {"role": "system", "content": system_msg},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=50
+                max_tokens=50,
+                timeout=self.decision_deadline
             )
-            result = response.choices[0].message.content.strip()
             parsed_response = json.loads(result)
 
             # Validate required keys
@@ -340,17 +399,19 @@ class OptimizedPokerBot:
                     parsed_response["amount"] = game_min_raise
                 
                 return parsed_response
-            else:
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "table_comment": "Sticking to a safer play this time."
-                }
+            logger.info(f"{self.personality} bot got an incomplete answer, using its fallback policy")
+        except asyncio.TimeoutError:
+            logger.info(f"{self.personality} bot missed its {self.decision_deadline}s deadline, using its fallback policy")
         except Exception as e:
-            # Fallback if there's an error parsing or with the API
-            return {"action": "fold", "amount": 0, "table_comment": f"Error occurred: {str(e)}"}
+            # An error parsing the answer or with the API
+            logger.info(f"{self.personality} bot's model call failed ({e}), using its fallback policy")
+        return self.fallback.get_decision(game_state, game_min_raise)
+
 
+    async def get_decision_async(self, game_state, game_min_raise) -> dict:
+        """Public method to fetch the bot's final decision object, for callers on an event loop."""
+        return await self._generate_decision(game_state, game_min_raise)
 
     def get_decision(self, game_state, game_min_raise) -> dict:
-        """Public method to fetch the bot's final decision object."""
-        return self._generate_decision(game_state, game_min_raise)
+        """Blocking version of get_decision_async, for tables played outside an event loop."""
+        return run_blocking(self._generate_decision(game_state, game_min_raise))
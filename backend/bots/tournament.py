@@ -0,0 +1,182 @@
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from game import TexasHoldem, ShuffleBuffer
+from .local_bot import ChartBot
+from .optimized_bot import BOT_PERSONALITIES, OptimizedPokerBot
+
+# Bot-vs-bot tournaments over many independent tables. Each shard plays a
+# fixed number of hands at one table in a worker process; shard results are
+# summed per seat and checkpointed so an interrupted run resumes where it
+# stopped. From backend/:
+#   python -m bots.tournament looselauren tighttimmy mathmindy --hands 1000000 --checkpoint run.json
+
+STAT_KEYS = ("hands", "net_bb", "net_bb_sq", "showdowns", "showdowns_won")
+
+
+def make_bot(bot_id: str, offline: bool = True):
+    """A bot for one of the API's bot ids; offline swaps the LLM bot for its local chart stand-in"""
+    if bot_id not in BOT_PERSONALITIES:
+        raise ValueError(f"Unknown bot: {bot_id}")
+    personality = BOT_PERSONALITIES[bot_id]
+    return ChartBot(personality) if offline else OptimizedPokerBot(personality=personality)
+
+
+def play_shard(lineup: List[str], hands: int, seed: int, offline: bool = True, stack: int = 200) -> List[dict]:
+    """
+    Plays `hands` headless hands at one table, topping every seat back up to
+    `stack` before each hand so results are per-hand winnings. Returns the
+    raw per-seat sums (see STAT_KEYS) in lineup order.
+    """
+    seeds = np.random.SeedSequence(seed).generate_state(2)
+    deal_source = ShuffleBuffer(seed=int(seeds[0]), background=False)
+    table = TexasHoldem([f"Seat{i + 1}-{bot_id}" for i, bot_id in enumerate(lineup)],
+                        [make_bot(bot_id, offline) for bot_id in lineup],
+                        seed=int(seeds[1]), deal_source=deal_source, headless=True)
+    stats = [dict.fromkeys(STAT_KEYS, 0) for _ in lineup]
+
+    for _ in range(hands):
+        for player in table.players:
+            player.chips = stack
+        result = table.play_hand()
+
+        for seat, player in enumerate(table.players):
+            net_bb = (player.chips - stack) / table.big_blind
+            seat_stats = stats[seat]
+            seat_stats["hands"] += 1
+            seat_stats["net_bb"] += net_bb
+            seat_stats["net_bb_sq"] += net_bb * net_bb
+            if seat in result["hands"]:
+                seat_stats["showdowns"] += 1
+                if result["payouts"].get(seat, 0) > 0:
+                    seat_stats["showdowns_won"] += 1
+
+    return stats
+
+
+def summarize(lineup: List[str], totals: List[dict]) -> List[dict]:
+    """Per-seat bb/100 with its standard error, and showdown frequency and win rate"""
+    summary = []
+    for seat, (bot_id, stats) in enumerate(zip(lineup, totals)):
+        hands = stats["hands"]
+        mean = stats["net_bb"] / hands if hands else 0.0
+        variance = max(stats["net_bb_sq"] / hands - mean * mean, 0.0) if hands else 0.0
+        summary.append({
+            "seat": seat + 1,
+            "bot": bot_id,
+            "hands": hands,
+            "bb_per_100": mean * 100,
+            "std_error": math.sqrt(variance / hands) * 100 if hands else 0.0,
+            "showdown_rate": stats["showdowns"] / hands if hands else 0.0,
+            "showdown_win_rate": stats["showdowns_won"] / stats["showdowns"] if stats["showdowns"] else 0.0
+        })
+    return summary
+
+
+def _write_checkpoint(path: str, state: dict):
+    # Write then rename so a crash mid-write never leaves a truncated checkpoint
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(temp_path, path)
+
+
+def run_tournament(lineup: List[str], hands: int, shard_hands: int = 5000,
+                   workers: Optional[int] = None, seed: int = 0, offline: bool = True,
+                   checkpoint: Optional[str] = None, checkpoint_interval: float = 30.0,
+                   progress=None) -> dict:
+    """
+    Plays `hands` hands with the given lineup (2 to 6 bot ids, in seat order)
+    split into independent shards across a process pool. With a checkpoint
+    path, finished shards are saved at most every checkpoint_interval seconds
+    and a rerun with the same settings only plays the missing shards.
+    progress, if given, is called with (shards_done, total_shards).
+    """
+    if not 2 <= len(lineup) <= 6:
+        raise ValueError("A table needs between 2 and 6 bots")
+    for bot_id in lineup:
+        if bot_id not in BOT_PERSONALITIES:
+            raise ValueError(f"Unknown bot: {bot_id}")
+
+    shard_count = math.ceil(hands / shard_hands)
+    shard_sizes = [min(shard_hands, hands - i * shard_hands) for i in range(shard_count)]
+    shard_seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(shard_count)]
+    config = {"lineup": lineup, "hands": hands, "shard_hands": shard_hands, "seed": seed, "offline": offline}
+
+    completed: Dict[str, List[dict]] = {}
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            saved = json.load(f)
+        if saved.get("config") != config:
+            raise ValueError(f"Checkpoint {checkpoint} was written with different settings")
+        completed = saved["completed"]
+
+    def save():
+        if checkpoint:
+            _write_checkpoint(checkpoint, {"config": config, "completed": completed})
+
+    pending = [i for i in range(shard_count) if str(i) not in completed]
+    start = time.perf_counter()
+    last_save = time.monotonic()
+
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            futures = {executor.submit(play_shard, lineup, shard_sizes[i], shard_seeds[i], offline): i
+                       for i in pending}
+            try:
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        completed[str(futures.pop(future))] = future.result()
+                    if progress:
+                        progress(len(completed), shard_count)
+                    if time.monotonic() - last_save >= checkpoint_interval:
+                        save()
+                        last_save = time.monotonic()
+            finally:
+                # Keep whatever finished, even if the run is interrupted
+                for future in futures:
+                    future.cancel()
+                save()
+
+    totals = [dict.fromkeys(STAT_KEYS, 0) for _ in lineup]
+    for shard_stats in completed.values():
+        for seat_totals, seat_stats in zip(totals, shard_stats):
+            for key in STAT_KEYS:
+                seat_totals[key] += seat_stats[key]
+
+    return {
+        "config": config,
+        "shards": shard_count,
+        "seconds": time.perf_counter() - start,
+        "seats": summarize(lineup, totals)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bot-vs-bot tournament")
+    parser.add_argument("bots", nargs="+", choices=sorted(BOT_PERSONALITIES), help="bot ids in seat order")
+    parser.add_argument("--hands", type=int, default=100000)
+    parser.add_argument("--shard-hands", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default=None, help="JSON file to save progress to and resume from")
+    parser.add_argument("--llm", action="store_true", help="use the OpenAI-backed bots instead of local stand-ins")
+    args = parser.parse_args()
+
+    result = run_tournament(args.bots, args.hands, args.shard_hands, args.workers, args.seed,
+                            offline=not args.llm, checkpoint=args.checkpoint,
+                            progress=lambda done, total: print(f"\r{done}/{total} shards", end="", flush=True))
+    print(f"\n{args.hands} hands in {result['seconds']:.1f}s")
+    print(f"{'Seat':<5}{'Bot':<16}{'Hands':>10}{'bb/100':>10}{'+/-':>8}{'WTSD':>8}{'W$SD':>8}")
+    for seat in result["seats"]:
+        print(f"{seat['seat']:<5}{seat['bot']:<16}{seat['hands']:>10}{seat['bb_per_100']:>10.2f}"
+              f"{seat['std_error']:>8.2f}{seat['showdown_rate']:>8.1%}{seat['showdown_win_rate']:>8.1%}")
@@ -6,7 +6,16 @@ from .card import Card
 from .deck import Deck
 from .player import Player
 from .game import TexasHoldem, GameStage, Action
+from .snapshot import HandSnapshot
 from .evaluator import HandEvaluator
+from .lookup_evaluator import LookupEvaluator
+from .batch_evaluator import BatchEvaluator
+from .equity import EquityCalculator
+from .preflop_equity import PreflopEquity
+from .ranges import HandRange
+from .range_equity import RangeEquityCalculator
+from .shuffle_buffer import ShuffleBuffer
+from .controller import PlayerController
 
 
 __all__ = [
@@ -17,5 +26,14 @@ __all__ = [
     "Player",
     "TexasHoldem",
     "GameStage",
-    "HandEvaluator"
+    "HandSnapshot",
+    "HandEvaluator",
+    "LookupEvaluator",
+    "BatchEvaluator",
+    "EquityCalculator",
+    "PreflopEquity",
+    "HandRange",
+    "RangeEquityCalculator",
+    "ShuffleBuffer",
+    "PlayerController"
 ]
@@ -0,0 +1,64 @@
+import numpy as np
+from .lookup_evaluator import CARD_PRIMES, CARD_RANK_BITS, FLUSH_TABLE, RANK_TABLE
+
+# NumPy copies of the lookup tables. The prime-product table is stored as
+# sorted keys so a whole batch can be resolved with one searchsorted gather.
+_CARD_PRIMES = np.array(CARD_PRIMES, dtype=np.int64)
+# Each card's rank bit shifted into a 16-bit lane for its suit; summing a hand's
+# cards yields all four suit masks packed in one integer.
+_CARD_SUIT_BITS = np.array([bit << (16 * (code & 3)) for code, bit in enumerate(CARD_RANK_BITS)], dtype=np.int64)
+_FLUSH_TABLE = np.array(FLUSH_TABLE, dtype=np.int32)
+_RANK_KEYS = np.array(sorted(RANK_TABLE), dtype=np.int64)
+_RANK_VALUES = np.array([RANK_TABLE[key] for key in sorted(RANK_TABLE)], dtype=np.int32)
+
+
+class BatchEvaluator:
+    @staticmethod
+    def evaluate(codes) -> np.ndarray:
+        """
+        Scores many hands at once. Takes an integer array of card codes shaped
+        (..., k) with 5 <= k <= 7 (usually (N, 7)) and returns the matching
+        array of strengths shaped (...), identical to LookupEvaluator.evaluate.
+        """
+        codes = np.asarray(codes, dtype=np.intp)
+        if codes.ndim == 0 or not 5 <= codes.shape[-1] <= 7:
+            raise ValueError("Expected an array of 5 to 7 card codes per hand")
+
+        products = _CARD_PRIMES[codes].prod(axis=-1)
+        strengths = _RANK_VALUES[np.searchsorted(_RANK_KEYS, products)]
+
+        # A made flush always outranks the non-flush reading of the same cards,
+        # so the flush lookup can simply be max'ed in suit by suit.
+        packed_masks = _CARD_SUIT_BITS[codes].sum(axis=-1)
+        for suit in range(4):
+            suit_masks = (packed_masks >> (16 * suit)) & 0x1FFF
+            np.maximum(strengths, _FLUSH_TABLE[suit_masks], out=strengths)
+
+        return strengths
+
+    @staticmethod
+    def evaluate_runouts(base_codes, runout_codes) -> np.ndarray:
+        """
+        Scores every base hand against every runout without re-reading the base cards.
+        base_codes is (P, k) (hole cards plus the known board for each player) and
+        runout_codes is (M, r) with k + r between 5 and 7. The base prime products
+        and suit masks are computed once and combined with each runout's, so the
+        result is a (P, M) array of strengths.
+        """
+        base_codes = np.asarray(base_codes, dtype=np.intp)
+        runout_codes = np.asarray(runout_codes, dtype=np.intp)
+        if not 5 <= base_codes.shape[-1] + runout_codes.shape[-1] <= 7:
+            raise ValueError("Base and runout cards must add up to 5 to 7 cards")
+
+        products = _CARD_PRIMES[base_codes].prod(axis=-1)[:, None] * _CARD_PRIMES[runout_codes].prod(axis=-1)[None, :]
+        # Clipped so a runout that reuses a base card (which callers mask out) scores as garbage instead of raising
+        keys = np.minimum(np.searchsorted(_RANK_KEYS, products), len(_RANK_KEYS) - 1)
+        strengths = _RANK_VALUES[keys]
+
+        # Cards never repeat between base and runout, so adding the packed masks is a bitwise or
+        packed_masks = _CARD_SUIT_BITS[base_codes].sum(axis=-1)[:, None] + _CARD_SUIT_BITS[runout_codes].sum(axis=-1)[None, :]
+        for suit in range(4):
+            suit_masks = (packed_masks >> (16 * suit)) & 0x1FFF
+            np.maximum(strengths, _FLUSH_TABLE[suit_masks], out=strengths)
+
+        return strengths
@@ -1,12 +1,55 @@
 from .suit import Suit
+from .lookup_evaluator import encode_card
+
+SUIT_INDEX = {suit: i for i, suit in enumerate(Suit)}
+FACE_CARDS = {11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
 
 
 class Card:
-    def __init__(self, value, suit):
-        self.value = value
-        self.suit = suit
-    
+    """
+    One of 52 immutable cards. Card(value, suit) returns the shared instance,
+    which carries its packed code, a one-bit mask (1 << code) and its text.
+    """
+    __slots__ = ("value", "suit", "code", "mask", "_text")
+    _interned = {}
+
+    def __new__(cls, value, suit):
+        code = encode_card(value, SUIT_INDEX[suit])
+        card = cls._interned.get(code)
+        if card is None:
+            card = object.__new__(cls)
+            object.__setattr__(card, "value", value)
+            object.__setattr__(card, "suit", suit)
+            object.__setattr__(card, "code", code)
+            object.__setattr__(card, "mask", 1 << code)
+            object.__setattr__(card, "_text", f"{FACE_CARDS.get(value, str(value))}{suit.value}")
+            cls._interned[code] = card
+        return card
+
+    @staticmethod
+    def from_code(code: int) -> "Card":
+        return CARDS[code]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        # Unpickling goes back through __new__, so every process keeps one instance per card
+        return Card, (self.value, self.suit)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __str__(self):
-        face_cards = {11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
-        card_value = face_cards.get(self.value, str(self.value))
-        return f"{card_value}{self.suit.value}"
\ No newline at end of file
+        return self._text
+
+
+# Indexed by card code
+_SUITS = list(Suit)
+CARDS = [Card(code // 4 + 2, _SUITS[code % 4]) for code in range(52)]
@@ -0,0 +1,15 @@
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class PlayerController(Protocol):
+    """
+    Anything that can act for a seat. get_decision receives the table state
+    from TexasHoldem.get_bot_state_json() (with this seat's own cards) and the
+    minimum legal raise, and returns a dict with "action" ("fold", "check",
+    "call", "bet" or "raise"), "amount" and optionally "table_comment".
+    Controllers that wait on I/O may also define an async
+    get_decision_async with the same arguments, which the API awaits instead.
+    """
+    def get_decision(self, game_state: dict, game_min_raise: int) -> dict:
+        ...
@@ -1,26 +1,58 @@
-from .suit import Suit
-from .card import Card
+from typing import Optional
+from .card import CARDS
 import random
 
+_FRESH_ORDER = bytes(range(52))
+
+
 class Deck:
-    def __init__(self):
-        self.cards = []
-        self._create_deck()
-    
-    def _create_deck(self):
-        for suit in Suit:
-            for value in range(2, 15):
-                self.cards.append(Card(value, suit))
+    """
+    The 52 card codes in one reusable bytearray. Shuffling permutes it in
+    place and dealing advances a cursor, so a hand allocates nothing.
+    With a source (a ShuffleBuffer) each shuffle copies in its next
+    pre-shuffled order instead.
+    """
+    def __init__(self, rng: Optional[random.Random] = None, source=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.source = source
+        self.order = bytearray(range(52))
+        self.position = 0
+        self.shuffle()
+
+    @property
+    def cards(self):
+        """The undealt cards, next card to be dealt first"""
+        return [CARDS[code] for code in self.order[self.position:]]
+
+    def __len__(self):
+        return 52 - self.position
+
+    def reset(self, seed: Optional[int] = None, order: Optional[bytes] = None):
+        """
+        Collects and shuffles the deck. With a seed (and no source) the order
+        is reproducible; an explicit order (52 card codes) is used as given.
+        """
+        if order is not None:
+            self.order[:] = order
+            self.position = 0
+            return
+        if seed is not None and self.source is None:
+            self.rng.seed(seed)
         self.shuffle()
-    
-    def reset(self):
-        self.cards = []
-        self._create_deck()
 
     def shuffle(self):
-        random.shuffle(self.cards)
-    
+        """Returns every card to the deck and shuffles it"""
+        if self.source is not None:
+            self.order[:] = self.source.next_order()
+        else:
+            # Start from the fresh-deck order so the result depends only on the RNG state
+            self.order[:] = _FRESH_ORDER
+            self.rng.shuffle(self.order)
+        self.position = 0
+
     def deal(self):
-        if len(self.cards) > 0:
-            return self.cards.pop()
-        return None
\ No newline at end of file
+        if self.position < 52:
+            card = CARDS[self.order[self.position]]
+            self.position += 1
+            return card
+        return None
@@ -0,0 +1,222 @@
+import math
+import time
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .batch_evaluator import BatchEvaluator
+
+
+def to_codes(cards) -> List[int]:
+    """Accepts Card objects or integer card codes and returns the codes"""
+    return [int(getattr(card, "code", card)) for card in cards] if cards else []
+
+
+def _tally(strengths: np.ndarray) -> tuple:
+    """Win/tie counts and equity share sums per player for a (P, M) block of runout strengths"""
+    winners = strengths == strengths.max(axis=0)
+    winner_counts = winners.sum(axis=0)
+    shares = winners / winner_counts
+    return (
+        (winners & (winner_counts == 1)).sum(axis=1),
+        (winners & (winner_counts > 1)).sum(axis=1),
+        shares.sum(axis=1),
+        (shares ** 2).sum(axis=1),
+    )
+
+
+def _simulate(base_codes: np.ndarray, deck_codes: np.ndarray, need: int,
+              iterations: Optional[int], time_budget: Optional[float], batch_size: int, seed) -> tuple:
+    """
+    Plays random runouts in vectorized batches until the iteration quota or
+    the time budget is used up. Returns the raw tallies so results from
+    several workers can be summed.
+    """
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    rng = np.random.default_rng(seed)
+    num_players = len(base_codes)
+
+    wins = np.zeros(num_players, dtype=np.int64)
+    ties = np.zeros(num_players, dtype=np.int64)
+    share_sum = np.zeros(num_players)
+    share_sq_sum = np.zeros(num_players)
+    done = 0
+
+    while iterations is None or done < iterations:
+        batch = batch_size if iterations is None else min(batch_size, iterations - done)
+
+        # Draw `need` distinct cards per runout from the remaining deck
+        if need:
+            picks = rng.random((batch, len(deck_codes))).argpartition(need - 1, axis=1)[:, :need]
+            runouts = deck_codes[picks]
+        else:
+            runouts = np.empty((batch, 0), dtype=deck_codes.dtype)
+
+        batch_wins, batch_ties, batch_shares, batch_shares_sq = _tally(BatchEvaluator.evaluate_runouts(base_codes, runouts))
+        wins += batch_wins
+        ties += batch_ties
+        share_sum += batch_shares
+        share_sq_sum += batch_shares_sq
+        done += batch
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    return done, wins, ties, share_sum, share_sq_sum
+
+
+class EquityCalculator:
+    def __init__(self, iterations: int = 20000, time_budget: Optional[float] = None,
+                 workers: Optional[int] = None, batch_size: int = 4096,
+                 confidence: float = 0.95, seed: Optional[int] = None,
+                 exact_threshold: int = 25000):
+        """
+        iterations: default number of random runouts per calculation
+        time_budget: default wall-clock limit in seconds (checked between batches)
+        workers: processes to split the runouts across; None or 1 runs in-process
+        exact_threshold: enumerate every runout instead of sampling when there are at most this many
+        """
+        self.iterations = iterations
+        self.exact_threshold = exact_threshold
+        self.time_budget = time_budget
+        self.workers = workers
+        self.batch_size = batch_size
+        self.confidence = confidence
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @staticmethod
+    def _validate(hole_cards: List[List[int]], board: List[int], dead: List[int]):
+        if not 2 <= len(hole_cards) <= 6:
+            raise ValueError("Equity needs between 2 and 6 players")
+        if any(len(hole) != 2 for hole in hole_cards):
+            raise ValueError("Each player needs exactly 2 hole cards")
+        if len(board) > 5:
+            raise ValueError("Board cannot have more than 5 cards")
+
+        known = [code for hole in hole_cards for code in hole] + board + dead
+        if any(not 0 <= code < 52 for code in known):
+            raise ValueError("Invalid card code")
+        if len(set(known)) != len(known):
+            raise ValueError("Duplicate cards between hole cards, board and dead cards")
+
+    def calculate(self, hole_cards: Sequence[Sequence], board: Optional[Sequence] = None,
+                  dead_cards: Optional[Sequence] = None, iterations: Optional[int] = None,
+                  time_budget: Optional[float] = None, exact: Optional[bool] = None) -> dict:
+        """
+        Computes each player's equity over runouts of the remaining board.
+        hole_cards holds one pair of cards (Card objects or codes) per player.
+        exact=None enumerates every runout when there are no more than
+        exact_threshold of them and samples otherwise; True/False forces a mode.
+        When sampling, passing only time_budget samples until it runs out.
+        Returns a dict with the number of runouts played and per-player
+        win/tie rates, equity and a confidence interval on the equity.
+        """
+        holes = [to_codes(hole) for hole in hole_cards]
+        board_codes = to_codes(board)
+        dead_codes = to_codes(dead_cards)
+        self._validate(holes, board_codes, dead_codes)
+
+        known = set(code for hole in holes for code in hole) | set(board_codes) | set(dead_codes)
+        deck = np.array([code for code in range(52) if code not in known], dtype=np.int64)
+        need = 5 - len(board_codes)
+        if len(deck) < need:
+            raise ValueError("Not enough cards left to complete the board")
+
+        # Hole cards plus the known board are shared by every runout
+        base = np.array([hole + board_codes for hole in holes], dtype=np.int64)
+
+        if exact is None:
+            exact = math.comb(len(deck), need) <= self.exact_threshold
+        if exact:
+            return self._enumerate(base, deck, need)
+
+        # A time budget given on its own runs until it expires, uncapped by the default iteration count
+        if iterations is None and time_budget is None:
+            iterations = self.iterations
+        time_budget = time_budget if time_budget is not None else self.time_budget
+        if iterations is None and time_budget is None:
+            raise ValueError("Either an iteration budget or a time budget is required")
+
+        if self.workers and self.workers > 1 and (iterations is None or iterations > self.batch_size):
+            # Split the quota across processes; with only a time budget every worker runs until it expires
+            if iterations is None:
+                quotas = [None] * self.workers
+            else:
+                chunk = math.ceil(iterations / self.workers)
+                quotas = [min(chunk, iterations - i * chunk) for i in range(self.workers) if iterations - i * chunk > 0]
+            executor = self._get_executor()
+            seeds = self.seed_sequence.spawn(len(quotas))
+            futures = [
+                executor.submit(_simulate, base, deck, need, quota, time_budget, self.batch_size, seed)
+                for quota, seed in zip(quotas, seeds)
+            ]
+            tallies = [future.result() for future in futures]
+        else:
+            tallies = [_simulate(base, deck, need, iterations, time_budget,
+                                 self.batch_size, self.seed_sequence.spawn(1)[0])]
+
+        done = sum(t[0] for t in tallies)
+        wins = sum(t[1] for t in tallies)
+        ties = sum(t[2] for t in tallies)
+        share_sum = sum(t[3] for t in tallies)
+        share_sq_sum = sum(t[4] for t in tallies)
+
+        return self._build_result(done, wins, ties, share_sum, share_sq_sum, exact=False)
+
+    def _enumerate(self, base: np.ndarray, deck: np.ndarray, need: int) -> dict:
+        """Exact equity over every possible runout, scored in chunks of batch_size"""
+        runouts = np.array(list(combinations(deck.tolist(), need)), dtype=np.int64).reshape(math.comb(len(deck), need), need)
+
+        num_players = len(base)
+        wins = np.zeros(num_players, dtype=np.int64)
+        ties = np.zeros(num_players, dtype=np.int64)
+        share_sum = np.zeros(num_players)
+        share_sq_sum = np.zeros(num_players)
+
+        for start in range(0, len(runouts), self.batch_size):
+            chunk = runouts[start:start + self.batch_size]
+            chunk_wins, chunk_ties, chunk_shares, chunk_shares_sq = _tally(BatchEvaluator.evaluate_runouts(base, chunk))
+            wins += chunk_wins
+            ties += chunk_ties
+            share_sum += chunk_shares
+            share_sq_sum += chunk_shares_sq
+
+        return self._build_result(len(runouts), wins, ties, share_sum, share_sq_sum, exact=True)
+
+    def _build_result(self, runouts: int, wins, ties, share_sum, share_sq_sum, exact: bool) -> dict:
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        players = []
+        for i in range(len(wins)):
+            equity = share_sum[i] / runouts
+            if exact:
+                margin = 0.0
+            else:
+                variance = max(share_sq_sum[i] / runouts - equity ** 2, 0.0)
+                margin = z * math.sqrt(variance / runouts)
+            players.append({
+                "win": float(wins[i] / runouts),
+                "tie": float(ties[i] / runouts),
+                "equity": float(equity),
+                "confidence_interval": (float(max(equity - margin, 0.0)), float(min(equity + margin, 1.0))),
+            })
+
+        return {
+            "runouts": runouts,
+            "exact": exact,
+            "players": players,
+        }
+
@@ -4,6 +4,7 @@ from collections import Counter
 from itertools import combinations
 from .card import Card
 from .player import Player 
+from .lookup_evaluator import LookupEvaluator
 
 class HandRank(Enum):
     HIGH_CARD = 0
@@ -18,12 +19,56 @@ class HandRank(Enum):
     ROYAL_FLUSH = 9
 
 class HandEvaluator:
+    # Number of leading rank slots in a strength that are primary values (the rest are kickers)
+    _PRIMARY_COUNTS = {
+        HandRank.HIGH_CARD: 0,
+        HandRank.PAIR: 1,
+        HandRank.TWO_PAIR: 2,
+        HandRank.THREE_OF_A_KIND: 1,
+        HandRank.STRAIGHT: 1,
+        HandRank.FLUSH: 0,
+        HandRank.FULL_HOUSE: 2,
+        HandRank.FOUR_OF_A_KIND: 1,
+        HandRank.STRAIGHT_FLUSH: 1,
+    }
+
+    @staticmethod
+    def hand_strength(pocket_cards: List['Card'], community_cards: List['Card']) -> int:
+        """
+        Scores the best 5-card hand as a single integer; a higher strength wins
+        and equal strengths split the pot.
+        """
+        # Not memoized: a cache hit costs more than the table lookup (see simulate.py --eval-bench)
+        return LookupEvaluator.evaluate([card.code for card in pocket_cards + community_cards])
+
     @staticmethod
     def evaluate_hand(pocket_cards: List['Card'], community_cards: List['Card']) -> Tuple[HandRank, List[int], List[int]]:
         """
         Evaluates the best possible 5-card hand from the given pocket and community cards.
         Returns a tuple of (HandRank, primary_values, kicker_values)
         """
+        if len(pocket_cards) + len(community_cards) < 5:
+            return None, [], []
+        return HandEvaluator.decode_strength(HandEvaluator.hand_strength(pocket_cards, community_cards))
+
+    @staticmethod
+    def decode_strength(strength: int) -> Tuple[HandRank, List[int], List[int]]:
+        """Splits an integer strength back into (HandRank, primary_values, kicker_values)"""
+        rank = HandRank(LookupEvaluator.category(strength))
+        values = LookupEvaluator.values(strength)
+
+        if rank == HandRank.STRAIGHT_FLUSH and values[0] == 14:
+            return HandRank.ROYAL_FLUSH, [14, 13, 12, 11, 10], []
+
+        primary_count = HandEvaluator._PRIMARY_COUNTS[rank]
+        return rank, values[:primary_count], values[primary_count:]
+
+    @staticmethod
+    def _evaluate_hand_combinations(pocket_cards: List['Card'], community_cards: List['Card']) -> Tuple[HandRank, List[int], List[int]]:
+        """
+        Reference evaluator that scores all 5-card combinations one by one.
+        Slow, but kept to cross-check the lookup tables.
+        """
         all_cards = pocket_cards + community_cards
         best_hand = None
         best_rank = None
@@ -152,6 +197,10 @@ class HandEvaluator:
         def values_to_str(values: List[int]) -> str:
             return ", ".join(value_to_name[v] for v in values)
 
+        # Hands read mid-deal (fewer than 5 cards) may not have kickers yet
+        def with_kickers(description: str, kickers: List[int], noun: str) -> str:
+            return f"{description} with {values_to_str(kickers)} {noun}" if kickers else description
+
         if rank == HandRank.ROYAL_FLUSH:
             return "Royal Flush"
             
@@ -159,7 +208,7 @@ class HandEvaluator:
             return f"Straight Flush, {value_to_name[primary_values[0]]} high"
             
         elif rank == HandRank.FOUR_OF_A_KIND:
-            return f"Four of a Kind, {value_to_name[primary_values[0]]}s with {value_to_name[kicker_values[0]]} kicker"
+            return with_kickers(f"Four of a Kind, {value_to_name[primary_values[0]]}s", kicker_values, "kicker")
             
         elif rank == HandRank.FULL_HOUSE:
             return f"Full House, {value_to_name[primary_values[0]]}s full of {value_to_name[primary_values[1]]}s"
@@ -171,13 +220,13 @@ class HandEvaluator:
             return f"Straight, {value_to_name[primary_values[0]]} high"
             
         elif rank == HandRank.THREE_OF_A_KIND:
-            return f"Three of a Kind, {value_to_name[primary_values[0]]}s with {values_to_str(kicker_values)} kickers"
+            return with_kickers(f"Three of a Kind, {value_to_name[primary_values[0]]}s", kicker_values, "kickers")
             
         elif rank == HandRank.TWO_PAIR:
-            return f"Two Pair, {value_to_name[primary_values[0]]}s and {value_to_name[primary_values[1]]}s with {value_to_name[kicker_values[0]]} kicker"
+            return with_kickers(f"Two Pair, {value_to_name[primary_values[0]]}s and {value_to_name[primary_values[1]]}s", kicker_values, "kicker")
             
         elif rank == HandRank.PAIR:
-            return f"Pair of {value_to_name[primary_values[0]]}s with {values_to_str(kicker_values)} kickers"
+            return with_kickers(f"Pair of {value_to_name[primary_values[0]]}s", kicker_values, "kickers")
             
         else:  # HIGH_CARD
             return f"High Card, {values_to_str(kicker_values)}"
@@ -190,24 +239,23 @@ class HandEvaluator:
             - Dictionary mapping player indices to their share of the pot (1.0 for sole winner, 0.5 each for split pot, etc.)
             - Dictionary mapping player indices to their hand evaluation (rank, primary values, kickers)
         """
-        player_hands = []
+        player_strengths = {}
         for i, player in enumerate(players):
             if player and player.pocket:  # Only evaluate hands of players who haven't folded
-                result = HandEvaluator.evaluate_hand(player.pocket, community_cards)
-                player_hands.append((i, result))
+                player_strengths[i] = HandEvaluator.hand_strength(player.pocket, community_cards)
 
-        if not player_hands:
-            return {}
+        if not player_strengths:
+            return {}, {}
 
         # Find the best hand(s)
-        best_hand = max(player_hands, key=lambda x: (x[1][0].value, x[1][1], x[1][2]))
-        winners = [ph[0] for ph in player_hands if ph[1] == best_hand[1]]
+        best_strength = max(player_strengths.values())
+        winners = [i for i, strength in player_strengths.items() if strength == best_strength]
         
         # Calculate share for each winner
         share = 1.0 / len(winners)
         winner_shares = {winner: share for winner in winners}
         
         # Create dictionary of all player hands
-        player_hand_results = {ph[0]: ph[1] for ph in player_hands}
+        player_hand_results = {i: HandEvaluator.decode_strength(strength) for i, strength in player_strengths.items()}
         
         return winner_shares, player_hand_results
\ No newline at end of file
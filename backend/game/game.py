@@ -1,22 +1,31 @@
+from array import array
+from collections import deque
 from enum import Enum
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 from .player import Player
+from .table_state import STATUSES, TableState
+from .snapshot import HandSnapshot
+from .views import FrozenDict
+from .state_diff import diff_state
 from .status import Status
 from .deck import Deck
+from .shuffle_buffer import ShuffleBuffer
+from .controller import PlayerController
 import random
 from .evaluator import HandEvaluator
+from .equity import EquityCalculator
+from .incremental_evaluator import IncrementalHandState
+import logging
 import os
+import secrets
 import time
 
 class Pot:
-    def __init__(self):
-        self.amount = 0
-        self.eligible_players = set()
-        self.required_amount = 0 
-
-    def add_chips(self, amount: int, player_idx: int):
-        self.amount += amount
-        self.eligible_players.add(player_idx)
+    """One layer of the pot: the chips committed up to required_amount, and the live seats that can win them"""
+    def __init__(self, amount: int = 0, eligible_players: Optional[set] = None, required_amount: int = 0):
+        self.amount = amount
+        self.eligible_players = eligible_players if eligible_players is not None else set()
+        self.required_amount = required_amount
 
 class GameStage(Enum):
     PREFLOP = "preflop"
@@ -32,31 +41,85 @@ class Action(Enum):
     BET = "bet"
     RAISE = "raise"
 
+# Seat names by table size, counted clockwise from the button
+POSITION_NAMES = {
+    2: ("Button/Small Blind", "Big Blind"),
+    3: ("Button", "Small Blind", "Big Blind"),
+    4: ("Button", "Small Blind", "Big Blind", "Cutoff"),
+    5: ("Button", "Small Blind", "Big Blind", "UTG", "Cutoff"),
+    6: ("Button", "Small Blind", "Big Blind", "UTG", "UTG+1", "Cutoff")
+}
+
+STATE_VIEWERS = ("player", "bot", "spectator")
+# Recent views kept per viewer, for patches against a version a client already holds
+STATE_HISTORY = 32
+
 class TexasHoldem:
-    def __init__(self, player_names: List[str], player_controllers: Optional[List[object]] = None, starting_chips: int = 1000):
+    # Shared across tables; flop and turn all-ins are enumerated exactly, preflop is sampled
+    equity_calculator = EquityCalculator(iterations=20000, time_budget=0.25)
+
+    def __init__(self, player_names: List[str], player_controllers: Optional[List[Optional[PlayerController]]] = None, starting_chips: int = 1000,
+                 seed: Optional[int] = None, deal_source: Optional[ShuffleBuffer] = None,
+                 headless: bool = False, logger: Optional[logging.Logger] = None):
         self.player_controllers = player_controllers
 
-        self.deck = Deck()
+        # The table's own stream only draws one seed per hand; the deal and the
+        # bots' randomness are derived from that hand seed
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self.rng = random.Random(self.seed)
+        self.hand_seed = None
+        self.hand_number = 0
+        self.action_log = []  # (stage, player_idx, action, amount) for the current hand
+
+        # deal_source (a ShuffleBuffer) replaces the per-hand shuffle in simulations;
+        # its decks follow its own seed, so hand records then carry the deck order
+        self.deck = Deck(source=deal_source)
+
+        # Headless tables never sleep, print or prompt; their output goes to
+        # `logger` at DEBUG level and is only built when that level is enabled
+        self.headless = headless
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.bot_delay = 0 if headless else 15
+
         self.players = [Player(name, 200, True) for name in player_names]
         self.players[0].is_bot = False
+        # Stacks, contributions and seat status live in flat arrays and bitmasks; Players are views onto them
+        self.table = TableState.seat_players(self.players)
         self.sitting_out = []
         self.community_cards = []
         self.current_stage = GameStage.PREFLOP
         self.button_position = 0
         self.current_player_idx = 0
-        self.pots = [Pot()]  # Main pot is always first
+        self._pots = None  # Layered from the seats' commitments on first use; see pots
         self.current_bet = 0
         self.small_blind = 1
         self.big_blind = 2
-        self.all_in_players = set()  # Track players who are all-in
+        self.min_raise = self.big_blind
+        self.last_bettor_idx = None
+        self.hand_states = []  # Per-seat IncrementalHandState, updated as cards are dealt
+        # Deltas for undo(), newest last, and the steps undone since the last new one
+        self.undo_stack = []
+        self.redo_stack = []
+        # Bumped on every change; get_state_view() caches one view per viewer for the current version
+        self.version = 0
+        self._views = {}
+        self._view_history = {viewer: deque(maxlen=STATE_HISTORY) for viewer in STATE_VIEWERS}
+        # Called as listener(kind, data) for each table event: hand_started, action, table_comment, deal, showdown, undo
+        self.listeners: List[Callable[[str, dict], None]] = []
         
-    def reset_hand(self):
-        self.deck.reset()
+    def reset_hand(self, hand_seed: Optional[int] = None, deck_order: Optional[bytes] = None):
+        self.hand_seed = hand_seed if hand_seed is not None else self.rng.getrandbits(64)
+        self.hand_number += 1
+        self.action_log = []
+        self.undo_stack = []
+        self.redo_stack = []
+        self._touch()
+        self.deck.reset(self.hand_seed, deck_order)
         self.community_cards = []
+        self.hand_states = []
         self.current_stage = GameStage.PREFLOP
-        self.pots = [Pot()]
+        self._pots = None
         self.current_bet = 0
-        self.all_in_players = set()
         
         # We'll build new lists for players/controllers
         # to remove anyone who busts (chips < 2) from both.
@@ -80,53 +143,72 @@ class TexasHoldem:
                 self.sitting_out.append(player)
 
         # Replace the old lists with the new, filtered lists
+        if len(new_players) != len(self.players):
+            self.table = TableState.seat_players(new_players)
         self.players = new_players
         self.player_controllers = new_controllers
+        self.table.new_hand()
+
+        # Each bot's stream restarts from the hand seed, so a replayed hand sees the same bot choices
+        for player, controller in zip(self.players, self.player_controllers):
+            if isinstance(getattr(controller, "rng", None), random.Random):
+                controller.rng.seed(f"{self.hand_seed}/{player.name}")
 
 
+    @property
+    def street_contributions(self):
+        """Chips each seat has put in on the current street, indexed by seat"""
+        return self.table.street
+
+    @property
+    def all_in_players(self) -> set:
+        return set(self.table.seats(self.table.all_in_mask))
+
     def get_total_pot(self) -> int:
         return sum(pot.amount for pot in self.pots)
     
     def get_min_raise(self) -> int:
         return self.current_bet + self.min_raise
     
-    def create_side_pot(self, all_in_amount: int):
-        all_in_amounts = []
-        for i, player in enumerate(self.players):
-            if i in self.all_in_players:
-                contribution = self.street_contributions[i]
-                if contribution not in all_in_amounts:
-                    all_in_amounts.append(contribution)
-        all_in_amounts.sort()
-        
-        old_main_pot = self.pots[0]
-        self.pots = [old_main_pot]
-        
-        prev_amount = 0
-        for amount in all_in_amounts:
-            new_pot = Pot()
-            pot_size = 0
-            
-            for i, player in enumerate(self.players):
-                if player.is_active != Status.FOLDED:
-                    player_contribution = min(amount, self.street_contributions[i])
-                    if player_contribution > prev_amount:
-                        contribution_to_this_pot = player_contribution - prev_amount
-                        pot_size += contribution_to_this_pot
-                        if self.street_contributions[i] >= amount:
-                            new_pot.eligible_players.add(i)
-            
-            if prev_amount == 0:
-                self.pots[0].amount = pot_size
-                self.pots[0].eligible_players = new_pot.eligible_players
-            else:
-                new_pot.amount = pot_size
-                if pot_size > 0:
-                    self.pots.append(new_pot)
-            
-            prev_amount = amount
-        
-        return len(self.pots) > 1
+    @property
+    def pots(self) -> List[Pot]:
+        """
+        Main pot first, then side pots. Derived from each seat's total
+        commitment this hand and cached until chips are committed, a seat
+        folds or the state is rewound.
+        """
+        if self._pots is None:
+            self._pots = self._layer_pots()
+        return self._pots
+
+    def _layer_pots(self) -> List[Pot]:
+        # One layer per distinct all-in level, plus whatever was committed above the highest one.
+        # Folded seats' chips stay in the layers they reached but they are not eligible to win them.
+        table = self.table
+        committed = table.committed
+        live = table.live_mask
+        all_in = live & table.all_in_mask
+        levels = sorted({committed[i] for i in table.seats(all_in)})
+        top = max(committed)
+        if not levels or levels[-1] < top:
+            levels.append(top)
+
+        amounts = sorted(committed)
+        contenders = table.seats(live)
+        pots = []
+        below = 0  # seats whose whole commitment is in the layers so far
+        previous = 0
+        for level in levels:
+            amount = 0
+            while below < len(amounts) and amounts[below] <= level:
+                amount += amounts[below] - previous
+                below += 1
+            amount += (len(amounts) - below) * (level - previous)
+            if amount or not pots:
+                eligible = {i for i in contenders if committed[i] >= level or not all_in >> i & 1}
+                pots.append(Pot(amount, eligible, level))
+            previous = level
+        return pots
 
     def get_call_amount(self) -> int:
         player = self.players[self.current_player_idx]
@@ -140,21 +222,42 @@ class TexasHoldem:
         self.button_position = (self.button_position + 1) % len(self.players)
         
     def deal_hole_cards(self):
+        self.hand_states = [IncrementalHandState() for _ in self.players]
+
         for i in range(len(self.players)):
             player_idx = (self.button_position + i + 1) % len(self.players)
             card = self.deck.deal()
             if card:
                 self.players[player_idx].add_pocket_card(card)
+                self.hand_states[player_idx].add_card(card)
                 
         for i in range(len(self.players)):
             player_idx = (self.button_position + i + 1) % len(self.players)
             card = self.deck.deal()
             if card:
                 self.players[player_idx].add_pocket_card(card)
+                self.hand_states[player_idx].add_card(card)
+
+    def _add_community_card(self, card):
+        self.community_cards.append(card)
+        for i, state in enumerate(self.hand_states):
+            if self.players[i].is_active != Status.FOLDED:
+                state.add_card(card)
+
+    def _emit_deal(self):
+        if self.listeners:
+            self._emit("deal", {"stage": self.current_stage.value,
+                                "board": [card.code for card in self.community_cards]})
+
+    def get_hand_strength(self, player_idx: int) -> int:
+        """Current strength of a player's hand on the cards dealt so far"""
+        return self.hand_states[player_idx].strength
     
     def deal_flop(self):
         if self.current_stage != GameStage.PREFLOP:
             raise ValueError("Cannot deal flop - incorrect game stage")
+        self._push_undo(("deal", self.current_stage, self.deck.position, len(self.community_cards),
+                         [state.copy() for state in self.hand_states]))
             
         # Burn a card
         self.deck.deal()
@@ -163,13 +266,16 @@ class TexasHoldem:
         for _ in range(3):
             card = self.deck.deal()
             if card:
-                self.community_cards.append(card)
+                self._add_community_card(card)
                 
         self.current_stage = GameStage.FLOP
+        self._emit_deal()
         
     def deal_turn(self):
         if self.current_stage != GameStage.FLOP:
             raise ValueError("Cannot deal turn - incorrect game stage")
+        self._push_undo(("deal", self.current_stage, self.deck.position, len(self.community_cards),
+                         [state.copy() for state in self.hand_states]))
             
         # Burn a card
         self.deck.deal()
@@ -177,13 +283,16 @@ class TexasHoldem:
         # Deal turn card
         card = self.deck.deal()
         if card:
-            self.community_cards.append(card)
+            self._add_community_card(card)
             
         self.current_stage = GameStage.TURN
+        self._emit_deal()
         
     def deal_river(self):
         if self.current_stage != GameStage.TURN:
             raise ValueError("Cannot deal river - incorrect game stage")
+        self._push_undo(("deal", self.current_stage, self.deck.position, len(self.community_cards),
+                         [state.copy() for state in self.hand_states]))
             
         # Burn a card
         self.deck.deal()
@@ -191,59 +300,145 @@ class TexasHoldem:
         # Deal river card
         card = self.deck.deal()
         if card:
-            self.community_cards.append(card)
+            self._add_community_card(card)
             
         self.current_stage = GameStage.RIVER
+        self._emit_deal()
         
+    def get_hand_record(self) -> dict:
+        """Everything needed to replay the current hand: its seed, the starting stacks and the actions so far"""
+        return {
+            "table_seed": self.seed,
+            "hand_number": self.hand_number,
+            "hand_seed": self.hand_seed,
+            "button_position": self.button_position,
+            "players": [player.name for player in self.players],
+            "stacks": [player.preflop for player in self.players],
+            "actions": list(self.action_log),
+            "deck_order": self.deck.order.hex() if self.deck.source is not None else None
+        }
+
+    def replay_hand(self, record: dict):
+        """
+        Re-deals a recorded hand and re-applies its actions, dealing each
+        street as the log reaches it. The table must seat the recorded players.
+        """
+        if [player.name for player in self.players] != record["players"]:
+            raise ValueError("Recorded players do not match this table")
+        for player, stack in zip(self.players, record["stacks"]):
+            player.chips = stack
+        self.button_position = (record["button_position"] - 1) % len(self.players)
+        deck_order = bytes.fromhex(record["deck_order"]) if record.get("deck_order") else None
+        self.start_new_hand(record["hand_seed"], deck_order)
+        self.hand_number = record["hand_number"]
+
+        streets = [GameStage.PREFLOP, GameStage.FLOP, GameStage.TURN, GameStage.RIVER]
+        deal = {GameStage.PREFLOP: self.deal_flop, GameStage.FLOP: self.deal_turn, GameStage.TURN: self.deal_river}
+        for stage, player_idx, action, amount in record["actions"]:
+            while streets.index(self.current_stage) < streets.index(GameStage(stage)):
+                deal[self.current_stage]()
+                self.reset_street_bets()
+            if player_idx != self.current_player_idx:
+                raise ValueError(f"Recorded action by seat {player_idx} but seat {self.current_player_idx} is to act")
+            self.process_action(Action(action), amount)
+
+    def snapshot(self) -> HandSnapshot:
+        """
+        The current hand's mutable state (stacks, contributions, board, deck
+        position and whose turn it is; pots follow from the contributions)
+        for look-ahead search: play
+        forward from here, then restore() to branch again.
+        """
+        table = self.table
+        return HandSnapshot(
+            names=tuple(table.names),
+            seats=table.pack(),
+            all_in_mask=table.all_in_mask,
+            pockets=tuple(None if pocket is None else tuple(pocket) for pocket in table.pockets),
+            board=tuple(self.community_cards),
+            deck_order=bytes(self.deck.order),
+            deck_position=self.deck.position,
+            stage=self.current_stage,
+            button_position=self.button_position,
+            current_player_idx=self.current_player_idx,
+            current_bet=self.current_bet,
+            min_raise=self.min_raise,
+            last_bettor_idx=self.last_bettor_idx,
+            hand_seed=self.hand_seed,
+            hand_number=self.hand_number,
+            actions=tuple(self.action_log)
+        )
+
+    def restore(self, snapshot: HandSnapshot):
+        """Puts the table back to a snapshot() taken with the same players seated; controllers are untouched"""
+        table = self.table
+        if tuple(table.names) != snapshot.names:
+            raise ValueError("Snapshot was taken with different players seated")
+        table.unpack(snapshot.seats, snapshot.all_in_mask)
+        table.pockets[:] = [None if pocket is None else list(pocket) for pocket in snapshot.pockets]
+
+        self.community_cards = list(snapshot.board)
+        self.deck.order[:] = snapshot.deck_order
+        self.deck.position = snapshot.deck_position
+        self._pots = None
+
+        self.current_stage = snapshot.stage
+        self.button_position = snapshot.button_position
+        self.current_player_idx = snapshot.current_player_idx
+        self.current_bet = snapshot.current_bet
+        self.min_raise = snapshot.min_raise
+        self.last_bettor_idx = snapshot.last_bettor_idx
+        self.hand_seed = snapshot.hand_seed
+        self.hand_number = snapshot.hand_number
+        self.action_log = list(snapshot.actions)
+        self.undo_stack = []
+        self.redo_stack = []
+        self._touch()
+        # Hand strengths are rebuilt from the cards rather than stored
+        self.hand_states = [IncrementalHandState((pocket or []) + self.community_cards) for pocket in table.pockets]
+
     def get_active_players(self) -> List[Player]:
-        return [player for player in self.players if player.is_active == Status.ACTIVE]
+        return [self.players[i] for i in self.table.seats(self.table.active_mask)]
     
     def get_non_folded_players(self) -> List[Player]:
-        return [player for player in self.players if player.is_active != Status.FOLDED]
-        
-    def get_player_position(self, player_idx: int) -> str:
-        positions = {
-            2: {
-                0: "Button/Small Blind",
-                1: "Big Blind"
-            },
-            3: {
-                0: "Button",
-                1: "Small Blind",
-                2: "Big Blind"
-            },
-            4: {
-                0: "Button",
-                1: "Small Blind",
-                2: "Big Blind",
-                3: "Cutoff"
-            },
-            5: {
-                0: "Button",
-                1: "Small Blind",
-                2: "Big Blind",
-                3: "UTG",
-                4: "Cutoff"
-            },
-            6: {
-                0: "Button",
-                1: "Small Blind",
-                2: "Big Blind",
-                3: "UTG",
-                4: "UTG+1",
-                5: "Cutoff"
-            }
+        return [self.players[i] for i in self.table.seats(self.table.live_mask)]
+
+    def get_all_in_equity(self) -> Optional[dict]:
+        """
+        Each remaining player's equity over the runouts of the current board,
+        meant to be read once everyone is all-in and before the board is dealt.
+        Returns None when fewer than two players are still in the hand.
+        """
+        contenders = [i for i, player in enumerate(self.players)
+                      if player.is_active != Status.FOLDED and player.pocket]
+        if len(contenders) < 2:
+            return None
+
+        result = self.equity_calculator.calculate(
+            [self.players[i].pocket for i in contenders], self.community_cards
+        )
+        return {
+            "exact": result["exact"],
+            "runouts": result["runouts"],
+            "players": [{
+                "player_idx": i,
+                "name": self.players[i].name,
+                "equity": player_result["equity"],
+                "win": player_result["win"],
+                "tie": player_result["tie"]
+            } for i, player_result in zip(contenders, result["players"])]
         }
         
+    def get_player_position(self, player_idx: int) -> str:
         num_players = len(self.players)
         if num_players < 2 or num_players > 6:
             raise ValueError("Invalid number of players. Must be between 2 and 6.")
             
         relative_position = (player_idx - self.button_position) % num_players
-        return positions[num_players][relative_position]
+        return POSITION_NAMES[num_players][relative_position]
         
-    def start_new_hand(self):
-        self.reset_hand()
+    def start_new_hand(self, hand_seed: Optional[int] = None, deck_order: Optional[bytes] = None):
+        self.reset_hand(hand_seed, deck_order)
         self.move_button()
         self.deal_hole_cards()
         
@@ -254,32 +449,30 @@ class TexasHoldem:
         # Small blind
         sb_player = self.players[sb_pos]
         sb_amount = min(self.small_blind, sb_player.chips)
-        sb_player.chips -= sb_amount
-        self.pots[0].add_chips(sb_amount, sb_pos)
+        self.table.commit(sb_pos, sb_amount)
         
         if sb_amount < self.small_blind:
-            self.all_in_players.add(sb_pos)
+            self.table.mark_all_in(sb_pos)
         
         # Big blind
         bb_player = self.players[bb_pos]
         bb_amount = min(self.big_blind, bb_player.chips)
-        bb_player.chips -= bb_amount
-        self.pots[0].add_chips(bb_amount, bb_pos)
+        self.table.commit(bb_pos, bb_amount)
         
         if bb_amount < self.big_blind:
-            self.all_in_players.add(bb_pos)
-            if bb_amount < sb_amount:
-                self.create_side_pot(bb_amount)
+            self.table.mark_all_in(bb_pos)
         
         self.current_bet = max(sb_amount, bb_amount)
         
         self.current_player_idx = (self.button_position + 3) % len(self.players)
         self.last_bettor_idx = None
         self.min_raise = self.big_blind
-        self.street_contributions = {i: 0 for i in range(len(self.players))}
-        
-        self.street_contributions[sb_pos] = sb_amount
-        self.street_contributions[bb_pos] = bb_amount
+        self._pots = None
+        self._touch()
+        if self.listeners:
+            self._emit("hand_started", {"hand_number": self.hand_number, "button_position": self.button_position,
+                                        "names": [player.name for player in self.players],
+                                        "chips": [player.chips for player in self.players]})
         
     def get_available_actions(self) -> List[Action]:
         actions = [Action.FOLD]
@@ -300,6 +493,8 @@ class TexasHoldem:
 
     def process_action(self, action: Action, amount: Optional[int] = None) -> bool:
         player = self.players[self.current_player_idx]
+        log_entry = (self.current_stage.value, self.current_player_idx, action.value, amount)
+        undo_entry = self._action_delta(action, amount)
         
         if action == Action.FOLD:
             player.is_active = Status.FOLDED
@@ -307,52 +502,17 @@ class TexasHoldem:
         elif action == Action.CHECK:
             if self.current_bet != 0:
                 raise ValueError("Cannot check when there's a bet")
-            self.street_contributions[self.current_player_idx] = 0
                 
         elif action == Action.CALL:
             call_amount = self.get_call_amount()
-            current_contribution = self.street_contributions[self.current_player_idx]
             
             if call_amount >= player.chips:
-                all_in_amount = player.chips
-                player.chips = 0
-                
-                remaining_to_add = all_in_amount
-                total_contribution = current_contribution
-                
-                if self.pots[0].required_amount > 0:
-                    main_pot_contribution = min(remaining_to_add, self.pots[0].required_amount - current_contribution)
-                    if main_pot_contribution > 0:
-                        self.pots[0].add_chips(main_pot_contribution, self.current_player_idx)
-                        remaining_to_add -= main_pot_contribution
-                        total_contribution += main_pot_contribution
-                
-                for pot in self.pots[1:]:
-                    if remaining_to_add <= 0:
-                        break
-                    if pot.required_amount > total_contribution:
-                        side_pot_contribution = min(remaining_to_add, pot.required_amount - total_contribution)
-                        if side_pot_contribution > 0:
-                            pot.add_chips(side_pot_contribution, self.current_player_idx)
-                            remaining_to_add -= side_pot_contribution
-                            total_contribution += side_pot_contribution
-                
-                if remaining_to_add > 0:
-                    self.pots[0].add_chips(remaining_to_add, self.current_player_idx)
-                    total_contribution += remaining_to_add
-                
-                self.street_contributions[self.current_player_idx] = total_contribution
-                self.all_in_players.add(self.current_player_idx)
+                # All-in for the call or less; the side pots follow from the commitments
+                self.table.commit(self.current_player_idx, player.chips)
+                self.table.mark_all_in(self.current_player_idx)
                 player.is_active = Status.ALL_IN
-                
-                if total_contribution < self.current_bet:
-                    original_bet = self.current_bet
-                    self.create_side_pot(total_contribution)
-                    self.current_bet = original_bet
             else:
-                player.chips -= call_amount
-                self.pots[0].add_chips(call_amount, self.current_player_idx)
-                self.street_contributions[self.current_player_idx] += call_amount
+                self.table.commit(self.current_player_idx, call_amount)
                 
         elif action in (Action.BET, Action.RAISE):
             if not amount:
@@ -374,89 +534,170 @@ class TexasHoldem:
                 amount = current_contribution + to_add
             
             if to_add >= player.chips:
-                all_in_amount = player.chips
-                player.chips = 0
-                self.pots[0].add_chips(all_in_amount, self.current_player_idx)
-                total_contribution = current_contribution + all_in_amount
-                self.street_contributions[self.current_player_idx] = total_contribution
-                self.current_bet = total_contribution
-                self.all_in_players.add(self.current_player_idx)
+                self.table.commit(self.current_player_idx, to_add)
+                # A short all-in never lowers the bet the others face
+                self.current_bet = max(self.current_bet, amount)
+                self.table.mark_all_in(self.current_player_idx)
                 player.is_active = Status.ALL_IN
                 self.last_bettor_idx = self.current_player_idx
-                
-                if total_contribution < amount:
-                    original_bet = amount 
-                    self.create_side_pot(total_contribution)
-                    self.current_bet = original_bet
             else:
-                player.chips -= to_add
-                self.pots[0].add_chips(to_add, self.current_player_idx)
-                self.street_contributions[self.current_player_idx] += to_add
+                self.table.commit(self.current_player_idx, to_add)
                 self.current_bet = amount
                 self.last_bettor_idx = self.current_player_idx
                 self.min_raise = to_add
                 
+        # Logged as requested, once the action has been accepted
+        self.action_log.append(log_entry)
+        self._push_undo(undo_entry)
+        self._pots = None
         self.move_to_next_player()
+        if self.listeners:
+            seat = undo_entry[1]
+            self._emit("action", {"player_idx": seat, "stage": log_entry[0], "action": action.value,
+                                  "amount": amount, "street_total": self.table.street[seat],
+                                  "chips": self.table.stacks[seat]})
         return self.is_betting_round_complete()
 
+    def _action_delta(self, action: Action, amount: Optional[int]) -> tuple:
+        # Everything process_action can change: the acting seat and the betting pointers (pots are derived)
+        table = self.table
+        seat = self.current_player_idx
+        return ("action", seat, table.stacks[seat], table.street[seat], table.committed[seat], table.status[seat],
+                table.all_in_mask, self.current_bet, self.min_raise, self.last_bettor_idx, action, amount)
+
+    def _push_undo(self, entry: tuple):
+        self.undo_stack.append(entry)
+        self.redo_stack.clear()
+        self._touch()
+
+    def _touch(self):
+        """Marks the state as changed"""
+        self.version += 1
+        self._views.clear()
+
+    def _emit(self, kind: str, data: dict):
+        # Every event carries the state version it leads to, so a listener's client can ask for a patch
+        data["state_version"] = self.version
+        for listener in self.listeners:
+            listener(kind, data)
+
+    def undo(self):
+        """
+        Reverts the last action, street deal, street reset or showdown payout
+        of the current hand exactly, so search can walk a game tree on one
+        table. Raises ValueError when there is nothing left to undo.
+        """
+        if not self.undo_stack:
+            raise ValueError("Nothing to undo")
+        entry = self.undo_stack.pop()
+        kind = entry[0]
+        self._touch()
+        table = self.table
+
+        if kind == "action":
+            (_, seat, stack, street, committed, status, all_in_mask, current_bet, min_raise,
+             last_bettor_idx, action, amount) = entry
+            table.stacks[seat] = stack
+            table.street[seat] = street
+            table.committed[seat] = committed
+            table.set_status(seat, status)
+            table.all_in_mask = all_in_mask
+            self.current_bet = current_bet
+            self.min_raise = min_raise
+            self.last_bettor_idx = last_bettor_idx
+            self.current_player_idx = seat
+            self._pots = None
+            self.action_log.pop()
+            redo = ("action", action, amount)
+        elif kind == "deal":
+            _, stage, deck_position, board_size, hand_states = entry
+            self.current_stage = stage
+            self.deck.position = deck_position
+            del self.community_cards[board_size:]
+            self.hand_states = hand_states
+            redo = ("deal",)
+        elif kind == "showdown":
+            _, stage, stacks = entry
+            self.current_stage = stage
+            table.stacks[:] = stacks
+            self._pots = None
+            redo = ("showdown",)
+        else:
+            _, street, current_bet, last_bettor_idx, current_player_idx = entry
+            table.street = street
+            self.current_bet = current_bet
+            self.last_bettor_idx = last_bettor_idx
+            self.current_player_idx = current_player_idx
+            redo = ("street",)
+        self.redo_stack.append(redo)
+        if self.listeners:
+            self._emit("undo", {"step": kind})
+
+    def redo(self):
+        """Re-applies the last undone step; any new action, deal, street reset or showdown clears the redo stack"""
+        if not self.redo_stack:
+            raise ValueError("Nothing to redo")
+        step = self.redo_stack.pop()
+        pending = self.redo_stack
+        self.redo_stack = []
+        try:
+            if step[0] == "deal":
+                {GameStage.PREFLOP: self.deal_flop, GameStage.FLOP: self.deal_turn,
+                 GameStage.TURN: self.deal_river}[self.current_stage]()
+            elif step[0] == "street":
+                self.reset_street_bets()
+            elif step[0] == "showdown":
+                self.resolve_showdown()
+            else:
+                self.process_action(step[1], step[2])
+        finally:
+            self.redo_stack = pending
+
         
     def move_to_next_player(self):
-        if len(self.get_active_players()) == 0:
+        if not self.table.active_mask:
             return
-        
-        original_idx = self.current_player_idx
-        while True:
-            self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
-            if self.players[self.current_player_idx].is_active == Status.ACTIVE:
-                break
-            if self.current_player_idx == original_idx:
-                break
+        self._touch()
+        self.current_player_idx = self.table.next_seat(self.table.active_mask, self.current_player_idx + 1)
                 
     def is_betting_round_complete(self) -> bool:
-        active_players = self.get_non_folded_players()
-        non_allin_players = [p for p in active_players if self.players.index(p) not in self.all_in_players]
+        table = self.table
+        live = table.live_mask
+        non_allin = live & ~table.all_in_mask
         
         # If only one player remains, betting is complete
-        if len(active_players) == 1:
+        if live & (live - 1) == 0:
             return True
         
         # If no non-all-in players remain, betting is complete
-        if len(non_allin_players) == 0:
+        if not non_allin:
             return True
         
         # If only one non-all-in player remains and there's no current bet, betting is complete
-        if len(non_allin_players) == 1 and self.current_bet == 0:
+        if non_allin & (non_allin - 1) == 0 and self.current_bet == 0:
             return True
 
-        first_to_act = None
+        can_act = table.can_act_mask
         if self.current_stage != GameStage.PREFLOP:
-            idx = (self.button_position + 1) % len(self.players)
-            while first_to_act is None:
-                if self.players[idx].is_active == Status.ACTIVE and idx not in self.all_in_players:
-                    first_to_act = idx
-                idx = (idx + 1) % len(self.players)
-                # If we've gone through all players and none are active and not all-in,
-                # then betting is complete
-                if idx == (self.button_position + 1) % len(self.players):
-                    return True
+            # The search covers the seats after the button up to, but not including, the button;
+            # if none of them can act, betting is complete
+            first_to_act = table.next_seat(can_act & ~(1 << self.button_position), self.button_position + 1)
+            if first_to_act is None:
+                return True
         else:
             first_to_act = (self.button_position + 3) % len(self.players) 
         
         bb_pos = (self.button_position + 2) % len(self.players)
         
         if self.current_bet == 0:
-            return (self.current_player_idx == first_to_act and 
-                    all(self.street_contributions[i] >= 0 for i in range(len(self.players)) 
-                        if self.players[i].is_active == Status.ACTIVE and i not in self.all_in_players))
+            return self.current_player_idx == first_to_act
         else:
-            all_matched = all(self.street_contributions[i] == self.current_bet 
-                            for i in range(len(self.players)) 
-                            if self.players[i].is_active == Status.ACTIVE and i not in self.all_in_players)
+            street = table.street
+            all_matched = all(street[i] == self.current_bet for i in table.seats(can_act))
             
             if (self.current_stage == GameStage.PREFLOP and 
                 self.current_bet == self.big_blind and 
-                self.players[bb_pos].is_active == Status.ACTIVE and
-                bb_pos not in self.all_in_players and
+                can_act >> bb_pos & 1 and
                 all_matched and 
                 self.last_bettor_idx is None): 
                 return self.current_player_idx != bb_pos
@@ -464,78 +705,58 @@ class TexasHoldem:
             return all_matched
                        
     def reset_street_bets(self):
+        self._push_undo(("street", array("q", self.table.street), self.current_bet,
+                         self.last_bettor_idx, self.current_player_idx))
         self.current_bet = 0
         self.last_bettor_idx = None
-        self.street_contributions = {i: 0 for i in range(len(self.players))}
-        
-        # Check if all remaining players are all-in
-        active_players = self.get_non_folded_players()
-        non_allin_players = [p for p in active_players if self.players.index(p) not in self.all_in_players]
+        self.table.new_street()
         
         # If no non-all-in players remain or only one remains, no need to set the current player
-        if len(non_allin_players) <= 1:
+        non_allin = self.table.live_mask & ~self.table.all_in_mask
+        if non_allin & (non_allin - 1) == 0:
             return
         
-        # Start from the seat immediately after the button
-        next_idx = (self.button_position + 1) % len(self.players)
-
-        # Skip over any players who have folded or are all-in
-        while self.players[next_idx].is_active == Status.FOLDED or next_idx in self.all_in_players:
-            next_idx = (next_idx + 1) % len(self.players)
-            # If we've gone full circle and everyone is folded or all-in, break
-            if next_idx == (self.button_position + 1) % len(self.players):
-                break
-
-        self.current_player_idx = next_idx
+        # Start from the seat immediately after the button, skipping folded and all-in players
+        self.current_player_idx = self.table.next_seat(non_allin, self.button_position + 1)
 
 
     def play_betting_round(self):
         while True:
             player = self.players[self.current_player_idx]
 
-            # Skip folded players
-            if player.is_active == Status.FOLDED:
+            # Skip folded and all-in players
+            if not self.table.can_act_mask >> self.current_player_idx & 1:
                 self.move_to_next_player()
                 continue
 
             # BOT or HUMAN?
             bot_controller = self.player_controllers[self.current_player_idx]
             if bot_controller is not None:
-                # 1) Get the game state as a dict
-                game_state = self.get_game_state_json()
+                # 1) Get the game state as a dict (with this bot's own cards)
+                game_state = self.get_bot_state_json()
 
                 # 2) Ask the bot for a decision
-                decision = bot_controller.get_decision(game_state)
+                decision = bot_controller.get_decision(game_state, self.get_min_raise())
 
-                # 3) Validate the decision
-                action_str = decision.get("action", "fold")
-                amount = decision.get("amount", 0)
-                print("\n" + "="*50)
-                print(self.get_hand_summary())
-                print(f"\nCurrent player: {player.name}")
-                print(self.get_betting_info())
-                print(f"Available actions: {[a.value for a in self.get_available_actions()]}")
-                print(f"Action: {action_str}")
-                print(f"Amount bet {amount}")
-                time.sleep(15) 
-                
-
-                try:
-                    action_enum = Action(action_str)
-                except ValueError:
-                    # If bot's action not recognized, default to fold
-                    action_enum = Action.FOLD
-                    amount = 0
-
-                # Ensure the action is actually allowed
-                if action_enum not in self.get_available_actions():
-                    action_enum = Action.FOLD
-                    amount = 0
+                # 3) Validate and process it
+                if self.verbose:
+                    self._log("\n" + "="*50)
+                    self._log(self.get_hand_summary())
+                    self._log(f"\nCurrent player: {player.name}")
+                    self._log(self.get_betting_info())
+                    self._log(f"Available actions: {[a.value for a in self.get_available_actions()]}")
+                    self._log(f"Action: {decision.get('action', 'fold')}")
+                    self._log(f"Amount bet {decision.get('amount', 0)}")
+                if self.bot_delay:
+                    time.sleep(self.bot_delay)
 
-                # Now process the action
-                if self.process_action(action_enum, amount):
+                _, _, betting_complete = self.apply_decision(decision)
+                if betting_complete:
                     return
             else:
+                if self.headless:
+                    raise ValueError(f"Headless play needs a controller for {player.name}")
+
                 # HUMAN flow (same as before)
                 print("\n" + "="*50)
                 print(self.get_hand_summary())
@@ -563,12 +784,37 @@ class TexasHoldem:
                         print(f"Error: {str(e)}")
                         continue
 
-                    
+    def apply_decision(self, decision: dict) -> Tuple[Action, Optional[int], bool]:
+        """
+        Processes a controller's decision for the current player. Unknown or
+        unavailable actions become a fold, and bet/raise amounts are lifted to
+        the legal minimum. Returns the action taken, its amount and whether
+        the betting round is complete.
+        """
+        try:
+            action = Action(decision.get("action", "fold"))
+            amount = int(decision.get("amount") or 0)
+        except (ValueError, TypeError):
+            action, amount = Action.FOLD, 0
+
+        if action not in self.get_available_actions():
+            action, amount = Action.FOLD, 0
+        if action == Action.RAISE:
+            amount = max(amount, self.get_min_raise())
+        elif action == Action.BET:
+            amount = max(amount, self.big_blind)
+
+        seat = self.current_player_idx
+        betting_complete = self.process_action(action, amount)
+        if self.listeners and decision.get("table_comment"):
+            self._emit("table_comment", {"player_idx": seat, "comment": decision["table_comment"]})
+        return action, amount, betting_complete
+
     def play_hand(self):
         self.start_new_hand()
         
         # Preflop
-        print("\nPre-flop betting round:")
+        self._log("\nPre-flop betting round:")
         self.play_betting_round()
         
         # Check if hand should continue
@@ -577,13 +823,12 @@ class TexasHoldem:
             return self.handle_hand_end()
         
         # Handle all players all-in case
-        non_allin_players = [p for p in active_players if self.players.index(p) not in self.all_in_players]
-        all_players_all_in = len(non_allin_players) == 0
+        all_players_all_in = not self.table.live_mask & ~self.table.all_in_mask
         
         # Flop
         self.deal_flop()
         if not all_players_all_in and len(active_players) > 1:
-            print("\nFlop betting round:")
+            self._log("\nFlop betting round:")
             self.reset_street_bets()
             self.play_betting_round()
         
@@ -593,13 +838,12 @@ class TexasHoldem:
             return self.handle_hand_end()
         
         # Update all-in status after flop
-        non_allin_players = [p for p in active_players if self.players.index(p) not in self.all_in_players]
-        all_players_all_in = len(non_allin_players) == 0
+        all_players_all_in = not self.table.live_mask & ~self.table.all_in_mask
         
         # Turn
         self.deal_turn()
         if not all_players_all_in and len(active_players) > 1:
-            print("\nTurn betting round:")
+            self._log("\nTurn betting round:")
             self.reset_street_bets()
             self.play_betting_round()
         
@@ -609,74 +853,127 @@ class TexasHoldem:
             return self.handle_hand_end()
         
         # Update all-in status after turn
-        non_allin_players = [p for p in active_players if self.players.index(p) not in self.all_in_players]
-        all_players_all_in = len(non_allin_players) == 0
+        all_players_all_in = not self.table.live_mask & ~self.table.all_in_mask
         
         # River
         self.deal_river()
         if not all_players_all_in and len(active_players) > 1:
-            print("\nRiver betting round:")
+            self._log("\nRiver betting round:")
             self.reset_street_bets()
             self.play_betting_round()
         
         # Hand resolution
         return self.handle_hand_end()
 
+    def resolve_showdown(self) -> dict:
+        """
+        Pays out every pot in one pass. Each live hand is scored once and the
+        contenders are ranked by strength; each pot then goes to its best
+        eligible hand(s). Split pots are divided in whole chips, with odd chips
+        going to the tied winners closest to the left of the button.
+        Returns per-pot winners and amounts, total payouts per player index,
+        each contender's hand (if there was a showdown) and the biggest winner.
+        """
+        num_players = len(self.players)
+        contenders = [i for i, player in enumerate(self.players) if player.is_active != Status.FOLDED]
+        showdown = len(contenders) > 1
+        # The payout is undoable like any other step: the pots are re-layered from the commitments it leaves alone
+        self._push_undo(("showdown", self.current_stage, self.table.stacks[:]))
+
+        strengths = {}
+        if showdown:
+            for i in contenders:
+                if len(self.hand_states) == num_players:
+                    strengths[i] = self.hand_states[i].strength
+                else:
+                    strengths[i] = HandEvaluator.hand_strength(self.players[i].pocket, self.community_cards)
+            self.current_stage = GameStage.SHOWDOWN
+        ranking = sorted(contenders, key=lambda i: strengths.get(i, 0), reverse=True)
+
+        payouts = {i: 0 for i in contenders}
+        pot_results = []
+        for pot in self.pots:
+            eligible = [i for i in ranking if i in pot.eligible_players] or ranking
+            best = strengths.get(eligible[0], 0)
+            winners = [i for i in eligible if strengths.get(i, 0) == best]
+
+            # Odd chips go clockwise starting left of the button
+            winners.sort(key=lambda i: (i - self.button_position - 1) % num_players)
+            share, odd_chips = divmod(pot.amount, len(winners))
+            pot_result = {"amount": pot.amount, "winners": {}}
+            for n, i in enumerate(winners):
+                amount = share + (1 if n < odd_chips else 0)
+                self.players[i].chips += amount
+                payouts[i] += amount
+                pot_result["winners"][i] = amount
+            pot_results.append(pot_result)
+            pot.amount = 0
+        self._touch()
+
+        result = {
+            "pots": pot_results,
+            "payouts": payouts,
+            "hands": {i: HandEvaluator.decode_strength(strengths[i]) for i in contenders} if showdown else {},
+            "biggest_winner": max(payouts, key=payouts.get)
+        }
+        if self.listeners:
+            self._emit("showdown", {
+                "pots": pot_results,
+                "payouts": payouts,
+                "board": [card.code for card in self.community_cards],
+                # Hole cards are only revealed when there was a showdown
+                "hands": {i: {"pocket": [card.code for card in self.players[i].pocket],
+                              "rank": result["hands"][i][0].name} for i in result["hands"]},
+                "biggest_winner": result["biggest_winner"]
+            })
+        return result
+
     def handle_hand_end(self):
         # Show results
-        print(self.get_game_state_json())
-        print("\nHand complete!")
-        total_pot = self.get_total_pot()
-        print(f"Total pot: {total_pot}")
-        
-        active_players = self.get_non_folded_players()
-        if len(active_players) == 1:
-            winner = active_players[0]
-            winner_idx = self.players.index(winner)
-            print(f"\nWinner: {winner.name}")
-            # Award all pots to the single remaining player
-            for i, pot in enumerate(self.pots):
-                pot_name = "Main pot" if i == 0 else f"Side pot {i}"
-                print(f"{winner.name} wins {pot.amount} chips from {pot_name}")
-                winner.chips += pot.amount
-        else:
-            print("\nShowdown required!")
+        if self.verbose:
+            self._log(self.get_game_state_json())
+            self._log("\nHand complete!")
+            total_pot = self.get_total_pot()
+            self._log(f"Total pot: {total_pot}")
+
+            active_players = self.get_non_folded_players()
             if len(active_players) > 1:
-                print("\nShowdown!")
-                print("\nCommunity cards:", " ".join(str(card) for card in self.community_cards))
+                self._log("\nShowdown!")
+                self._log("\nCommunity cards:", " ".join(str(card) for card in self.community_cards))
 
                 for player in active_players:
                     hand_str = " ".join(str(card) for card in player.pocket)
-                    print(f"\n{player.name}'s hole cards: {hand_str}")
-
-                for i, pot in enumerate(self.pots):
-                    pot_name = "Main pot" if i == 0 else f"Side pot {i}"
-                    print(f"\n{pot_name} ({pot.amount} chips)")
-
-                    eligible_players = [p for p in active_players 
-                                    if self.players.index(p) in pot.eligible_players]
-
-                    pot_players = [p if self.players.index(p) in pot.eligible_players else None 
-                                for p in self.players]
-
-                    winner_shares, hand_results = HandEvaluator.determine_winners(pot_players, self.community_cards)
-
-                    print("\nHand rankings:")
-                    for player in eligible_players:
-                        player_idx = self.players.index(player)
-                        if player_idx in hand_results:
-                            rank, primary, kickers = hand_results[player_idx]
-                            hand_desc = HandEvaluator.get_hand_description(rank, primary, kickers)
-                            print(f"{player.name}: {hand_desc}")
-
-                    print("\nPot awards:")
-                    for player_idx, share in winner_shares.items():
-                        winner = self.players[player_idx]
-                        amount = int(pot.amount * share)
-                        winner.chips += amount
-                        print(f"{winner.name} wins {amount} chips")
-                    print(self.get_hand_summary())
+                    self._log(f"\n{player.name}'s hole cards: {hand_str}")
+
+        result = self.resolve_showdown()
+
+        if self.verbose:
+            if result["hands"]:
+                self._log("\nHand rankings:")
+                for player_idx, (rank, primary, kickers) in result["hands"].items():
+                    hand_desc = HandEvaluator.get_hand_description(rank, primary, kickers)
+                    self._log(f"{self.players[player_idx].name}: {hand_desc}")
+
+            self._log("\nPot awards:")
+            for i, pot_result in enumerate(result["pots"]):
+                pot_name = "Main pot" if i == 0 else f"Side pot {i}"
+                for player_idx, amount in pot_result["winners"].items():
+                    self._log(f"{self.players[player_idx].name} wins {amount} chips from {pot_name}")
+            self._log(self.get_hand_summary())
+
+        return result
                 
+    @property
+    def verbose(self) -> bool:
+        """Whether play_hand output is wanted (always outside headless mode)"""
+        return not self.headless or self.logger.isEnabledFor(logging.DEBUG)
+
+    def _log(self, *parts):
+        if self.headless:
+            self.logger.debug(" ".join(str(part) for part in parts))
+        else:
+            print(*parts)
+
     def get_betting_info(self) -> str:
         active_player = self.players[self.current_player_idx]
         current_contribution = self.street_contributions[self.current_player_idx]
@@ -709,75 +1006,87 @@ class TexasHoldem:
         for i, player in enumerate(self.players):
             position = self.get_player_position(i)
             pocket = " ".join(str(card) for card in player.pocket) if player.pocket else "XX"
-            status = "All-in" if i in self.all_in_players else ("Active" if player.is_active == Status.ACTIVE else "Folded")
+            status = "All-in" if self.table.all_in_mask >> i & 1 else ("Active" if player.is_active == Status.ACTIVE else "Folded")
             player_info = f"{player.name} ({position}): {pocket} - Chips: {player.chips} - {status}"
             summary.append(player_info)
             
         return "\n".join(summary)
 
     def get_game_state_json(self) -> dict:
-        game_state = {
-            "game_stage": self.current_stage.value,
-            "button_position": self.button_position,
-            "current_player_idx": self.current_player_idx,
-            "current_bet": self.current_bet,
-            "small_blind": self.small_blind,
-            "big_blind": self.big_blind,
-            "min_raise": self.current_bet + self.min_raise,
-            "last_bettor_idx": self.last_bettor_idx,
-            
-            "community_cards": [str(card) for card in self.community_cards],
-            
-            "pots": [{
-                "amount": pot.amount,
-                "eligible_players": list(pot.eligible_players),
-                "required_amount": pot.required_amount
-            } for pot in self.pots],
-            "total_pot": self.get_total_pot(),
-            
-            "players": [],
-            
-            "street_contributions": self.street_contributions,
-            "all_in_players": list(self.all_in_players)
-        }
-        
-        for i, player in enumerate(self.players):
-            if player.is_active == Status.FOLDED:
-                player.pocket = None
-                player_info = {
-                    "name": player.name,
-                    "position": self.get_player_position(i),
-                    "chips": player.chips,
-                    "status": player.is_active.value,
-                    "is_bot": player.is_bot,
-                    "pocket_cards": None,
-                    "current_street_contribution": self.street_contributions[i],
-                    "is_all_in": i in self.all_in_players
-                }
+        """State for the human client: pocket cards of non-bot seats, everyone's at showdown"""
+        return self.get_state_view("player")
+
+    def get_bot_state_json(self) -> dict:
+        """State for the seat to act: only its own pocket cards"""
+        return self.get_state_view("bot")
+
+    def get_spectator_state_json(self) -> dict:
+        """State for an onlooker: no pocket cards until showdown"""
+        return self.get_state_view("spectator")
+
+    def get_state_view(self, viewer: str) -> dict:
+        """
+        The state as one viewer ("player", "bot" or "spectator") sees it.
+        Built once per state version and cached; the result is read-only
+        and shared by every reader until the next change.
+        """
+        view = self._views.get(viewer)
+        if view is None:
+            if viewer not in STATE_VIEWERS:
+                raise ValueError(f"Unknown viewer: {viewer}")
+            view = self._views[viewer] = self._build_state_view(viewer)
+            self._view_history[viewer].append((self.version, view))
+        return view
+
+    def get_state_patch(self, known_version: Optional[int] = None, viewer: str = "player") -> dict:
+        """
+        The viewer's current state for a client that already holds
+        `known_version`: a JSON Patch from that version when it is one of the
+        recently served ones, otherwise the full state. Either way the
+        result carries the new "state_version".
+        """
+        view = self.get_state_view(viewer)
+        if known_version is not None:
+            for version, old_view in self._view_history[viewer]:
+                if version == known_version:
+                    return {"state_version": self.version, "base_version": known_version,
+                            "game_state_patch": diff_state(old_view, view)}
+        return {"state_version": self.version, "game_state": view}
+
+    def _build_state_view(self, viewer: str) -> FrozenDict:
+        # Built read-only from the start: FrozenDicts for objects, tuples for lists
+        table = self.table
+        players = []
+        showdown = self.current_stage == GameStage.SHOWDOWN
+        for i in range(table.size):
+            player_info = {
+                "name": table.names[i],
+                "position": self.get_player_position(i),
+                "chips": table.stacks[i],
+                "status": STATUSES[table.status[i]].value,
+                "is_bot": table.is_bot[i]
+            }
+            pocket = table.pockets[i]
+            if viewer == "bot":
+                if i == self.current_player_idx:
+                    player_info["pocket_cards"] = tuple(str(card) for card in pocket) if pocket else ()
+            elif table.folded_mask >> i & 1:
+                player_info["pocket_cards"] = None
+            elif showdown or (viewer == "player" and pocket and not table.is_bot[i]):
+                player_info["pocket_cards"] = tuple(str(card) for card in pocket)
             else:
-                player_info = {
-                    "name": player.name,
-                    "position": self.get_player_position(i),
-                    "chips": player.chips,
-                    "status": player.is_active.value,
-                    "is_bot": player.is_bot,
-                    "pocket_cards": [str(card) for card in player.pocket] if self.current_stage == GameStage.SHOWDOWN or (player.pocket and not player.is_bot) else ["", ""],
-                    "current_street_contribution": self.street_contributions[i],
-                    "is_all_in": i in self.all_in_players
-                }
-            
+                player_info["pocket_cards"] = ("", "")
+            player_info["current_street_contribution"] = table.street[i]
+            player_info["is_all_in"] = bool(table.all_in_mask >> i & 1)
+
             if i == self.current_player_idx:
-                player_info.update({
-                    "available_actions": [action.value for action in self.get_available_actions()],
-                    "call_amount": self.get_call_amount() if Action.CALL in self.get_available_actions() else 0,
-                })
+                available_actions = self.get_available_actions()
+                player_info["available_actions"] = tuple(action.value for action in available_actions)
+                player_info["call_amount"] = self.get_call_amount() if Action.CALL in available_actions else 0
                 
-            game_state["players"].append(player_info)
-        
-        return game_state
+            players.append(FrozenDict(player_info))
 
-    def get_bot_state_json(self) -> dict:
-        game_state = {
+        return FrozenDict({
             "game_stage": self.current_stage.value,
             "button_position": self.button_position,
             "current_player_idx": self.current_player_idx,
@@ -787,55 +1096,20 @@ class TexasHoldem:
             "min_raise": self.current_bet + self.min_raise,
             "last_bettor_idx": self.last_bettor_idx,
             
-            "community_cards": [str(card) for card in self.community_cards],
+            "community_cards": tuple(str(card) for card in self.community_cards),
             
-            "pots": [{
+            "pots": tuple(FrozenDict({
                 "amount": pot.amount,
-                "eligible_players": list(pot.eligible_players),
+                "eligible_players": tuple(pot.eligible_players),
                 "required_amount": pot.required_amount
-            } for pot in self.pots],
+            }) for pot in self.pots),
             "total_pot": self.get_total_pot(),
             
-            "players": [],
+            "players": tuple(players),
             
-            "street_contributions": self.street_contributions,
-            "all_in_players": list(self.all_in_players)
-        }
-        
-        for i, player in enumerate(self.players):
-            if i == self.current_player_idx:
-                player_info = {
-                    "name": player.name,
-                    "position": self.get_player_position(i),
-                    "chips": player.chips,
-                    "status": player.is_active.value,
-                    "is_bot": player.is_bot,
-                    "pocket_cards": [str(card) for card in player.pocket] if player.pocket else [],
-                    "current_street_contribution": self.street_contributions[i],
-                    "is_all_in": i in self.all_in_players
-                }
-            else:
-                player_info = {
-                    "name": player.name,
-                    "position": self.get_player_position(i),
-                    "chips": player.chips,
-                    "status": player.is_active.value,
-                    "is_bot": player.is_bot,
-                    "current_street_contribution": self.street_contributions[i],
-                    "is_all_in": i in self.all_in_players
-                }
-
-            
-            if i == self.current_player_idx:
-                player_info.update({
-                    "available_actions": [action.value for action in self.get_available_actions()],
-                    "call_amount": self.get_call_amount() if Action.CALL in self.get_available_actions() else 0,
-                })
-                
-            game_state["players"].append(player_info)
-        
-        return game_state
-    
+            "street_contributions": FrozenDict(enumerate(table.street)),
+            "all_in_players": tuple(table.seats(table.all_in_mask))
+        })
 
     def get_create_game_json(self) -> dict:
         """
@@ -0,0 +1,66 @@
+from typing import List, Tuple
+from .lookup_evaluator import CARD_PRIMES, CARD_RANK_BITS, FLUSH_TABLE, RANK_TABLE, STRAIGHT_TOP
+from .evaluator import HandEvaluator, HandRank
+
+
+class IncrementalHandState:
+    """
+    One player's hand as the board comes out. Seeded with the pocket cards and
+    updated one card at a time in O(1), so the current strength can be read
+    after any street without re-scoring the whole hand.
+    """
+    __slots__ = ("product", "suit_masks", "suit_counts", "rank_counts", "rank_mask", "card_count", "flush_suit")
+
+    def __init__(self, cards=()):
+        self.product = 1
+        self.suit_masks = [0, 0, 0, 0]
+        self.suit_counts = [0, 0, 0, 0]
+        self.rank_counts = [0] * 13
+        self.rank_mask = 0
+        self.card_count = 0
+        self.flush_suit = None
+        for card in cards:
+            self.add_card(card)
+
+    def add_card(self, card):
+        """Adds a Card (or card code) to the hand"""
+        code = getattr(card, "code", card)
+        suit = code & 3
+        self.product *= CARD_PRIMES[code]
+        self.suit_masks[suit] |= CARD_RANK_BITS[code]
+        self.suit_counts[suit] += 1
+        self.rank_counts[code >> 2] += 1
+        self.rank_mask |= CARD_RANK_BITS[code]
+        self.card_count += 1
+        if self.suit_counts[suit] >= 5:
+            self.flush_suit = suit
+
+    def copy(self) -> "IncrementalHandState":
+        clone = IncrementalHandState.__new__(IncrementalHandState)
+        clone.product = self.product
+        clone.suit_masks = self.suit_masks[:]
+        clone.suit_counts = self.suit_counts[:]
+        clone.rank_counts = self.rank_counts[:]
+        clone.rank_mask = self.rank_mask
+        clone.card_count = self.card_count
+        clone.flush_suit = self.flush_suit
+        return clone
+
+    @property
+    def strength(self) -> int:
+        """Current strength, comparable with HandEvaluator.hand_strength (0 before any card)"""
+        if self.flush_suit is not None:
+            return FLUSH_TABLE[self.suit_masks[self.flush_suit]]
+        return RANK_TABLE.get(self.product, 0)
+
+    @property
+    def straight_top(self) -> int:
+        """Top card value of the best straight made so far, or 0"""
+        return STRAIGHT_TOP[self.rank_mask]
+
+    def evaluate(self) -> Tuple[HandRank, List[int], List[int]]:
+        """Current hand as (HandRank, primary_values, kicker_values)"""
+        return HandEvaluator.decode_strength(self.strength)
+
+    def describe(self) -> str:
+        return HandEvaluator.get_hand_description(*self.evaluate())
@@ -0,0 +1,167 @@
+from typing import Dict, Iterable, List, Tuple
+
+# Cards are encoded as integers 0-51: (value - 2) * 4 + suit index.
+# A hand strength is a single integer, higher is better:
+#   category << 20 | five 4-bit rank slots (most significant first)
+# where the category matches HandRank.value (0 = high card ... 8 = straight flush)
+# and the rank slots hold the primary values followed by the kickers.
+
+HIGH_CARD = 0
+PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+CATEGORY_SHIFT = 20
+
+# One prime per rank (2 through Ace); the product of a hand's primes
+# identifies its rank multiset regardless of order.
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+WHEEL_MASK = 0b1000000001111  # A, 5, 4, 3, 2
+
+CARD_PRIMES = tuple(RANK_PRIMES[code >> 2] for code in range(52))
+CARD_RANK_BITS = tuple(1 << (code >> 2) for code in range(52))
+
+
+def encode_card(value: int, suit_index: int) -> int:
+    return (value - 2) * 4 + suit_index
+
+
+def _pack(category: int, values: List[int]) -> int:
+    strength = category << CATEGORY_SHIFT
+    for i, value in enumerate(values[:5]):
+        strength |= value << (16 - 4 * i)
+    return strength
+
+
+def _straight_top(rank_mask: int) -> int:
+    """Returns the top card value of the best straight in the mask, or 0"""
+    for top in range(12, 3, -1):
+        run = 0b11111 << (top - 4)
+        if rank_mask & run == run:
+            return top + 2
+    if rank_mask & WHEEL_MASK == WHEEL_MASK:
+        return 5
+    return 0
+
+
+def _build_straight_table() -> List[int]:
+    return [_straight_top(mask) for mask in range(8192)]
+
+
+def _mask_values(rank_mask: int) -> List[int]:
+    """Card values present in the mask, highest first"""
+    return [r + 2 for r in range(12, -1, -1) if rank_mask >> r & 1]
+
+
+def _build_flush_table() -> List[int]:
+    """Strength of the best flush/straight flush for every 13-bit suit mask (0 if < 5 cards)"""
+    table = [0] * 8192
+    for mask in range(8192):
+        if bin(mask).count("1") < 5:
+            continue
+        top = STRAIGHT_TOP[mask]
+        if top:
+            table[mask] = _pack(STRAIGHT_FLUSH, [top])
+        else:
+            table[mask] = _pack(FLUSH, _mask_values(mask)[:5])
+    return table
+
+
+def _strength_from_counts(held: List[Tuple[int, int]], rank_mask: int) -> int:
+    """Best non-flush strength for a multiset of ranks given as (count, value) pairs"""
+    by_count = sorted(held, reverse=True)
+    top_count, top_value = by_count[0]
+
+    if top_count == 4:
+        kickers = sorted((v for c, v in by_count[1:]), reverse=True)[:1]
+        return _pack(FOUR_OF_A_KIND, [top_value] + kickers)
+
+    if top_count == 3 and len(by_count) > 1 and by_count[1][0] >= 2:
+        return _pack(FULL_HOUSE, [top_value, by_count[1][1]])
+
+    straight = STRAIGHT_TOP[rank_mask]
+    if straight:
+        return _pack(STRAIGHT, [straight])
+
+    if top_count == 3:
+        kickers = sorted((v for c, v in by_count[1:]), reverse=True)[:2]
+        return _pack(THREE_OF_A_KIND, [top_value] + kickers)
+
+    if top_count == 2 and len(by_count) > 1 and by_count[1][0] == 2:
+        kickers = sorted((v for c, v in by_count[2:]), reverse=True)[:1]
+        return _pack(TWO_PAIR, [top_value, by_count[1][1]] + kickers)
+
+    if top_count == 2:
+        kickers = sorted((v for c, v in by_count[1:]), reverse=True)[:3]
+        return _pack(PAIR, [top_value] + kickers)
+
+    return _pack(HIGH_CARD, _mask_values(rank_mask)[:5])
+
+
+def _build_rank_table(min_cards: int, max_cards: int) -> Dict[int, int]:
+    """Maps the prime product of every rank multiset (at most 4 of a rank) to its strength"""
+    table = {}
+    held = []
+
+    def fill(rank: int, remaining: int, product: int, rank_mask: int):
+        if rank == 13:
+            if max_cards - remaining >= min_cards:
+                table[product] = _strength_from_counts(held, rank_mask)
+            return
+        fill(rank + 1, remaining, product, rank_mask)
+        prime = RANK_PRIMES[rank]
+        for count in range(1, min(4, remaining) + 1):
+            product *= prime
+            held.append((count, rank + 2))
+            fill(rank + 1, remaining - count, product, rank_mask | 1 << rank)
+            held.pop()
+
+    fill(0, max_cards, 1, 0)
+    return table
+
+
+STRAIGHT_TOP = _build_straight_table()
+FLUSH_TABLE = _build_flush_table()
+# Partial hands (fewer than 5 cards) are included so hands can be read while being dealt
+RANK_TABLE = _build_rank_table(1, 7)
+
+
+class LookupEvaluator:
+    @staticmethod
+    def evaluate(codes: Iterable[int]) -> int:
+        """
+        Scores up to 7 encoded cards and returns a comparable integer strength.
+        Fewer than 5 cards score as the pairs/trips/high cards they hold.
+        At most one suit can hold five cards, and with seven cards a flush always
+        outranks whatever the remaining cards could make, so the flush table wins if hit.
+        """
+        masks = [0, 0, 0, 0]
+        product = 1
+        for code in codes:
+            product *= CARD_PRIMES[code]
+            masks[code & 3] |= CARD_RANK_BITS[code]
+
+        for mask in masks:
+            flush = FLUSH_TABLE[mask]
+            if flush:
+                return flush
+        return RANK_TABLE[product]
+
+    @staticmethod
+    def category(strength: int) -> int:
+        return strength >> CATEGORY_SHIFT
+
+    @staticmethod
+    def values(strength: int) -> List[int]:
+        """Card values stored in the rank slots, most significant first"""
+        values = []
+        for i in range(5):
+            value = (strength >> (16 - 4 * i)) & 0xF
+            if value:
+                values.append(value)
+        return values
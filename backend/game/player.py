@@ -1,26 +1,92 @@
 from .status import Status
+from .table_state import STATUSES, STATUS_CODES, TableState
 
 class Player:
+    """A view onto one seat of a TableState; a new Player gets a one-seat table of its own"""
+    __slots__ = ("_table", "_seat")
+
     def __init__(self, name, chips, is_bot):
-        self.name = name
-        self.chips = chips
-        self.pocket = []
-        self.hand = []
-        self.is_active = Status.ACTIVE
-        self.preflop = 0
-        self.is_bot = is_bot
-    
+        table = TableState(1)
+        table.names[0] = name
+        table.stacks[0] = chips
+        table.is_bot[0] = is_bot
+        self.bind(table, 0)
+
+    def bind(self, table: TableState, seat: int):
+        self._table = table
+        self._seat = seat
+
+    @property
+    def seat(self) -> int:
+        return self._seat
+
+    @property
+    def name(self):
+        return self._table.names[self._seat]
+
+    @name.setter
+    def name(self, value):
+        self._table.names[self._seat] = value
+
+    @property
+    def chips(self):
+        return self._table.stacks[self._seat]
+
+    @chips.setter
+    def chips(self, value):
+        self._table.stacks[self._seat] = value
+
+    @property
+    def pocket(self):
+        return self._table.pockets[self._seat]
+
+    @pocket.setter
+    def pocket(self, value):
+        self._table.pockets[self._seat] = value
+
+    @property
+    def hand(self):
+        return self._table.hands[self._seat]
+
+    @hand.setter
+    def hand(self, value):
+        self._table.hands[self._seat] = value
+
+    @property
+    def is_active(self) -> Status:
+        return STATUSES[self._table.status[self._seat]]
+
+    @is_active.setter
+    def is_active(self, status: Status):
+        self._table.set_status(self._seat, STATUS_CODES[status])
+
+    @property
+    def preflop(self):
+        return self._table.preflop[self._seat]
+
+    @preflop.setter
+    def preflop(self, value):
+        self._table.preflop[self._seat] = value
+
+    @property
+    def is_bot(self):
+        return self._table.is_bot[self._seat]
+
+    @is_bot.setter
+    def is_bot(self, value):
+        self._table.is_bot[self._seat] = value
+
     def add_pocket_card(self, card):
         self.pocket.append(card)
 
     def add_5_card(self, card):
         self.hand.append(card)
-    
+
     def clear_pocket(self):
         self.pocket = []
 
     def clear_hand(self):
         self.hand = []
-    
+
     def note_preflop(self):
         self.preflop = self.chips
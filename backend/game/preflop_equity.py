@@ -0,0 +1,186 @@
+import os
+import struct
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .batch_evaluator import BatchEvaluator
+
+# Precomputed preflop equities for the 169 starting-hand classes, stored in
+# data/preflop_equity.bin and memory-mapped on import. Rebuild the file with:
+#   python -m game.preflop_equity [samples]
+
+RANK_CHARS = "23456789TJQKA"
+NUM_CLASSES = 169
+MAX_OPPONENTS = 5
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "preflop_equity.bin")
+
+# magic, format version, class count, max opponents, reserved, samples per entry
+_HEADER = struct.Struct("<4sHHHHI")
+_MAGIC = b"PFEQ"
+_VERSION = 1
+
+
+def _class_label(row: int, col: int) -> str:
+    """Grid position to class label: rows/cols run Ace down to Two, suited above the diagonal"""
+    high, low = 12 - min(row, col), 12 - max(row, col)
+    if row == col:
+        return RANK_CHARS[high] * 2
+    return RANK_CHARS[high] + RANK_CHARS[low] + ("s" if row < col else "o")
+
+
+HAND_CLASSES = [_class_label(row, col) for row in range(13) for col in range(13)]
+CLASS_INDEX = {label: i for i, label in enumerate(HAND_CLASSES)}
+
+
+def class_index_for_codes(code1: int, code2: int) -> int:
+    """Index of the starting-hand class holding the two card codes"""
+    rank1, rank2 = code1 >> 2, code2 >> 2
+    high, low = max(rank1, rank2), min(rank1, rank2)
+    row, col = 12 - high, 12 - low
+    if rank1 != rank2 and (code1 & 3) != (code2 & 3):
+        row, col = col, row
+    return row * 13 + col
+
+
+def class_combos(label: str) -> List[Tuple[int, int]]:
+    """Every (code, code) combo in a class: 6 for pairs, 4 suited, 12 offsuit"""
+    high, low = RANK_CHARS.index(label[0]), RANK_CHARS.index(label[1])
+    if high == low:
+        return [(high * 4 + s1, high * 4 + s2) for s1 in range(4) for s2 in range(s1 + 1, 4)]
+    if label[2] == "s":
+        return [(high * 4 + s, low * 4 + s) for s in range(4)]
+    return [(high * 4 + s1, low * 4 + s2) for s1 in range(4) for s2 in range(4) if s1 != s2]
+
+
+def _draw_excluding(rng: np.random.Generator, excluded: np.ndarray, count: int) -> np.ndarray:
+    """For each row of excluded codes, draws `count` distinct codes from the rest of the deck"""
+    keys = rng.random((len(excluded), 52))
+    np.put_along_axis(keys, excluded, 2.0, axis=1)
+    return keys.argpartition(count - 1, axis=1)[:, :count]
+
+
+def _equity_shares(hero: np.ndarray, opponents: np.ndarray) -> np.ndarray:
+    """Hero's pot share per sample given hero strengths (K,) and opponent strengths (n, K)"""
+    best_opponent = opponents.max(axis=0)
+    tied = (opponents == hero).sum(axis=0)
+    return np.where(hero > best_opponent, 1.0, np.where(hero == best_opponent, 1.0 / (tied + 1), 0.0))
+
+
+def _build_vs_random(samples: int, rng: np.random.Generator) -> np.ndarray:
+    """Equity of every class against 1 to MAX_OPPONENTS random hands"""
+    table = np.zeros((NUM_CLASSES, MAX_OPPONENTS), dtype=np.float32)
+    for index, label in enumerate(HAND_CLASSES):
+        combos = np.array(class_combos(label))
+        hero_cards = combos[rng.integers(len(combos), size=samples)]
+
+        # One draw per sample serves every table size: 5 board cards, then two per opponent
+        drawn = _draw_excluding(rng, hero_cards, 5 + 2 * MAX_OPPONENTS)
+        board = drawn[:, :5]
+        hero = BatchEvaluator.evaluate(np.concatenate([hero_cards, board], axis=1))
+        opponents = np.stack([
+            BatchEvaluator.evaluate(np.concatenate([drawn[:, 5 + 2 * i:7 + 2 * i], board], axis=1))
+            for i in range(MAX_OPPONENTS)
+        ])
+        for count in range(1, MAX_OPPONENTS + 1):
+            table[index, count - 1] = _equity_shares(hero, opponents[:count]).mean()
+    return table
+
+
+def _build_matchups(samples: int, rng: np.random.Generator) -> np.ndarray:
+    """Heads-up equity of every class (rows) against every other class (columns)"""
+    # A class against itself is a coin flip by symmetry, so the diagonal stays at 0.5
+    table = np.full((NUM_CLASSES, NUM_CLASSES), 0.5, dtype=np.float32)
+    all_combos = [class_combos(label) for label in HAND_CLASSES]
+    for a in range(NUM_CLASSES):
+        for b in range(a + 1, NUM_CLASSES):
+            pairs = np.array([hero + villain for hero in all_combos[a] for villain in all_combos[b]
+                              if not set(hero) & set(villain)])
+            dealt = pairs[rng.integers(len(pairs), size=samples)]
+            board = _draw_excluding(rng, dealt, 5)
+            hero = BatchEvaluator.evaluate(np.concatenate([dealt[:, :2], board], axis=1))
+            villain = BatchEvaluator.evaluate(np.concatenate([dealt[:, 2:], board], axis=1))
+            equity = _equity_shares(hero, villain[None, :]).mean()
+            table[a, b] = equity
+            table[b, a] = 1.0 - equity
+    return table
+
+
+def build_tables(path: str = DATA_PATH, samples: int = 20000, seed: int = 0):
+    """Simulates both tables and writes them to the binary file at path"""
+    rng = np.random.default_rng(seed)
+    vs_random = _build_vs_random(samples * 4, rng)
+    matchups = _build_matchups(samples, rng)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, NUM_CLASSES, MAX_OPPONENTS, 0, samples))
+        f.write(vs_random.astype("<f4").tobytes())
+        f.write(matchups.astype("<f4").tobytes())
+
+
+def _load_tables(path: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Memory-maps both tables; returns None if the file has not been built"""
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        magic, version, classes, max_opponents, _, _ = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != _MAGIC or version != _VERSION or classes != NUM_CLASSES or max_opponents != MAX_OPPONENTS:
+        raise ValueError(f"Unrecognized preflop equity file: {path}")
+
+    vs_random = np.memmap(path, dtype="<f4", mode="r", offset=_HEADER.size,
+                          shape=(NUM_CLASSES, MAX_OPPONENTS))
+    matchups = np.memmap(path, dtype="<f4", mode="r", offset=_HEADER.size + vs_random.nbytes,
+                         shape=(NUM_CLASSES, NUM_CLASSES))
+    return vs_random, matchups
+
+
+_TABLES = _load_tables(DATA_PATH)
+
+HandClass = Union[str, int, Tuple]
+
+
+class PreflopEquity:
+    @staticmethod
+    def class_index(hand: HandClass) -> int:
+        """Accepts a class label ("AKs"), a class index, or two cards (Card objects or codes)"""
+        if isinstance(hand, str):
+            if hand not in CLASS_INDEX:
+                raise ValueError(f"Unknown starting hand: {hand}")
+            return CLASS_INDEX[hand]
+        if isinstance(hand, int):
+            return hand
+        code1, code2 = (int(getattr(card, "code", card)) for card in hand)
+        return class_index_for_codes(code1, code2)
+
+    @staticmethod
+    def hand_class(hand: HandClass) -> str:
+        return HAND_CLASSES[PreflopEquity.class_index(hand)]
+
+    @staticmethod
+    def _tables() -> Tuple[np.ndarray, np.ndarray]:
+        if _TABLES is None:
+            raise FileNotFoundError("Preflop equity tables not built; run python -m game.preflop_equity")
+        return _TABLES
+
+    @staticmethod
+    def vs_random(hand: HandClass, opponents: int = 1) -> float:
+        """Equity of a starting hand against 1 to 5 random hands"""
+        if not 1 <= opponents <= MAX_OPPONENTS:
+            raise ValueError(f"Opponents must be between 1 and {MAX_OPPONENTS}")
+        vs_random, _ = PreflopEquity._tables()
+        return float(vs_random[PreflopEquity.class_index(hand), opponents - 1])
+
+    @staticmethod
+    def matchup(hand: HandClass, villain: HandClass) -> float:
+        """Heads-up equity of one starting-hand class against another"""
+        _, matchups = PreflopEquity._tables()
+        return float(matchups[PreflopEquity.class_index(hand), PreflopEquity.class_index(villain)])
+
+
+if __name__ == "__main__":
+    import sys
+    build_tables(samples=int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    print(f"Wrote {DATA_PATH}")
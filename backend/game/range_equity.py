@@ -0,0 +1,214 @@
+import math
+from itertools import combinations
+from statistics import NormalDist
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from .batch_evaluator import BatchEvaluator
+from .equity import _tally
+from .ranges import COMBOS, HandRange, card_code
+
+RangeLike = Union[HandRange, str, Sequence]
+
+
+def to_range(hand_range: RangeLike) -> HandRange:
+    """Accepts a HandRange, range notation ("AA-22,AKs"), or two known cards"""
+    if isinstance(hand_range, HandRange):
+        return hand_range
+    if isinstance(hand_range, str):
+        return HandRange.parse(hand_range)
+    return HandRange.from_cards(*hand_range)
+
+
+class RangeEquityCalculator:
+    def __init__(self, max_error: float = 0.005, max_samples: int = 200000,
+                 batch_size: int = 4096, confidence: float = 0.95,
+                 exact_threshold: int = 2000000, seed: Optional[int] = None):
+        """
+        max_error: sampling stops once every player's confidence half-width is below this
+        max_samples: hard cap on sampled deals
+        exact_threshold: enumerate when (combo tuples x runouts) is at most this many
+        """
+        self.max_error = max_error
+        self.max_samples = max_samples
+        self.batch_size = batch_size
+        self.confidence = confidence
+        self.exact_threshold = exact_threshold
+        self.rng = np.random.default_rng(seed)
+
+    def calculate(self, ranges: Sequence[RangeLike], board: Optional[Sequence] = None,
+                  dead_cards: Optional[Sequence] = None, exact: Optional[bool] = None,
+                  max_error: Optional[float] = None) -> dict:
+        """
+        Equity of each weighted range against the others on the given board.
+        Combos that collide with the board, the dead cards or each other are
+        excluded. exact=None enumerates when the work is under exact_threshold
+        and samples otherwise; True/False forces a mode. Returns a dict shaped
+        like EquityCalculator.calculate, with "samples" counting the deals scored.
+        """
+        if not 2 <= len(ranges) <= 6:
+            raise ValueError("Range equity needs between 2 and 6 ranges")
+        board_codes = [card_code(card) for card in board] if board else []
+        dead_codes = [card_code(card) for card in dead_cards] if dead_cards else []
+        if len(board_codes) > 5:
+            raise ValueError("Board cannot have more than 5 cards")
+        if len(set(board_codes + dead_codes)) != len(board_codes) + len(dead_codes):
+            raise ValueError("Duplicate cards between board and dead cards")
+
+        live = [to_range(r).remove_blockers(board_codes + dead_codes) for r in ranges]
+        if any(len(r) == 0 for r in live):
+            raise ValueError("A range has no combos left after removing blocked cards")
+
+        combos = [np.array([COMBOS[i] for i in r.combo_indices()], dtype=np.int64) for r in live]
+        weights = [np.array([r.combo_weight(i) for i in r.combo_indices()]) for r in live]
+        masks = [(np.int64(1) << c[:, 0]) | (np.int64(1) << c[:, 1]) for c in combos]
+
+        known = set(board_codes) | set(dead_codes)
+        deck = np.array([code for code in range(52) if code not in known], dtype=np.int64)
+        need = 5 - len(board_codes)
+
+        if exact is None:
+            work = math.prod(len(c) for c in combos) * math.comb(len(deck), need)
+            exact = work <= self.exact_threshold
+        if exact:
+            return self._enumerate(combos, weights, masks, board_codes, deck, need)
+        return self._sample(combos, weights, masks, board_codes, deck, need,
+                            max_error if max_error is not None else self.max_error)
+
+    def _enumerate(self, combos: List[np.ndarray], weights: List[np.ndarray], masks: List[np.ndarray],
+                   board: List[int], deck: np.ndarray, need: int) -> dict:
+        """
+        Weighs every non-conflicting combo tuple against every runout. Each
+        range's strengths come from one batched evaluation per runout chunk and
+        are broadcast into an (N1, ..., Nn, M) grid.
+        """
+        n = len(combos)
+        runouts = np.array(list(combinations(deck.tolist(), need)), dtype=np.int64).reshape(math.comb(len(deck), need), need)
+        runout_masks = (np.int64(1) << runouts).sum(axis=1) if need else np.zeros(len(runouts), dtype=np.int64)
+
+        def spread(values: np.ndarray, i: int) -> np.ndarray:
+            """Places range i's axis in position i of the n-player grid (trailing axes kept)"""
+            return values.reshape((1,) * i + (len(values),) + (1,) * (n - 1 - i) + values.shape[1:])
+
+        # Joint weight of every combo tuple, zero where two ranges share a card
+        joint = np.ones(())
+        for i in range(n):
+            joint = joint * spread(weights[i], i)
+        for i in range(n):
+            for j in range(i + 1, n):
+                joint = joint * ((spread(masks[i], i) & spread(masks[j], j)) == 0)
+        joint = joint[..., None]
+
+        grid = math.prod(len(c) for c in combos)
+        chunk_size = max(1, min(len(runouts), 1000000 // grid))
+
+        board_block = np.array(board, dtype=np.int64)
+        total = 0.0
+        deals = 0
+        wins = np.zeros(n)
+        ties = np.zeros(n)
+        shares = np.zeros(n)
+        for start in range(0, len(runouts), chunk_size):
+            chunk, chunk_masks = runouts[start:start + chunk_size], runout_masks[start:start + chunk_size]
+            strengths, weight = [], joint
+            for i in range(n):
+                base = np.concatenate([combos[i], np.broadcast_to(board_block, (len(combos[i]), len(board)))], axis=1)
+                strengths.append(spread(BatchEvaluator.evaluate_runouts(base, chunk), i))
+                weight = weight * spread((masks[i][:, None] & chunk_masks[None, :]) == 0, i)
+
+            best = strengths[0]
+            for s in strengths[1:]:
+                best = np.maximum(best, s)
+            winner_count = sum((s == best).astype(np.int8) for s in strengths)
+            total += float(weight.sum())
+            deals += int(np.count_nonzero(weight))
+            for i, s in enumerate(strengths):
+                won = (s == best) * weight
+                shares[i] += float((won / winner_count).sum())
+                wins[i] += float((won * (winner_count == 1)).sum())
+                ties[i] += float((won * (winner_count > 1)).sum())
+
+        if total == 0:
+            raise ValueError("The ranges have no compatible combos")
+        return self._build_result(deals, wins / total, ties / total, shares / total, None, exact=True)
+
+    def _sample(self, combos: List[np.ndarray], weights: List[np.ndarray], masks: List[np.ndarray],
+                board: List[int], deck: np.ndarray, need: int, max_error: float) -> dict:
+        """
+        Deals random combo tuples (by weight) and runouts in vectorized batches,
+        rejecting tuples that share a card, until every player's confidence
+        half-width is within max_error or max_samples is reached.
+        """
+        n = len(combos)
+        probabilities = [w / w.sum() for w in weights]
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        board_block = np.array(board, dtype=np.int64)
+
+        done = 0
+        wins = np.zeros(n, dtype=np.int64)
+        ties = np.zeros(n, dtype=np.int64)
+        share_sum = np.zeros(n)
+        share_sq_sum = np.zeros(n)
+        attempts = 0
+
+        while done < self.max_samples:
+            picks = [self.rng.choice(len(c), size=self.batch_size, p=p) for c, p in zip(combos, probabilities)]
+            pick_masks = np.stack([m[p] for m, p in zip(masks, picks)])
+            used = np.bitwise_or.reduce(pick_masks, axis=0)
+            # Hands are disjoint exactly when no bit was counted twice
+            valid = pick_masks.sum(axis=0) == used
+            attempts += self.batch_size
+            if not valid.any():
+                if attempts >= self.max_samples * 10:
+                    raise ValueError("The ranges have no compatible combos")
+                continue
+
+            holes = [c[p[valid]] for c, p in zip(combos, picks)]
+            used = used[valid]
+            count = len(used)
+            if need:
+                keys = self.rng.random((count, len(deck)))
+                keys[((used[:, None] >> deck[None, :]) & 1) == 1] = 2.0
+                runouts = deck[keys.argpartition(need - 1, axis=1)[:, :need]]
+            else:
+                runouts = np.empty((count, 0), dtype=np.int64)
+            board_cards = np.concatenate([np.broadcast_to(board_block, (count, len(board))), runouts], axis=1)
+
+            strengths = np.stack([BatchEvaluator.evaluate(np.concatenate([hole, board_cards], axis=1)) for hole in holes])
+            batch_wins, batch_ties, batch_shares, batch_shares_sq = _tally(strengths)
+            wins += batch_wins
+            ties += batch_ties
+            share_sum += batch_shares
+            share_sq_sum += batch_shares_sq
+            done += count
+
+            equity = share_sum / done
+            variance = np.maximum(share_sq_sum / done - equity ** 2, 0.0)
+            if np.all(z * np.sqrt(variance / done) <= max_error):
+                break
+
+        return self._build_result(done, wins / done, ties / done, share_sum / done,
+                                  share_sq_sum / done, exact=False)
+
+    def _build_result(self, samples, win_rates, tie_rates, equities, share_sq_means, exact: bool) -> dict:
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        players = []
+        for i in range(len(equities)):
+            equity = float(equities[i])
+            if exact:
+                margin = 0.0
+            else:
+                margin = z * math.sqrt(max(share_sq_means[i] - equity ** 2, 0.0) / samples)
+            players.append({
+                "win": float(win_rates[i]),
+                "tie": float(tie_rates[i]),
+                "equity": equity,
+                "confidence_interval": (max(equity - margin, 0.0), min(equity + margin, 1.0)),
+            })
+
+        return {
+            "samples": samples,
+            "exact": exact,
+            "players": players,
+        }
@@ -0,0 +1,230 @@
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .preflop_equity import CLASS_INDEX, HAND_CLASSES, NUM_CLASSES, RANK_CHARS, class_combos, class_index_for_codes
+
+# Every two-card combo (1326 of them) gets a bit; a range is a 1326-bit int
+# plus a weight per starting-hand class (169 entries).
+
+NUM_COMBOS = 1326
+
+COMBOS = [(c1, c2) for c1 in range(52) for c2 in range(c1 + 1, 52)]
+COMBO_INDEX = [[-1] * 52 for _ in range(52)]
+for _i, (_c1, _c2) in enumerate(COMBOS):
+    COMBO_INDEX[_c1][_c2] = _i
+    COMBO_INDEX[_c2][_c1] = _i
+COMBO_CLASS = [class_index_for_codes(c1, c2) for c1, c2 in COMBOS]
+
+# Combos holding each card, and combos making up each class
+CARD_BLOCKERS = [sum(1 << i for i, combo in enumerate(COMBOS) if code in combo) for code in range(52)]
+CLASS_MASKS = [sum(1 << COMBO_INDEX[c1][c2] for c1, c2 in class_combos(label)) for label in HAND_CLASSES]
+
+FULL_MASK = (1 << NUM_COMBOS) - 1
+
+_FACE_VALUES = {"J": 11, "Q": 12, "K": 13, "A": 14, "T": 10}
+_SUIT_SYMBOLS = {"♥": 0, "♦": 1, "♣": 2, "♠": 3, "h": 0, "d": 1, "c": 2, "s": 3}
+
+
+def card_code(card) -> int:
+    """Card object, integer code, or text like "A♠", "10♥" or "Th" to a card code"""
+    if isinstance(card, str):
+        value_text, suit_text = card[:-1], card[-1]
+        value = _FACE_VALUES.get(value_text.upper()) or int(value_text)
+        return (value - 2) * 4 + _SUIT_SYMBOLS[suit_text]
+    return int(getattr(card, "code", card))
+
+
+def _token_classes(token: str) -> List[int]:
+    """Class indices named by one comma-separated token of range notation"""
+    def parse_hand(text: str) -> Tuple[int, int, str]:
+        if len(text) not in (2, 3) or text[0] not in RANK_CHARS or text[1] not in RANK_CHARS:
+            raise ValueError(f"Invalid hand in range: {text}")
+        high, low = RANK_CHARS.index(text[0]), RANK_CHARS.index(text[1])
+        suffix = text[2] if len(text) == 3 else ""
+        if high < low:
+            high, low = low, high
+        if suffix not in ("", "s", "o") or (high == low and suffix):
+            raise ValueError(f"Invalid hand in range: {text}")
+        return high, low, suffix
+
+    def classes_for(high: int, low: int, suffix: str) -> List[int]:
+        if high == low:
+            return [CLASS_INDEX[RANK_CHARS[high] * 2]]
+        suffixes = [suffix] if suffix else ["s", "o"]
+        return [CLASS_INDEX[RANK_CHARS[high] + RANK_CHARS[low] + s] for s in suffixes]
+
+    if token.endswith("+"):
+        high, low, suffix = parse_hand(token[:-1])
+        if high == low:
+            # "TT+" is every pair from TT up
+            return [c for rank in range(low, 13) for c in classes_for(rank, rank, "")]
+        # "A9s+" keeps the high card and raises the kicker up to just below it
+        return [c for kicker in range(low, high) for c in classes_for(high, kicker, suffix)]
+
+    if "-" in token:
+        first, last = (parse_hand(part) for part in token.split("-", 1))
+        if first[2] != last[2] or (first[0] == first[1]) != (last[0] == last[1]):
+            raise ValueError(f"Range endpoints do not match: {token}")
+        suffix = first[2]
+        if first[0] == first[1]:
+            low, high = sorted((first[0], last[0]))
+            return [c for rank in range(low, high + 1) for c in classes_for(rank, rank, "")]
+        # Everything between the two endpoints ordered by (high card, kicker):
+        # "AKs-A2s" walks the kicker, "AKo-32o" spans every offsuit hand
+        start, end = sorted(((first[0], first[1]), (last[0], last[1])))
+        return [c for high in range(13) for low in range(high)
+                if start <= (high, low) <= end for c in classes_for(high, low, suffix)]
+
+    return classes_for(*parse_hand(token))
+
+
+@lru_cache(maxsize=None)
+def _parse(text: str) -> "HandRange":
+    weights = [0.0] * NUM_CLASSES
+    stripped = text.strip()
+    if stripped and stripped.lower() != "none":
+        for token in stripped.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            weight = 1.0
+            if ":" in token:
+                token, weight_text = token.split(":", 1)
+                weight = float(weight_text)
+            for class_index in _token_classes(token.strip()):
+                weights[class_index] = weight
+    return HandRange.from_class_weights(weights)
+
+
+class HandRange:
+    """
+    Immutable set of two-card combos with a weight per starting-hand class.
+    Build one with HandRange.parse("AA-22,AKs-A2s,KQo"); parsed ranges are cached.
+    """
+    __slots__ = ("_mask", "_weights", "_sampler")
+
+    def __init__(self, mask: int = 0, weights: Optional[Iterable[float]] = None):
+        self._mask = mask
+        self._weights = tuple(weights) if weights is not None else tuple(
+            1.0 if mask & CLASS_MASKS[c] else 0.0 for c in range(NUM_CLASSES)
+        )
+        self._sampler = None
+
+    @staticmethod
+    def parse(text: str) -> "HandRange":
+        """
+        Parses chart notation: "AA", "AKs", "AKo", "AK" (both), "TT+", "A9s+",
+        "AA-22", "AKs-A2s", "AKo-32o", optional weights as "AKs:0.5", and "None".
+        Raises ValueError on anything else.
+        """
+        return _parse(text)
+
+    @staticmethod
+    def from_cards(card1, card2) -> "HandRange":
+        """A range holding just one known hand"""
+        return HandRange(1 << COMBO_INDEX[card_code(card1)][card_code(card2)])
+
+    @staticmethod
+    def from_class_weights(weights: Iterable[float]) -> "HandRange":
+        weights = tuple(float(w) for w in weights)
+        mask = 0
+        for class_index, weight in enumerate(weights):
+            if weight > 0:
+                mask |= CLASS_MASKS[class_index]
+        return HandRange(mask, weights)
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    @property
+    def weights(self) -> Tuple[float, ...]:
+        """169-entry weight vector indexed like preflop_equity.HAND_CLASSES"""
+        return self._weights
+
+    def combo_weight(self, combo_index: int) -> float:
+        return self._weights[COMBO_CLASS[combo_index]] if self._mask >> combo_index & 1 else 0.0
+
+    def contains(self, card1, card2) -> bool:
+        return bool(self._mask >> COMBO_INDEX[card_code(card1)][card_code(card2)] & 1)
+
+    def __contains__(self, cards) -> bool:
+        return self.contains(*cards)
+
+    def __len__(self) -> int:
+        return bin(self._mask).count("1")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, HandRange) and self._mask == other._mask and self._weights == other._weights
+
+    def __hash__(self) -> int:
+        return hash((self._mask, self._weights))
+
+    def intersect(self, other: "HandRange") -> "HandRange":
+        return HandRange(self._mask & other._mask, (min(a, b) for a, b in zip(self._weights, other._weights)))
+
+    def union(self, other: "HandRange") -> "HandRange":
+        return HandRange(self._mask | other._mask, (max(a, b) for a, b in zip(self._weights, other._weights)))
+
+    def complement(self) -> "HandRange":
+        return HandRange(FULL_MASK & ~self._mask)
+
+    def remove_blockers(self, dead_cards) -> "HandRange":
+        """Drops every combo that uses one of the dead cards (board, known hole cards, ...)"""
+        blocked = 0
+        for card in dead_cards:
+            blocked |= CARD_BLOCKERS[card_code(card)]
+        if not self._mask & blocked:
+            return self
+        return HandRange(self._mask & ~blocked, self._weights)
+
+    def combo_indices(self) -> List[int]:
+        mask = self._mask
+        indices = []
+        while mask:
+            low_bit = mask & -mask
+            indices.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return indices
+
+    def combos(self) -> List[Tuple[int, int]]:
+        return [COMBOS[i] for i in self.combo_indices()]
+
+    def sample(self, rng: random.Random = random) -> Tuple[int, int]:
+        """Draws one combo (as two card codes), weighted by its class weight"""
+        if self._sampler is None:
+            indices = self.combo_indices()
+            if not indices:
+                raise ValueError("Cannot sample from an empty range")
+            self._sampler = (indices, [self._weights[COMBO_CLASS[i]] for i in indices])
+        indices, weights = self._sampler
+        return COMBOS[rng.choices(indices, weights)[0]]
+
+
+EMPTY_RANGE = HandRange(0)
+FULL_RANGE = HandRange(FULL_MASK)
+
+
+def compile_chart(chart: Dict[str, str]) -> Dict[str, Optional[HandRange]]:
+    """
+    Compiles a preflop chart ({"raise": ..., "call": ..., "fold": ...}).
+    A fold entry written in prose ("Remaining hands") becomes whatever the
+    other entries leave out; any other entry that is not range notation
+    ("Randomized") compiles to None.
+    """
+    compiled = {}
+    for action, text in chart.items():
+        try:
+            compiled[action] = HandRange.parse(text)
+        except ValueError:
+            compiled[action] = None
+
+    if compiled.get("fold") is None and "fold" in chart:
+        others = [r for action, r in compiled.items() if action != "fold"]
+        if others and all(r is not None for r in others):
+            covered = EMPTY_RANGE
+            for r in others:
+                covered = covered.union(r)
+            compiled["fold"] = covered.complement()
+    return compiled
@@ -0,0 +1,71 @@
+import queue
+import threading
+from typing import Optional
+
+import numpy as np
+
+_FRESH_ROWS = np.arange(52, dtype=np.uint8)
+
+
+class ShuffleBuffer:
+    """
+    Deals pre-shuffled decks from (block_size, 52) uint8 blocks of card codes,
+    each block generated by one vectorized NumPy call. With background=True a
+    daemon thread keeps the next blocks ready while the current one is used.
+    Blocks come from a single seeded stream in order, so a given seed always
+    yields the same sequence of decks.
+    """
+    def __init__(self, block_size: int = 4096, seed: Optional[int] = None,
+                 background: bool = True, prefetch: int = 2):
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1")
+        self.block_size = block_size
+        self.rng = np.random.default_rng(seed)
+        self.decks_dealt = 0
+
+        self._queue = None
+        self._stop = threading.Event()
+        if background:
+            self._queue = queue.Queue(maxsize=max(prefetch, 1))
+            self._thread = threading.Thread(target=self._fill, name="shuffle-buffer", daemon=True)
+            self._thread.start()
+
+        self._block = b""
+        self._cursor = self.block_size
+
+    def _generate(self) -> bytes:
+        block = self.rng.permuted(np.tile(_FRESH_ROWS, (self.block_size, 1)), axis=1)
+        return block.tobytes()
+
+    def _fill(self):
+        while not self._stop.is_set():
+            block = self._generate()
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(block, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def _next_block(self) -> bytes:
+        if self._stop.is_set():
+            raise ValueError("ShuffleBuffer is closed")
+        if self._queue is None:
+            return self._generate()
+        return self._queue.get()
+
+    def next_order(self) -> bytes:
+        """The next shuffled deck as 52 card codes"""
+        if self._cursor >= self.block_size:
+            self._block = self._next_block()
+            self._cursor = 0
+        start = self._cursor * 52
+        self._cursor += 1
+        self.decks_dealt += 1
+        return self._block[start:start + 52]
+
+    def close(self):
+        """Stops the background thread; the buffer can't deal after this"""
+        self._stop.set()
+        if self._queue is not None:
+            self._thread.join()
@@ -0,0 +1,24 @@
+class HandSnapshot:
+    """
+    An immutable copy of a table's mutable hand state, taken with
+    TexasHoldem.snapshot() and put back with TexasHoldem.restore().
+    Seat numbers are packed into one bytes object and cards are the shared
+    Card singletons, so a snapshot is a few hundred bytes and can be
+    restored any number of times. Controllers are not part of it.
+    """
+    __slots__ = ("names", "seats", "all_in_mask", "pockets", "board", "deck_order", "deck_position",
+                 "stage", "button_position", "current_player_idx", "current_bet", "min_raise",
+                 "last_bettor_idx", "hand_seed", "hand_number", "actions")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("HandSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("HandSnapshot is immutable")
+
+    def __repr__(self):
+        return f"HandSnapshot(hand={self.hand_number}, stage={self.stage.value}, to_act={self.current_player_idx})"
@@ -0,0 +1,78 @@
+from typing import List
+
+# JSON Patch (RFC 6902) between two JSON-style states, so a client holding
+# one version of the game state can be sent only what changed since.
+
+
+def _pointer(path: str, key) -> str:
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def diff_state(old, new) -> List[dict]:
+    """
+    Patch operations turning `old` into `new`. Objects are compared key by
+    key and arrays element by element; an array that only grew (a card
+    dealt) gets "add" operations, any other change of length replaces it.
+    """
+    ops = []
+    _diff(old, new, "", ops)
+    return ops
+
+
+def _diff(old, new, path: str, ops: List[dict]):
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, _pointer(path, key), ops)
+            else:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+    elif (isinstance(old, (list, tuple)) and isinstance(new, (list, tuple))
+          and (len(old) == len(new) or (len(old) < len(new) and tuple(old) == tuple(new[:len(old)])))):
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff(old_item, new_item, _pointer(path, i), ops)
+        for item in new[len(old):]:
+            ops.append({"op": "add", "path": f"{path}/-", "value": item})
+    elif type(old) is not type(new) or old != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def _thaw(value):
+    # Plain, mutable copy: dicts with string keys (as JSON has them) and lists
+    if isinstance(value, dict):
+        return {str(key): _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def apply_patch(state, ops: List[dict]):
+    """Applies diff_state() output to a state and returns the result as plain JSON-style dicts and lists"""
+    state = _thaw(state)
+    for op in ops:
+        if op["path"] == "":
+            if op["op"] == "remove":
+                raise ValueError("Cannot remove the whole state")
+            state = _thaw(op["value"])
+            continue
+        *parents, last = [part.replace("~1", "/").replace("~0", "~") for part in op["path"][1:].split("/")]
+        target = state
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        value = _thaw(op.get("value"))
+        if isinstance(target, list):
+            if op["op"] == "add":
+                target.insert(len(target) if last == "-" else int(last), value)
+            elif op["op"] == "remove":
+                del target[int(last)]
+            else:
+                target[int(last)] = value
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = value
+    return state
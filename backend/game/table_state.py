@@ -0,0 +1,137 @@
+from array import array
+from typing import TYPE_CHECKING, List, Optional
+
+from .status import Status
+
+if TYPE_CHECKING:
+    from .player import Player
+
+# Status codes stored per seat, in Status declaration order
+ACTIVE, FOLDED, ALL_IN = 0, 1, 2
+STATUSES = list(Status)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+class TableState:
+    """
+    Seat-indexed state for one table: stacks, this street's and the whole
+    hand's contributions, and status codes in flat arrays, plus bitmasks
+    (bit i for seat i) for active, folded and all-in seats. Player objects
+    are views onto one seat of a TableState.
+    """
+    __slots__ = ("size", "full_mask", "names", "is_bot", "pockets", "hands",
+                 "stacks", "preflop", "street", "committed", "status",
+                 "active_mask", "folded_mask", "all_in_mask")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.full_mask = (1 << size) - 1
+        self.names = [""] * size
+        self.is_bot = [False] * size
+        self.pockets = [[] for _ in range(size)]
+        self.hands = [[] for _ in range(size)]
+        self.stacks = array("q", bytes(8 * size))
+        self.preflop = array("q", bytes(8 * size))
+        self.street = array("q", bytes(8 * size))      # chips put in on the current street
+        self.committed = array("q", bytes(8 * size))   # chips put in over the whole hand
+        self.status = bytearray(size)                  # ACTIVE / FOLDED / ALL_IN
+        self.active_mask = self.full_mask
+        self.folded_mask = 0
+        self.all_in_mask = 0  # seats that cannot bet any more (includes short blinds left ACTIVE)
+
+    @staticmethod
+    def seat_players(players: List["Player"]) -> "TableState":
+        """Builds a table from the players' current values and rebinds each one as a view onto its seat"""
+        table = TableState(len(players))
+        for seat, player in enumerate(players):
+            table.names[seat] = player.name
+            table.is_bot[seat] = player.is_bot
+            table.pockets[seat] = player.pocket
+            table.hands[seat] = player.hand
+            table.stacks[seat] = player.chips
+            table.preflop[seat] = player.preflop
+            table.set_status(seat, STATUS_CODES[player.is_active])
+            player.bind(table, seat)
+        return table
+
+    def pack(self) -> bytes:
+        """The per-hand numbers (stacks, contributions, statuses) as one bytes object; see unpack()"""
+        return (self.stacks.tobytes() + self.preflop.tobytes() + self.street.tobytes()
+                + self.committed.tobytes() + bytes(self.status))
+
+    def unpack(self, data: bytes, all_in_mask: int):
+        """Restores the arrays and masks from pack() output taken at a table of the same size"""
+        width = 8 * self.size
+        if len(data) != 4 * width + self.size:
+            raise ValueError("Packed state is for a different number of seats")
+        arrays = []
+        for offset in range(0, 4 * width, width):
+            values = array("q")
+            values.frombytes(data[offset:offset + width])
+            arrays.append(values)
+        self.stacks, self.preflop, self.street, self.committed = arrays
+        self.status[:] = data[4 * width:]
+        self.active_mask = self.folded_mask = 0
+        for seat, code in enumerate(self.status):
+            if code == ACTIVE:
+                self.active_mask |= 1 << seat
+            elif code == FOLDED:
+                self.folded_mask |= 1 << seat
+        self.all_in_mask = all_in_mask
+
+    def set_status(self, seat: int, code: int):
+        self.status[seat] = code
+        bit = 1 << seat
+        if code == ACTIVE:
+            self.active_mask |= bit
+        else:
+            self.active_mask &= ~bit
+        if code == FOLDED:
+            self.folded_mask |= bit
+        else:
+            self.folded_mask &= ~bit
+
+    def mark_all_in(self, seat: int):
+        self.all_in_mask |= 1 << seat
+
+    def commit(self, seat: int, amount: int):
+        """Moves chips from a seat's stack into the pot"""
+        self.stacks[seat] -= amount
+        self.street[seat] += amount
+        self.committed[seat] += amount
+
+    def new_hand(self):
+        for seat in range(self.size):
+            self.street[seat] = 0
+            self.committed[seat] = 0
+        self.all_in_mask = 0
+
+    def new_street(self):
+        for seat in range(self.size):
+            self.street[seat] = 0
+
+    @property
+    def live_mask(self) -> int:
+        """Seats still in the hand"""
+        return self.full_mask & ~self.folded_mask
+
+    @property
+    def can_act_mask(self) -> int:
+        """Seats that are active and not all-in"""
+        return self.active_mask & ~self.all_in_mask
+
+    def seats(self, mask: int) -> List[int]:
+        result = []
+        while mask:
+            low_bit = mask & -mask
+            result.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return result
+
+    def next_seat(self, mask: int, start: int) -> Optional[int]:
+        """First seat in mask at or clockwise after start, or None if the mask is empty"""
+        start %= self.size
+        rotated = ((mask >> start) | (mask << (self.size - start))) & self.full_mask
+        if not rotated:
+            return None
+        return (start + (rotated & -rotated).bit_length() - 1) % self.size
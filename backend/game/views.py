@@ -0,0 +1,20 @@
+class FrozenDict(dict):
+    """A dict that refuses changes, so a cached state view can be handed to any number of readers"""
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("State views are read-only")
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
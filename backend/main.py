@@ -5,13 +5,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from game import TexasHoldem
 from api import game
+from bots.llm_client import close_llm_client
 import logging
 
 # Run application with
 # uvicorn main:app --reload
 # runs on http://localhost:8000
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Bots and the coach share one pooled LLM client
+    await close_llm_client()
+
+app = FastAPI(lifespan=lifespan)
 
 # Configure CORS
 origins = [
@@ -0,0 +1,149 @@
+import argparse
+import copy
+import random
+import time
+from typing import Optional
+
+from game import TexasHoldem, ShuffleBuffer, Action, Card, HandEvaluator, LookupEvaluator
+from bots.local_bot import ChartBot
+from bots.optimized_bot import PREFLOP_CHARTS
+
+# Headless bot-vs-bot throughput check for the engine. Run with
+# python simulate.py --hands 20000 --players 6 --seed 1
+# or compare ways of branching a hand for search with --search-bench, and
+# the cost of scoring one 7-card hand with --eval-bench
+
+
+def run(hands: int, players: int = 6, seed: Optional[int] = None, buffered: bool = True) -> dict:
+    """
+    Plays `hands` headless hands between local chart bots, seating a fresh
+    table whenever one player has won all the chips. Returns the hand count,
+    elapsed seconds and hands per second.
+    """
+    if not 2 <= players <= 6:
+        raise ValueError("Players must be between 2 and 6")
+    rng = random.Random(seed)
+    personalities = list(PREFLOP_CHARTS)
+    deal_source = ShuffleBuffer(seed=rng.getrandbits(64)) if buffered else None
+
+    def new_table() -> TexasHoldem:
+        bots = [ChartBot(personalities[(i + rng.randrange(len(personalities))) % len(personalities)])
+                for i in range(players)]
+        return TexasHoldem([f"Bot{i + 1}" for i in range(players)], bots,
+                           seed=rng.getrandbits(64), deal_source=deal_source, headless=True)
+
+    table = new_table()
+    tables = 1
+    start = time.perf_counter()
+    for _ in range(hands):
+        if sum(player.chips >= 2 for player in table.players) < 2:
+            table = new_table()
+            tables += 1
+        table.play_hand()
+    elapsed = time.perf_counter() - start
+
+    if deal_source is not None:
+        deal_source.close()
+    return {
+        "hands": hands,
+        "tables": tables,
+        "seconds": elapsed,
+        "hands_per_second": hands / elapsed if elapsed else float("inf")
+    }
+
+
+def search_bench(nodes: int = 20000, players: int = 6, seed: Optional[int] = None) -> dict:
+    """
+    Times `nodes` look-ahead steps from a preflop decision three ways:
+    process_action + undo(), snapshot() + process_action + restore(), and
+    copy.deepcopy of the table before each process_action (on at most 1000
+    nodes, as it is far slower). Returns microseconds per node for each.
+    """
+    rng = random.Random(seed)
+    table = TexasHoldem([f"Bot{i + 1}" for i in range(players)], [None] * players,
+                        seed=rng.getrandbits(64), headless=True)
+    table.start_new_hand()
+    actions = [action for action in table.get_available_actions() if action != Action.FOLD]
+    steps = [(action, table.get_min_raise() if action == Action.RAISE else None)
+             for action in (rng.choice(actions) for _ in range(nodes))]
+
+    def timed(branch, count: int = nodes) -> float:
+        start = time.perf_counter()
+        for action, amount in steps[:count]:
+            branch(action, amount)
+        return (time.perf_counter() - start) / count * 1e6
+
+    def undo_branch(action, amount):
+        table.process_action(action, amount)
+        table.undo()
+
+    root = table.snapshot()
+
+    def snapshot_branch(action, amount):
+        table.process_action(action, amount)
+        table.restore(root)
+
+    def deepcopy_branch(action, amount):
+        copy.deepcopy(table).process_action(action, amount)
+
+    return {
+        "undo_us": timed(undo_branch),
+        "snapshot_us": timed(snapshot_branch),
+        "deepcopy_us": timed(deepcopy_branch, min(nodes, 1000))
+    }
+
+
+def eval_bench(hands: int = 20000, seed: Optional[int] = None) -> dict:
+    """
+    Times scoring `hands` random 7-card hands: LookupEvaluator.evaluate on
+    card codes, HandEvaluator.hand_strength on Card objects, and a hit in a
+    plain dict of strengths keyed by card mask, the cheapest any per-hand
+    cache could be, both with the mask at hand and built from the cards.
+    Returns microseconds per hand for each.
+    """
+    rng = random.Random(seed)
+    deck = [Card.from_code(code) for code in range(52)]
+    dealt = [rng.sample(deck, 7) for _ in range(hands)]
+    codes = [[card.code for card in cards] for cards in dealt]
+    masks = [sum(card.mask for card in cards) for cards in dealt]
+    strengths = {mask: LookupEvaluator.evaluate(hand) for mask, hand in zip(masks, codes)}
+
+    def timed(score, inputs) -> float:
+        start = time.perf_counter()
+        for item in inputs:
+            score(item)
+        return (time.perf_counter() - start) / hands * 1e6
+
+    return {
+        "evaluate_us": timed(LookupEvaluator.evaluate, codes),
+        "hand_strength_us": timed(lambda cards: HandEvaluator.hand_strength(cards[:2], cards[2:]), dealt),
+        "dict_hit_us": timed(strengths.__getitem__, masks),
+        "mask_and_dict_hit_us": timed(lambda cards: strengths[sum(card.mask for card in cards)], dealt)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless engine throughput")
+    parser.add_argument("--hands", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-buffer", action="store_true", help="shuffle each deck with random.shuffle")
+    parser.add_argument("--search-bench", action="store_true",
+                        help="time apply+undo against snapshot/restore and deepcopy instead")
+    parser.add_argument("--eval-bench", action="store_true",
+                        help="time scoring one 7-card hand (--hands of them) instead")
+    args = parser.parse_args()
+
+    if args.eval_bench:
+        result = eval_bench(args.hands, args.seed)
+        print(f"per hand: LookupEvaluator.evaluate {result['evaluate_us']:.2f}us, "
+              f"HandEvaluator.hand_strength {result['hand_strength_us']:.2f}us, "
+              f"dict hit {result['dict_hit_us']:.2f}us ({result['mask_and_dict_hit_us']:.2f}us building the mask)")
+    elif args.search_bench:
+        result = search_bench(args.hands, args.players, args.seed)
+        print(f"per node: apply+undo {result['undo_us']:.1f}us, snapshot/restore {result['snapshot_us']:.1f}us, "
+              f"deepcopy {result['deepcopy_us']:.1f}us")
+    else:
+        result = run(args.hands, args.players, args.seed, buffered=not args.no_buffer)
+        print(f"{result['hands']} hands on {result['tables']} tables in {result['seconds']:.2f}s "
+              f"({result['hands_per_second']:.0f} hands/sec)")
@@ -0,0 +1,29 @@
+import random
+
+from game import Action, GameStage, TexasHoldem
+
+
+def random_step(game: TexasHoldem, rng: random.Random) -> bool:
+    """
+    Plays one random legal step of the current hand: an action, or the next
+    street's deal and bet reset once betting is complete. Returns False
+    when the hand is over.
+    """
+    if len(game.get_non_folded_players()) <= 1:
+        return False
+    if game.is_betting_round_complete() and game.action_log:
+        if game.current_stage == GameStage.RIVER:
+            return False
+        {GameStage.PREFLOP: game.deal_flop, GameStage.FLOP: game.deal_turn,
+         GameStage.TURN: game.deal_river}[game.current_stage]()
+        game.reset_street_bets()
+        return True
+
+    action = rng.choice(game.get_available_actions())
+    amount = None
+    if action == Action.RAISE:
+        amount = max(game.get_min_raise(), rng.choice([10, 1000]))
+    elif action == Action.BET:
+        amount = rng.choice([2, 1000])
+    game.process_action(action, amount)
+    return True
@@ -0,0 +1,21 @@
+from game.card import Card
+from game.equity import EquityCalculator
+from game.suit import Suit
+
+HANDS = [[Card(14, Suit.HEARTS), Card(13, Suit.HEARTS)], [Card(12, Suit.SPADES), Card(12, Suit.DIAMONDS)]]
+
+
+def test_time_budget_alone_runs_past_default_iterations():
+    calculator = EquityCalculator(iterations=200, batch_size=100, seed=1)
+
+    result = calculator.calculate(HANDS, time_budget=0.2)
+
+    assert result["runouts"] > calculator.iterations
+
+
+def test_default_iterations_still_cap_when_no_budget_is_given():
+    calculator = EquityCalculator(iterations=200, batch_size=100, seed=1)
+
+    result = calculator.calculate(HANDS)
+
+    assert result["runouts"] == 200
@@ -0,0 +1,84 @@
+import random
+
+from game.card import Card
+from game.evaluator import HandEvaluator, HandRank
+from game.lookup_evaluator import LookupEvaluator
+from game.suit import Suit
+
+VALUES = {"T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
+SUITS = {"h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS, "s": Suit.SPADES}
+
+
+def cards(text: str):
+    return [Card(VALUES.get(token[0]) or int(token[0]), SUITS[token[1]]) for token in text.split()]
+
+
+def deck(suits=4):
+    return [Card(value, suit) for value in range(2, 15) for suit in list(Suit)[:suits]]
+
+
+def lookup(pocket, board):
+    return HandEvaluator.decode_strength(LookupEvaluator.evaluate([card.code for card in pocket + board]))
+
+
+def reference(pocket, board):
+    return HandEvaluator._evaluate_hand_combinations(pocket, board)
+
+
+def random_hands(rng, count, suits=4):
+    """Random 7-card hands; fewer suits makes flushes and straight flushes common"""
+    cards_left = deck(suits)
+    for _ in range(count):
+        hand = rng.sample(cards_left, 7)
+        yield hand[:2], hand[2:]
+
+
+def test_lookup_matches_reference_on_random_hands():
+    rng = random.Random(1)
+    for pocket, board in list(random_hands(rng, 3000)) + list(random_hands(rng, 1000, suits=2)):
+        assert lookup(pocket, board) == reference(pocket, board), (pocket, board)
+
+
+def test_lookup_orders_hands_like_reference_on_shared_boards():
+    rng = random.Random(2)
+    full_deck = deck()
+    for _ in range(1000):
+        dealt = rng.sample(full_deck, 9)
+        board, first, second = dealt[:5], dealt[5:7], dealt[7:]
+        first_strength = HandEvaluator.hand_strength(first, board)
+        second_strength = HandEvaluator.hand_strength(second, board)
+        first_rank, second_rank = reference(first, board), reference(second, board)
+        if first_rank == second_rank:
+            assert first_strength == second_strength
+        else:
+            better = HandEvaluator._is_better_hand(*first_rank, *second_rank)
+            assert (first_strength > second_strength) == better
+
+
+def test_flushes():
+    assert lookup(cards("Ah 2h"), cards("9h 7h 4h Kd Qc"))[0] == HandRank.FLUSH
+    # Six hearts: the best five count
+    assert lookup(cards("Ah 2h"), cards("9h 7h 4h 3h Qc")) == (HandRank.FLUSH, [], [14, 9, 7, 4, 3])
+    assert lookup(cards("Kh Qh"), cards("Jh Th 9h 8h 2c")) == reference(cards("Kh Qh"), cards("Jh Th 9h 8h 2c"))
+    assert lookup(cards("Ah Kh"), cards("Qh Jh Th 2c 3d"))[0] == HandRank.ROYAL_FLUSH
+
+
+def test_wheel_straight_is_five_high():
+    wheel = lookup(cards("Ah 2d"), cards("3c 4s 5h Kd 9c"))
+    assert wheel == (HandRank.STRAIGHT, [5], [])
+    assert wheel == reference(cards("Ah 2d"), cards("3c 4s 5h Kd 9c"))
+    # A six-high straight beats the wheel
+    assert (HandEvaluator.hand_strength(cards("6d 9s"), cards("2c 3c 4s 5h Ah"))
+            > HandEvaluator.hand_strength(cards("Kd 9c"), cards("2c 3c 4s 5h Ah")))
+    assert lookup(cards("Ah 2h"), cards("3h 4h 5h Kd 9c")) == (HandRank.STRAIGHT_FLUSH, [5], [])
+
+
+def test_board_plays_split():
+    board = cards("Ah Kd Qs Jc Th")
+    assert HandEvaluator.hand_strength(cards("2c 3d"), board) == HandEvaluator.hand_strength(cards("4s 5s"), board)
+    # Both play the board's two pair with the same kicker
+    board = cards("Kh Kd 9s 9c Ah")
+    assert HandEvaluator.hand_strength(cards("2c 3d"), board) == HandEvaluator.hand_strength(cards("Qs Jd"), board)
+    # A better kicker than the board's breaks the tie
+    board = cards("Kh Kd 9s 9c 5h")
+    assert HandEvaluator.hand_strength(cards("Ac 3d"), board) > HandEvaluator.hand_strength(cards("Qs Jd"), board)
@@ -0,0 +1,39 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import game as game_api
+
+app = FastAPI()
+app.include_router(game_api.router)
+client = TestClient(app)
+
+
+def read_events(text: str):
+    events = []
+    for message in text.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_stream_state_is_the_spectator_view():
+    created = client.post("/games/create", json={"player_names": ["Hero", "Villain"], "bot_ids": [None, None],
+                                                 "seed": 1}).json()
+    game_id = created["game_id"]
+    started = client.post("/games/start-hand", json={"game_id": game_id}).json()
+    # The player's own responses do show the hero's cards
+    assert all(started["game_state"]["players"][0]["pocket_cards"])
+
+    # A closed channel ends the stream once the buffered events are sent
+    game_api.event_channels[game_id].close()
+    with client.stream("GET", f"/games/events/{game_id}") as response:
+        events = read_events(response.read().decode())
+    client.delete(f"/games/delete/{game_id}")
+
+    # A new subscriber starts from the current state, without any hole cards
+    assert [kind for _, kind, _ in events] == ["state"]
+    state = events[0][2]["game_state"]
+    assert [player["pocket_cards"] for player in state["players"]] == [["", ""], ["", ""]]
@@ -0,0 +1,68 @@
+import random
+
+from game import Action, TexasHoldem
+from helpers import random_step
+
+
+def pots(game: TexasHoldem):
+    return [(pot.amount, pot.eligible_players) for pot in game.pots]
+
+
+def layered_pots(game: TexasHoldem):
+    """Side pots worked out directly: one layer per distinct all-in commitment, then the rest"""
+    table = game.table
+    committed = list(table.committed)
+    all_in = table.live_mask & table.all_in_mask
+    levels = sorted({committed[i] for i in table.seats(all_in)})
+    if not levels or levels[-1] < max(committed):
+        levels.append(max(committed))
+    layers, previous = [], 0
+    for level in levels:
+        amount = sum(max(0, min(chips, level) - previous) for chips in committed)
+        eligible = {i for i in table.seats(table.live_mask) if committed[i] >= level or not all_in >> i & 1}
+        if amount or not layers:
+            layers.append((amount, eligible))
+        previous = level
+    return layers
+
+
+def test_all_ins_for_different_amounts_layer_side_pots():
+    game = TexasHoldem(["A", "B", "C"], [None] * 3, seed=1, headless=True)
+    for player, chips in zip(game.players, (50, 100, 200)):
+        player.chips = chips
+    game.start_new_hand()
+    game.process_action(Action.RAISE, 1000)  # B all-in for 100
+    game.process_action(Action.CALL)         # C calls 100
+    game.process_action(Action.CALL)         # A all-in for 50
+
+    assert pots(game) == [(150, {0, 1, 2}), (100, {1, 2})]
+
+
+def test_folded_chips_stay_in_the_pot_without_eligibility():
+    game = TexasHoldem(["A", "B", "C"], [None] * 3, seed=1, headless=True)
+    for player, chips in zip(game.players, (50, 100, 200)):
+        player.chips = chips
+    game.start_new_hand()
+    game.process_action(Action.RAISE, 20)   # B
+    game.process_action(Action.RAISE, 1000)  # C all-in for 200
+    game.process_action(Action.FOLD)         # A folds their big blind
+    game.process_action(Action.CALL)         # B all-in for 100
+
+    assert pots(game) == [(202, {1, 2}), (100, {2})]
+
+
+def test_random_hands_match_direct_layering_and_conserve_chips():
+    rng = random.Random(7)
+    game = TexasHoldem(["A", "B", "C", "D", "E"], [None] * 5, seed=3, headless=True)
+    for _ in range(300):
+        for player in game.players:
+            player.chips = rng.choice([3, 5, 20, 50, 200])
+        chips_before = sum(player.chips for player in game.players)
+        game.start_new_hand()
+        while True:
+            assert pots(game) == layered_pots(game)
+            assert game.get_total_pot() == sum(game.table.committed)
+            if not random_step(game, rng):
+                break
+        game.resolve_showdown()
+        assert sum(player.chips for player in game.players) == chips_before
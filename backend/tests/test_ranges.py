@@ -0,0 +1,48 @@
+import pytest
+
+from game.ranges import HandRange, card_code
+
+
+def test_parse_counts_combos():
+    assert len(HandRange.parse("AA")) == 6
+    assert len(HandRange.parse("AKs")) == 4
+    assert len(HandRange.parse("AKo")) == 12
+    assert len(HandRange.parse("AK")) == 16
+    assert len(HandRange.parse("TT+")) == 5 * 6
+    assert len(HandRange.parse("A9s+")) == 5 * 4
+    assert len(HandRange.parse("AA-22, AKs-A2s")) == 13 * 6 + 12 * 4
+    assert len(HandRange.parse("None")) == 0
+
+
+def test_parse_weights_and_equivalent_spellings():
+    assert HandRange.parse("QQ+") == HandRange.parse("AA,KK,QQ") == HandRange.parse("QQ-AA")
+    weighted = HandRange.parse("AKs:0.5, QQ")
+    assert len(weighted) == 4 + 6
+    assert sorted(set(weighted.weights)) == [0.0, 0.5, 1.0]
+
+
+@pytest.mark.parametrize("text", ["AKx", "A", "AAs", "ZZ", "AKs-22"])
+def test_parse_rejects_bad_notation(text):
+    with pytest.raises(ValueError):
+        HandRange.parse(text)
+
+
+def test_contains_checks_suits():
+    suited = HandRange.parse("AKs")
+    assert suited.contains("Ah", "Kh")
+    assert ("Ks", "As") in suited
+    assert not suited.contains("Ah", "Kd")
+    assert HandRange.parse("AKo").contains(card_code("Ah"), card_code("Kd"))
+    assert HandRange.parse("77").contains("7c", "7d")
+    assert not HandRange.parse("77").contains("7c", "8c")
+
+
+def test_remove_blockers_drops_combos_using_dead_cards():
+    aces = HandRange.parse("AA")
+    blocked = aces.remove_blockers(["Ah"])
+    assert len(blocked) == 3
+    assert not blocked.contains("Ah", "As")
+    assert blocked.contains("Ad", "As")
+    assert len(aces.remove_blockers(["Ah", "Ad", "Ac"])) == 0
+    # Nothing blocked hands back the same range
+    assert aces.remove_blockers(["2c", "7d"]) is aces
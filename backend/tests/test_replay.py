@@ -0,0 +1,47 @@
+import random
+
+from game import TexasHoldem
+from helpers import random_step
+
+NAMES = ["A", "B", "C", "D", "E"]
+
+
+def hand_state(game: TexasHoldem):
+    return ([[str(card) for card in player.pocket] for player in game.players],
+            [str(card) for card in game.community_cards],
+            [(player.chips, player.is_active) for player in game.players],
+            sum(pot.amount for pot in game.pots), list(game.action_log), game.current_stage,
+            game.button_position)
+
+
+def test_replay_rebuilds_the_recorded_hand():
+    rng = random.Random(7)
+    game = TexasHoldem(NAMES, [None] * len(NAMES), seed=11)
+    for _ in range(50):
+        for player in game.players:
+            player.chips = rng.choice([20, 200, 1000])
+        game.start_new_hand()
+        # The record ends with the last action; streets dealt after it are not part of it
+        after_last_action = hand_state(game)
+        actions = 0
+        while random_step(game, rng):
+            if len(game.action_log) != actions:
+                actions = len(game.action_log)
+                after_last_action = hand_state(game)
+        record = game.get_hand_record()
+
+        # A different table seed: only the hand seed and the log should matter
+        replayed = TexasHoldem(NAMES, [None] * len(NAMES), seed=12)
+        replayed.replay_hand(record)
+        assert hand_state(replayed) == after_last_action
+        assert replayed.get_hand_record() == dict(record, table_seed=12)
+
+
+def test_same_table_seed_deals_the_same_hands():
+    first = TexasHoldem(NAMES, [None] * len(NAMES), seed=3)
+    second = TexasHoldem(NAMES, [None] * len(NAMES), seed=3)
+    for _ in range(5):
+        first.start_new_hand()
+        second.start_new_hand()
+        assert first.hand_seed == second.hand_seed
+        assert hand_state(first) == hand_state(second)
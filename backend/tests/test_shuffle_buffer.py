@@ -0,0 +1,46 @@
+from game import TexasHoldem
+from game.shuffle_buffer import ShuffleBuffer
+
+
+def deal(buffer: ShuffleBuffer, count: int):
+    return [buffer.next_order() for _ in range(count)]
+
+
+def test_decks_are_valid_and_do_not_repeat():
+    buffer = ShuffleBuffer(block_size=64, seed=1)
+    try:
+        # Crosses several block boundaries
+        decks = deal(buffer, 300)
+    finally:
+        buffer.close()
+    assert all(sorted(deck) == list(range(52)) for deck in decks)
+    assert len(set(decks)) == len(decks)
+    assert buffer.decks_dealt == 300
+
+
+def test_seed_fixes_the_sequence_of_decks():
+    first = ShuffleBuffer(block_size=32, seed=7)
+    second = ShuffleBuffer(block_size=32, seed=7)
+    # Generating on the caller's thread gives the same stream as the prefetch thread
+    inline = ShuffleBuffer(block_size=32, seed=7, background=False)
+    other = ShuffleBuffer(block_size=32, seed=8, background=False)
+    try:
+        decks = deal(first, 100)
+        assert deal(second, 100) == decks
+        assert deal(inline, 100) == decks
+        assert deal(other, 100) != decks
+    finally:
+        first.close()
+        second.close()
+
+
+def test_buffered_hands_replay_from_their_record():
+    buffer = ShuffleBuffer(block_size=8, seed=3, background=False)
+    game = TexasHoldem(["A", "B", "C"], [None] * 3, seed=1, deal_source=buffer)
+    game.start_new_hand()
+    record = game.get_hand_record()
+
+    replayed = TexasHoldem(["A", "B", "C"], [None] * 3, seed=2)
+    replayed.replay_hand(record)
+    assert [[str(card) for card in player.pocket] for player in replayed.players] == \
+        [[str(card) for card in player.pocket] for player in game.players]
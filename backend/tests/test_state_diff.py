@@ -0,0 +1,57 @@
+import random
+
+from game import TexasHoldem
+from game.state_diff import apply_patch, diff_state
+from helpers import random_step
+
+
+def round_trip(old, new):
+    ops = diff_state(old, new)
+    assert apply_patch(old, ops) == apply_patch(new, [])
+    return ops
+
+
+def test_patch_round_trips_handmade_states():
+    old = {"pot": 10, "board": ["A♠"], "players": [{"chips": 100}, {"chips": 50}], "a/b~c": 1, "gone": True}
+    new = {"pot": 30, "board": ["A♠", "K♥", "2♦"], "players": [{"chips": 80}], "a/b~c": 2, "added": None}
+    ops = round_trip(old, new)
+    # A grown array gets appends, a shrunk one is replaced
+    assert {"op": "add", "path": "/board/-", "value": "K♥"} in ops
+    assert {"op": "replace", "path": "/players", "value": [{"chips": 80}]} in ops
+    assert {"op": "replace", "path": "/a~1b~0c", "value": 2} in ops
+    assert diff_state(new, new) == []
+    round_trip(new, old)
+    round_trip(1, {"whole": "state"})
+
+
+def test_patches_follow_a_table_through_random_hands():
+    rng = random.Random(4)
+    game = TexasHoldem(["A", "B", "C", "D"], [None] * 4, seed=9, headless=True)
+    first = game.get_state_patch()
+    client_version, client_state = first["state_version"], apply_patch(first["game_state"], [])
+    for _ in range(30):
+        # Pots are never paid out here, so restack everyone for the next hand
+        for player in game.players:
+            player.chips = rng.choice([20, 200])
+        game.start_new_hand()
+        while True:
+            update = game.get_state_patch(client_version)
+            assert update["base_version"] == client_version
+            client_state = apply_patch(client_state, update["game_state_patch"])
+            client_version = update["state_version"]
+            assert client_state == apply_patch(game.get_state_view("player"), [])
+            if not random_step(game, rng):
+                break
+
+
+def test_unknown_version_falls_back_to_the_full_state():
+    game = TexasHoldem(["A", "B", "C"], [None] * 3, seed=1, headless=True)
+    game.start_new_hand()
+    current = game.get_state_patch()
+    assert "game_state" in current
+
+    for known in (None, current["state_version"] + 100, -1):
+        update = game.get_state_patch(known)
+        assert "game_state_patch" not in update
+        assert update["state_version"] == current["state_version"]
+        assert update["game_state"] == current["game_state"]
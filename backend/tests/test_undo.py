@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from game import TexasHoldem
+from helpers import random_step
+
+
+def table_state(game: TexasHoldem):
+    return (game.get_bot_state_json(), game.table.pack(), game.table.all_in_mask,
+            [str(card) for card in game.community_cards],
+            [game.get_hand_strength(i) for i in range(len(game.players))],
+            game.deck.position, list(game.action_log), game.min_raise, game.current_stage,
+            [(pot.amount, sorted(pot.eligible_players)) for pot in game.pots])
+
+
+def test_undo_and_redo_walk_back_and_forth_exactly():
+    rng = random.Random(3)
+    game = TexasHoldem(["A", "B", "C", "D"], [None] * 4, seed=5, headless=True)
+    for _ in range(100):
+        # Short stacks bring in all-ins and side pots
+        for player in game.players:
+            player.chips = rng.choice([5, 50, 200])
+        game.start_new_hand()
+        # Keyed by undo depth; dealing a street pushes two steps (the deal and the bet reset)
+        states = {0: table_state(game)}
+        while random_step(game, rng):
+            states[len(game.undo_stack)] = table_state(game)
+        depth = len(game.undo_stack)
+
+        for k in range(depth - 1, -1, -1):
+            game.undo()
+            if k in states:
+                assert table_state(game) == states[k]
+        for k in range(1, depth + 1):
+            game.redo()
+            if k in states:
+                assert table_state(game) == states[k]
+
+def test_new_step_clears_redo():
+    rng = random.Random(4)
+    game = TexasHoldem(["A", "B", "C"], [None] * 3, seed=1, headless=True)
+    game.start_new_hand()
+    random_step(game, rng)
+    game.undo()
+    assert game.redo_stack
+    random_step(game, rng)
+    assert not game.redo_stack
+    with pytest.raises(ValueError):
+        game.redo()
+
+
+def test_nothing_to_undo_at_hand_start():
+    game = TexasHoldem(["A", "B", "C"], [None] * 3, seed=1, headless=True)
+    game.start_new_hand()
+    with pytest.raises(ValueError):
+        game.undo()
+
+
+def test_undo_past_showdown_takes_the_payout_back():
+    rng = random.Random(6)
+    game = TexasHoldem(["A", "B", "C", "D"], [None] * 4, seed=8, headless=True)
+    for _ in range(50):
+        for player in game.players:
+            player.chips = rng.choice([5, 50, 200])
+        total = sum(player.chips for player in game.players)
+        game.start_new_hand()
+        while random_step(game, rng):
+            pass
+        before = table_state(game)
+        result = game.resolve_showdown()
+        after = table_state(game)
+        assert sum(player.chips for player in game.players) == total
+
+        game.undo()
+        assert table_state(game) == before
+        # Chips are back in the pots, not in the winners' stacks as well
+        assert sum(player.chips for player in game.players) + sum(pot.amount for pot in game.pots) == total
+        while game.undo_stack:
+            game.undo()
+            assert sum(player.chips for player in game.players) + sum(pot.amount for pot in game.pots) == total
+
+        while game.redo_stack:
+            game.redo()
+        assert table_state(game) == after
+        assert sum(result["payouts"].values()) == sum(pot["amount"] for pot in result["pots"])